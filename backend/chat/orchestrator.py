@@ -1,27 +1,52 @@
 from fastapi import WebSocket, WebSocketDisconnect
 import json
 import asyncio
+import contextlib
 import logging
 import traceback
 from typing import Optional, Dict, Set
 import os
 import datetime
+import hashlib
 
 from config import OPENAI_API_KEY
 import config.runtime_config as runtime_config
 from rag.retriever import log_debug, retrieve_documents
 from memory.client import MemoryClient
-from stats.collector import log_strategy_change
+from stats.collector import log_strategy_change, BufferedJsonlWriter, get_queue_logger, json_dumps, json_dumps_bytes
 from stats.tools_dashboard import TOOL_STRATEGIES
 from chat.realtime_client import OpenAIWebSocketClient
-from voice_commands.commands import handle_summary_request
-
+from voice_commands.commands import detect_summary_request, run_summary_request
 
 logging.basicConfig(level=logging.DEBUG)
-print("🖐️  LOADED /app/routes/realtime_chat.py")
+
+# Hot-path logging goes through a queue; the stdout write happens on the
+# listener thread instead of blocking the event loop on every message (the
+# message itself is still formatted here, in QueueHandler.prepare).
+# Per-message detail is logged at DEBUG, enabled with REALTIME_LOG_LEVEL=DEBUG.
+logger = get_queue_logger(__name__, os.getenv("REALTIME_LOG_LEVEL", "INFO"))
+logger.debug("🖐️  LOADED /app/routes/realtime_chat.py")
 
 memory_client = MemoryClient()
 
+# Max OpenAI events relayed to the browser per wake-up of forward_from_openai
+OPENAI_FORWARD_BATCH = 64
+# Seconds forward_from_openai waits for a wake-up before re-checking the queue
+OPENAI_IDLE_WAKEUP = 1.0
+
+# Seconds to coalesce dashboard strategy broadcasts; only the latest value is sent
+STRATEGY_BROADCAST_DEBOUNCE = 0.05
+
+def _dumps_text(message: dict) -> str:
+    """Serialize a websocket message once so it can be shared across sessions."""
+    return json_dumps(message)
+
+def _strategy_error_payload(strategy) -> str:
+    return _dumps_text({"type": "error", "error": f"Failed to update strategy to {strategy}"})
+
+# Strategy-update failures for known strategies are fixed strings; serialize them once
+_STRATEGY_UPDATE_ERRORS = {strategy: _strategy_error_payload(strategy) for strategy in TOOL_STRATEGIES}
+
 # Disable low-level websocket-client trace logs to avoid audio data spam
 # websocket.enableTrace(False)
 
@@ -35,6 +60,11 @@ class SessionManager:
         self.voice_sessions: Dict[str, WebSocket] = {}  # user_uuid -> websocket
         self.dashboard_sessions: Set[WebSocket] = set()  # dashboard connections
         self.session_strategies: Dict[str, str] = {}  # user_uuid -> current strategy
+
+        # Debounced dashboard strategy broadcast (latest request wins)
+        self._pending_strategy: Optional[str] = None
+        self._pending_source: Optional[WebSocket] = None
+        self._debounce_task: Optional[asyncio.Task] = None
         
     async def add_voice_session(self, user_uuid: str, websocket: WebSocket, initial_strategy: str = "auto"):
         """Add a voice session to the manager"""
@@ -49,7 +79,7 @@ class SessionManager:
             "total_sessions": len(self.voice_sessions)
         })
         
-        print(f"✅ Voice session added: {user_uuid} (strategy: {initial_strategy})")
+        logger.info("✅ Voice session added: %s (strategy: %s)", user_uuid, initial_strategy)
         
     async def remove_voice_session(self, user_uuid: str):
         """Remove a voice session from the manager"""
@@ -65,7 +95,7 @@ class SessionManager:
             "total_sessions": len(self.voice_sessions)
         })
         
-        print(f"🔌 Voice session removed: {user_uuid}")
+        logger.info("🔌 Voice session removed: %s", user_uuid)
         
     async def add_dashboard_session(self, websocket: WebSocket):
         """Add a dashboard session to the manager"""
@@ -81,39 +111,70 @@ class SessionManager:
             "total_sessions": len(self.voice_sessions)
         })
         
-        print(f"📊 Dashboard session added (total: {len(self.dashboard_sessions)})")
+        logger.info("📊 Dashboard session added (total: %d)", len(self.dashboard_sessions))
         
     async def remove_dashboard_session(self, websocket: WebSocket):
         """Remove a dashboard session from the manager"""
         self.dashboard_sessions.discard(websocket)
-        print(f"📊 Dashboard session removed (total: {len(self.dashboard_sessions)})")
+        logger.info("📊 Dashboard session removed (total: %d)", len(self.dashboard_sessions))
         
+    def request_strategy_broadcast(self, new_strategy: str, source_dashboard: Optional[WebSocket] = None):
+        """Queue a strategy broadcast; bursts within the debounce window collapse into one"""
+        self._pending_strategy = new_strategy
+        self._pending_source = source_dashboard
+        if self._debounce_task is None or self._debounce_task.done():
+            self._debounce_task = asyncio.create_task(self._flush_after(STRATEGY_BROADCAST_DEBOUNCE))
+
+    async def _flush_after(self, delay: float):
+        """Broadcast the most recently requested strategy after the debounce delay"""
+        # Requests arriving mid-broadcast see this task still running and only set
+        # _pending_strategy, so keep flushing until nothing is left pending
+        while self._pending_strategy is not None:
+            await asyncio.sleep(delay)
+            new_strategy, source_dashboard = self._pending_strategy, self._pending_source
+            self._pending_strategy = self._pending_source = None
+            try:
+                updates_sent = await self.broadcast_strategy_update(new_strategy, source_dashboard)
+                # Confirm to the dashboard that issued the winning request
+                if source_dashboard in self.dashboard_sessions:
+                    await source_dashboard.send_json({
+                        "type": "broadcast_confirmed",
+                        "strategy": new_strategy,
+                        "sessions_updated": updates_sent
+                    })
+            except Exception as e:
+                logger.error("❌ Debounced strategy broadcast failed: %s", e)
+
     async def broadcast_strategy_update(self, new_strategy: str, source_dashboard: Optional[WebSocket] = None):
         """Broadcast strategy update to ALL active voice sessions"""
-        updates_sent = 0
-        failed_sessions = []
-        
-        # Update all voice sessions
-        for user_uuid, voice_websocket in self.voice_sessions.items():
-            try:
-                # Update our tracking
-                old_strategy = self.session_strategies.get(user_uuid, "auto")
-                self.session_strategies[user_uuid] = new_strategy
-                
-                # Send strategy update to voice session
-                await voice_websocket.send_json({
+        # Sessions almost always share the same previous strategy, so serialize
+        # the payload once per distinct previous strategy rather than per session
+        payloads: Dict[str, str] = {}
+        targets = []
+        for user_uuid, voice_websocket in list(self.voice_sessions.items()):
+            old_strategy = self.session_strategies.get(user_uuid, "auto")
+            self.session_strategies[user_uuid] = new_strategy
+            if old_strategy not in payloads:
+                payloads[old_strategy] = _dumps_text({
                     "type": "strategy_update_broadcast",
                     "strategy": new_strategy,
                     "previous_strategy": old_strategy,
                     "source": "dashboard_broadcast"
                 })
-                
-                updates_sent += 1
-                print(f"🎛️ Strategy broadcast sent to {user_uuid}: {old_strategy} → {new_strategy}")
-                
-            except Exception as e:
-                print(f"❌ Failed to send strategy update to {user_uuid}: {e}")
+            targets.append((user_uuid, voice_websocket, payloads[old_strategy]))
+
+        # Fan out concurrently instead of awaiting each session in turn
+        results = await asyncio.gather(
+            *(voice_websocket.send_text(payload) for _, voice_websocket, payload in targets),
+            return_exceptions=True,
+        )
+
+        failed_sessions = []
+        for (user_uuid, _, _), result in zip(targets, results):
+            if isinstance(result, Exception):
+                logger.warning("❌ Failed to send strategy update to %s: %s", user_uuid, result)
                 failed_sessions.append(user_uuid)
+        updates_sent = len(targets) - len(failed_sessions)
         
         # Clean up failed sessions
         for user_uuid in failed_sessions:
@@ -127,21 +188,22 @@ class SessionManager:
             "total_sessions": len(self.voice_sessions)
         }, exclude=source_dashboard)
         
-        print(f"✅ Strategy broadcast completed: {updates_sent} sessions updated to '{new_strategy}'")
+        logger.info("✅ Strategy broadcast completed: %d sessions updated to '%s'", updates_sent, new_strategy)
         return updates_sent
         
     async def broadcast_to_dashboards(self, message: dict, exclude: Optional[WebSocket] = None):
         """Send message to all connected dashboards"""
         failed_dashboards = []
+        payload = _dumps_text(message)
         
         for dashboard_ws in self.dashboard_sessions:
             if dashboard_ws == exclude:
                 continue
                 
             try:
-                await dashboard_ws.send_json(message)
+                await dashboard_ws.send_text(payload)
             except Exception as e:
-                print(f"❌ Failed to send to dashboard: {e}")
+                logger.warning("❌ Failed to send to dashboard: %s", e)
                 failed_dashboards.append(dashboard_ws)
         
         # Clean up failed dashboards
@@ -159,20 +221,57 @@ class SessionManager:
 # Global session manager instance
 session_manager = SessionManager()
 
+# Constant JSON envelope around injected RAG context; only the escaped text varies
+_RAG_ENVELOPE_PREFIX = (
+    b'{"type":"conversation.item.create","item":{"type":"message","role":"system",'
+    b'"content":[{"type":"input_text","text":"Relevant Information from Mobeus knowledge base:\\n'
+)
+_RAG_ENVELOPE_SUFFIX = b'"}]}}'
+# Escaped form of the "\n\n---\n\n" separator placed between documents
+_RAG_DOC_SEPARATOR = b"\\n\\n---\\n\\n"
+# Upper bound on escaped document bytes injected per user turn (first doc is always kept)
+RAG_INJECTION_MAX_BYTES = 16 * 1024
+# Only this many leading characters of a user message are hashed and embedded for RAG
+RAG_QUERY_MAX_CHARS = 2048
+
+def _json_string_body(text: str) -> bytes:
+    """Return text as an escaped JSON string literal without the surrounding quotes."""
+    return json_dumps_bytes(text)[1:-1]
+
+def build_rag_injection(docs) -> bytes:
+    """Serialize the system conversation item that injects retrieved docs for OpenAI."""
+    buf = bytearray(_RAG_ENVELOPE_PREFIX)
+    used = 0
+    for i, doc in enumerate(docs):
+        body = _json_string_body(doc.get("text", ""))
+        if i:
+            if used + len(_RAG_DOC_SEPARATOR) + len(body) > RAG_INJECTION_MAX_BYTES:
+                break
+            buf += _RAG_DOC_SEPARATOR
+            used += len(_RAG_DOC_SEPARATOR)
+        buf += body
+        used += len(body)
+    buf += _RAG_ENVELOPE_SUFFIX
+    return bytes(buf)
+
+def rag_dedup_key(text: str) -> int:
+    """64-bit BLAKE2b key used to skip re-injecting RAG context for a repeated message."""
+    return int.from_bytes(hashlib.blake2b(text.encode(), digest_size=8).digest(), "little")
+
 async def execute_tool(name: str, args: dict, user_uuid: Optional[str]):
     """Handle tool execution server-side."""
     if name == "search_knowledge_base":
         query = args.get("query", "")
-        print(f"🔍 Tool called: search_knowledge_base with query: '{query}'")
+        logger.debug("🔍 Tool called: search_knowledge_base with query: '%s'", query)
         
         import time
         start_time = time.time()
         docs = await retrieve_documents(query)
         end_time = time.time()
         
-        print(f"🔍 Retrieved {len(docs)} documents")
-        if docs:
-            print(f"🔍 First doc preview: {docs[0].get('text', '')[:100]}...")
+        logger.debug("🔍 Retrieved %d documents", len(docs))
+        if docs and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔍 First doc preview: %s...", docs[0].get('text', '')[:100])
         
         timing_data = {
             "total": end_time - start_time,
@@ -204,13 +303,61 @@ async def execute_tool(name: str, args: dict, user_uuid: Optional[str]):
         
     return {"error": f"Unknown tool {name}"}
 
+async def inject_rag_context(openai_client: OpenAIWebSocketClient, user_text: str):
+    """Retrieve knowledge base docs for a user message and inject them as a system item."""
+    # Strategy "none" disables RAG entirely: skip dedup hashing and retrieval
+    strategy = openai_client.current_strategy
+    if strategy == "none":
+        return
+
+    # Bound hashing and embedding cost for very long pastes; the full text is
+    # still forwarded to OpenAI unchanged by the caller
+    query = user_text[:RAG_QUERY_MAX_CHARS]
+
+    message_id = rag_dedup_key(query)
+    if message_id == openai_client.last_rag_injection_id:
+        logger.debug("⚠️ Skipping duplicate RAG injection")
+        return
+
+    try:
+        # Retrieve configured number of top documents
+        top_k = runtime_config.get("RAG_RESULT_COUNT")
+        docs = await retrieve_documents(query, top_k)
+        logger.debug("🔍 Retrieved %d docs for user query (strategy: %s)", len(docs), strategy)
+
+        if docs:
+            sys_msg = build_rag_injection(docs)
+            logger.debug("📤 Injecting RAG info: %d docs, %d bytes", len(docs), len(sys_msg))
+            # Only remember the message once its context actually went out, so a
+            # failed or interrupted injection is retried on resend
+            if openai_client.send_message(sys_msg):
+                openai_client.last_rag_injection_id = message_id
+    except Exception as e:
+        logger.error("❌ Error retrieving documents: %s", e)
+
+# Strong references to in-flight background summaries so they are not garbage-collected
+_pending_summaries: Set[asyncio.Task] = set()
+
+async def _run_session_summary(user_uuid: str, reason: str):
+    try:
+        await asyncio.to_thread(memory_client.force_session_summary, user_uuid, reason)
+    except Exception as e:
+        logger.error("❌ Background session summary failed for %s: %s", user_uuid, e)
+
+def schedule_session_summary(user_uuid: str, reason: str) -> asyncio.Task:
+    """Run force_session_summary in a worker thread without blocking connection teardown."""
+    task = asyncio.create_task(_run_session_summary(user_uuid, reason))
+    _pending_summaries.add(task)
+    task.add_done_callback(_pending_summaries.discard)
+    return task
+
 async def realtime_chat(websocket: WebSocket):
     await websocket.accept()
-    print("🖐️  ACCEPTED websocket")
+    logger.debug("🖐️  ACCEPTED websocket")
 
     user_uuid = websocket.query_params.get("user_uuid", "")
     initial_strategy = websocket.query_params.get("tool_strategy", "auto")
-    print(f"🎯 WebSocket client connected - UUID: {user_uuid!r}, Strategy: {initial_strategy}")
+    logger.info("🎯 WebSocket client connected - UUID: %r, Strategy: %s", user_uuid, initial_strategy)
     await session_manager.add_voice_session(user_uuid, websocket, initial_strategy)
 
     openai_client = None
@@ -236,16 +383,34 @@ async def realtime_chat(websocket: WebSocket):
                 "strategy": initial_strategy
             }
         })
-        print("✅ Session ready, Mobeus is online!")
+        logger.info("✅ Session ready, Mobeus is online!")
 
         # Simplified forwarding to prevent double RAG injection
         async def forward_from_openai():
-            """Simply relay events from OpenAI to client without RAG injection"""
+            """Relay events from OpenAI to client, draining every ready event per wake-up"""
+            message_event = openai_client.enable_async_notify()
             while openai_client.connected:
+                message_event.clear()
                 msg = openai_client.get_message()
-                if msg:
+                if not msg:
+                    # Idle: sleep until the socket thread signals a new event; the
+                    # timeout is only a coarse safety net, not a poll
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(message_event.wait(), OPENAI_IDLE_WAKEUP)
+                    continue
+
+                # Burst (e.g. audio deltas): forward up to a batch of queued events
+                # back-to-back instead of one event per 10ms tick
+                for _ in range(OPENAI_FORWARD_BATCH):
                     await websocket.send_text(msg)
-                await asyncio.sleep(0.01)
+                    msg = openai_client.get_message()
+                    if not msg:
+                        break
+                else:
+                    if msg:
+                        await websocket.send_text(msg)
+                # Yield so the client->OpenAI loop is never starved
+                await asyncio.sleep(0)
 
         async def forward_from_client():
             """Handle incoming client messages including strategy updates and RAG injection"""
@@ -253,45 +418,53 @@ async def realtime_chat(websocket: WebSocket):
                 try:
                     data = await websocket.receive_text()
                 except WebSocketDisconnect:
-                    print("🔌 Client disconnected from forward_from_client")
+                    logger.info("🔌 Client disconnected from forward_from_client")
                     break
                 except Exception as e:
-                    print(f"❌ Error receiving from client: {e}")
+                    logger.error("❌ Error receiving from client: %s", e)
                     break
                 
-                # Only inject RAG context on specific client-sent messages
+                # Parse each inbound frame once; dispatch and forwarding both reuse it
                 try:
                     msg = json.loads(data)
                     msg_type = msg.get("type")
+                except Exception:
+                    msg, msg_type = None, None
 
-                    # Handle strategy updates (from dashboard broadcast OR direct client)
-                    if msg_type in ["strategy_update", "strategy_update_broadcast"]:
+                # Handle strategy updates (from dashboard broadcast OR direct client)
+                if msg_type in ("strategy_update", "strategy_update_broadcast"):
+                    try:
                         new_strategy = msg.get("strategy", "auto")
-                        print(f"🎛️ Received strategy update: {new_strategy}")
+                        logger.debug("🎛️ Received strategy update: %s", new_strategy)
 
                         if openai_client.update_strategy(new_strategy):
                             # Update session manager tracking
                             session_manager.session_strategies[user_uuid] = new_strategy
 
                             # Confirm strategy update to client
-                            await websocket.send_json({
+                            await websocket.send_text(_dumps_text({
                                 "type": "session.updated",
                                 "strategy": new_strategy,
                                 "previous_strategy": openai_client.strategy_history[-1]["old_strategy"] if openai_client.strategy_history else "unknown",
                                 "timestamp": datetime.datetime.now().isoformat(),
                                 "source": msg.get("source", "direct")                                
-                            })
-                            print(f"✅ Strategy update confirmed: {new_strategy}")
+                            }))
+                            logger.info("✅ Strategy update confirmed: %s", new_strategy)
                         else:
-                            # Send error response
-                            await websocket.send_json({
-                                "type": "error",
-                                "error": f"Failed to update strategy to {new_strategy}"
-                            })
-                        continue
-
-                    # Handle RAG injection for user messages
-                    elif msg_type == "conversation.item.create":
+                            # Send error response (precomputed for known strategies)
+                            error_payload = (
+                                _STRATEGY_UPDATE_ERRORS.get(new_strategy)
+                                if isinstance(new_strategy, str) else None
+                            )
+                            await websocket.send_text(error_payload or _strategy_error_payload(new_strategy))
+                    except Exception as e:
+                        logger.error("❌ Error processing client message: %s", e)
+                    # Strategy updates are never forwarded to OpenAI
+                    continue
+
+                # Handle RAG injection for user messages
+                if msg_type == "conversation.item.create":
+                    try:
                         item = msg.get("item", {})
                         if item.get("type") == "message" and item.get("role") == "user":
                             # Extract user text content
@@ -302,80 +475,52 @@ async def realtime_chat(websocket: WebSocket):
                                     break
                             
                             if user_text:
-                                print(f"🖐️ User text message: {user_text[:100]}")
+                                if logger.isEnabledFor(logging.DEBUG):
+                                    logger.debug("🖐️ User text message: %s", user_text[:100])
                             
-                                # Handle voice command for mid-session summary
-                                if handle_summary_request(
-                                    user_text,
-                                    memory_client,
-                                    user_uuid,
-                                    send_json=lambda msg: openai_client.send_message(json.dumps(msg)),
-                                    modalities=runtime_config.get("REALTIME_MODALITIES", ["text", "audio"]),
-                                ):
+                                # Handle voice command for mid-session summary. Detection is a
+                                # cheap substring scan on the loop; only the summary itself is
+                                # blocking DB/LLM work, so just that runs in a worker thread
+                                if detect_summary_request(user_text):
+                                    await asyncio.to_thread(
+                                        run_summary_request,
+                                        memory_client,
+                                        user_uuid,
+                                        send_json=lambda msg: openai_client.send_message(json.dumps(msg)),
+                                        modalities=runtime_config.get("REALTIME_MODALITIES", ["text", "audio"]),
+                                    )
                                     continue
 
-                                # Only inject RAG if strategy allows it
-                                if openai_client.current_strategy != "none":
-                                    import hashlib
-                                    message_id = hashlib.md5(f"{user_text}{len(user_text)}".encode()).hexdigest()
-
-                                    if message_id != openai_client.last_rag_injection_id:
-                                        openai_client.last_rag_injection_id = message_id
-
-                                        try:
-                                            # Retrieve configured number of top documents
-                                            top_k = runtime_config.get("RAG_RESULT_COUNT")
-                                            docs = await retrieve_documents(user_text, top_k)
-                                            print(f"🔍 Retrieved {len(docs)} docs for user query (strategy: {openai_client.current_strategy})")
-
-                                            if docs:
-                                                docs_text = "\n\n---\n\n".join(d.get("text", "") for d in docs)
-                                                sys_event = {
-                                                    "type": "conversation.item.create",
-                                                    "item": {
-                                                        "type": "message",
-                                                        "role": "system",
-                                                        "content": [
-                                                            {
-                                                                "type": "input_text",
-                                                                "text": f"Relevant Information from Mobeus knowledge base:\n{docs_text}"
-                                                            }
-                                                        ]
-                                                    }
-                                                }
-                                                sys_msg = json.dumps(sys_event)
-                                                print(f"📤 Injecting RAG info: {sys_msg[:200]}...")
-                                                openai_client.send_message(sys_msg)
-                                        except Exception as e:
-                                            print(f"❌ Error retrieving documents: {e}")
-                                    else:
-                                        print("⚠️ Skipping duplicate RAG injection")
-                                else:
-                                    print(f"⏭️ Skipping RAG injection (strategy: {openai_client.current_strategy})")
+                                # Inject before forwarding the user item: the client sends
+                                # response.create right after it, so the context must already
+                                # be in the conversation. The vector search itself runs in a
+                                # worker thread, so the event loop stays free meanwhile
+                                await inject_rag_context(openai_client, user_text)
 
-                except Exception as e:
-                    print(f"❌ Error processing client message: {e}")
-                        
-                # Forward original client message to OpenAI (unless it's a strategy update)
-                try:
-                    parsed_msg = json.loads(data)
-                    if parsed_msg.get("type") not in ["strategy_update", "strategy_update_broadcast"]:
-                        # Normalize legacy 'text' content type to 'input_text' for compatibility
-                        if parsed_msg.get("type") == "conversation.item.create":
-                            item = parsed_msg.get("item", {})
-                            if item.get("type") == "message":
-                                for part in item.get("content", []):
-                                    if part.get("type") == "text":
-                                        part["type"] = "input_text"
-                        updated_data = json.dumps(parsed_msg)
-                        if not openai_client.send_message(updated_data):
-                            print("❌ Failed to send to OpenAI")
-                            return
-                except:
-                    # If not valid JSON or normalization fails, forward as-is
-                    if not openai_client.send_message(data):
-                        print("❌ Failed to send to OpenAI")
-                        return
+                    except Exception as e:
+                        logger.error("❌ Error processing client message: %s", e)
+
+                # Forward the client message to OpenAI as received; only re-serialize
+                # when legacy 'text' content parts had to be normalized to 'input_text'
+                outgoing = data
+                if msg_type == "conversation.item.create":
+                    try:
+                        item = msg.get("item", {})
+                        if item.get("type") == "message":
+                            normalized = False
+                            for part in item.get("content", []):
+                                if part.get("type") == "text":
+                                    part["type"] = "input_text"
+                                    normalized = True
+                            if normalized:
+                                outgoing = json.dumps(msg)
+                    except Exception:
+                        # If normalization fails, forward as-is
+                        outgoing = data
+
+                if not openai_client.send_message(outgoing):
+                    logger.error("❌ Failed to send to OpenAI")
+                    return
                     
         # Run both forwarding loops
         await asyncio.gather(
@@ -386,48 +531,59 @@ async def realtime_chat(websocket: WebSocket):
     finally:
         # Remove from session manager
         await session_manager.remove_voice_session(user_uuid)
-        print(f"🧹 CLEANUP STARTED: user_uuid={user_uuid}")
+        logger.info("🧹 CLEANUP STARTED: user_uuid=%s", user_uuid)
+
+        # Close OpenAI client first so the upstream socket is released promptly
+        if openai_client:
+            try:
+                openai_client.close()
+                logger.info("🔌 OpenAI client closed successfully")
+            except Exception as e:
+                logger.warning("⚠️ Error closing OpenAI client: %s", e)
 
-        # FORCE auto-summarization on disconnect
+        # FORCE auto-summarization on disconnect (in the background, off the event loop)
         if user_uuid and user_uuid.strip():
-            memory_client.force_session_summary(user_uuid, "auto_disconnect")
+            schedule_session_summary(user_uuid, "auto_disconnect")
         else:
-            print("⚠️ CLEANUP: No valid user_uuid for summarization")
+            logger.warning("⚠️ CLEANUP: No valid user_uuid for summarization")
     
-    # Close OpenAI client
-    if openai_client:
-        try:
-            openai_client.close()
-            print("🔌 OpenAI client closed successfully")
-        except Exception as e:
-            print(f"⚠️ Error closing OpenAI client: {e}")
-    
-    print("🧹 CLEANUP COMPLETED")
+    logger.info("🧹 CLEANUP COMPLETED")
+
+# Updated pricing (per 1K tokens) - closer to actual OpenAI rates
+MODEL_PRICING = {
+    "gpt-4o-realtime-preview-2024-12-17": {"input": 0.005, "output": 0.020},  # Realtime pricing
+    "gpt-4o": {"input": 0.005, "output": 0.015},
+    "gpt-4": {"input": 0.030, "output": 0.060},
+    "default": {"input": 0.005, "output": 0.015}
+}
+
+# Per-token (input, output) rates precomputed once from MODEL_PRICING
+_TOKEN_RATES = {
+    model: (price["input"] / 1000, price["output"] / 1000)
+    for model, price in MODEL_PRICING.items()
+}
 
 def calculate_cost(input_tokens: int, output_tokens: int, model: str) -> float:
     """Estimate the cost of a request based on token usage and model."""
-    # Updated pricing (per 1K tokens) - closer to actual OpenAI rates
-    pricing = {
-        "gpt-4o-realtime-preview-2024-12-17": {"input": 0.005, "output": 0.020},  # Realtime pricing
-        "gpt-4o": {"input": 0.005, "output": 0.015},
-        "gpt-4": {"input": 0.030, "output": 0.060},
-        "default": {"input": 0.005, "output": 0.015}
-    }
-    price = pricing.get(model, pricing["default"])
-    return (input_tokens / 1000) * price["input"] + (output_tokens / 1000) * price["output"]
+    input_rate, output_rate = _TOKEN_RATES.get(model, _TOKEN_RATES["default"])
+    return input_tokens * input_rate + output_tokens * output_rate
+
+# Token usage is batched in memory and appended by a background task
+# (started in the app lifespan) to a file rotated daily by name
+token_usage_writer = BufferedJsonlWriter(
+    lambda: f"token_usage-{datetime.date.today().isoformat()}.jsonl"
+)
 
 def log_token_usage(user_uuid: str, input_tokens: int, output_tokens: int, model: str):
     """Log token usage for cost tracking"""
-    with open("token_usage.jsonl", "a") as f:
-        entry = {
-            "timestamp": datetime.datetime.now().isoformat(),
-            "user_uuid": user_uuid,
-            "input_tokens": input_tokens,
-            "output_tokens": output_tokens,
-            "model": model,
-            "estimated_cost": calculate_cost(input_tokens, output_tokens, model)
-        }
-        f.write(json.dumps(entry) + "\n")
+    token_usage_writer.put({
+        "timestamp": datetime.datetime.now().isoformat(),
+        "user_uuid": user_uuid,
+        "input_tokens": input_tokens,
+        "output_tokens": output_tokens,
+        "model": model,
+        "estimated_cost": calculate_cost(input_tokens, output_tokens, model)
+    })
 
 
 # Add dashboard WebSocket endpoint for real-time strategy control
@@ -439,7 +595,7 @@ async def dashboard_websocket(websocket: WebSocket):
         # Add to session manager
         await session_manager.add_dashboard_session(websocket)
         
-        print("📊 Dashboard WebSocket connected")
+        logger.info("📊 Dashboard WebSocket connected")
         
         # Handle messages from dashboard
         while True:
@@ -452,21 +608,15 @@ async def dashboard_websocket(websocket: WebSocket):
                 if message_type == "broadcast_strategy_update":
                     # Dashboard wants to update strategy for all sessions
                     new_strategy = message.get("strategy", "auto")
-                    print(f"📡 Dashboard requesting strategy broadcast: {new_strategy}")
+                    logger.debug("📡 Dashboard requesting strategy broadcast: %s", new_strategy)
                     
-                    # Broadcast to all voice sessions
-                    updates_sent = await session_manager.broadcast_strategy_update(
+                    # Coalesce bursts (e.g. slider drags) into one broadcast to all
+                    # voice sessions; the requester is confirmed once it is sent
+                    session_manager.request_strategy_broadcast(
                         new_strategy, 
                         source_dashboard=websocket
                     )
                     
-                    # Confirm to requesting dashboard
-                    await websocket.send_json({
-                        "type": "broadcast_confirmed",
-                        "strategy": new_strategy,
-                        "sessions_updated": updates_sent
-                    })
-                    
                 elif message_type == "get_session_status":
                     # Dashboard requesting current status
                     status = session_manager.get_session_status()
@@ -476,15 +626,15 @@ async def dashboard_websocket(websocket: WebSocket):
                     })
                     
                 else:
-                    print(f"🤷 Unknown dashboard message type: {message_type}")
+                    logger.warning("🤷 Unknown dashboard message type: %s", message_type)
                     
             except json.JSONDecodeError:
-                print(f"❌ Invalid JSON from dashboard: {data}")
+                logger.warning("❌ Invalid JSON from dashboard: %s", data)
             except Exception as e:
-                print(f"❌ Error processing dashboard message: {e}")
+                logger.error("❌ Error processing dashboard message: %s", e)
                 
     except Exception as e:
-        print(f"❌ Dashboard WebSocket error: {e}")
+        logger.error("❌ Dashboard WebSocket error: %s", e)
     finally:
         await session_manager.remove_dashboard_session(websocket)
-        print("🔌 Dashboard WebSocket disconnected")
\ No newline at end of file
+        logger.info("🔌 Dashboard WebSocket disconnected")
\ No newline at end of file
@@ -1,11 +1,13 @@
 import json
 import os
+import asyncio
 import datetime
 import time
 import threading
 import queue
+import socket
 
-from typing import Optional
+from typing import Optional, Union
 
 import websocket
 
@@ -13,10 +15,20 @@ import config.runtime_config as runtime_config
 from config import OPENAI_API_KEY
 from rag.retriever import log_debug, retrieve_documents
 from memory.client import MemoryClient
-from stats.collector import log_strategy_change
+from stats.collector import log_strategy_change, json_dumps, json_loads
 from stats.tools_dashboard import TOOL_STRATEGIES
 from voice_commands.commands import detect_summary_request
 
+# Event types on_message acts on. Everything else (audio and text deltas make
+# up the bulk of the stream) is forwarded without being decoded here.
+INSPECTED_EVENT_TYPES = (
+    "conversation.item.input_audio_transcription.completed",
+    "conversation.item.created",
+    "response.audio_transcript.done",
+    "response.function_call_arguments.done",
+)
+_INSPECTED_EVENT_MARKERS = tuple(f'"{event_type}"' for event_type in INSPECTED_EVENT_TYPES)
+
 
 class OpenAIWebSocketClient:
     """WebSocket client with tool strategy control"""
@@ -38,7 +50,30 @@ class OpenAIWebSocketClient:
         self.memory = MemoryClient()
 
         # Track RAG injection to prevent duplicates
-        self.last_rag_injection_id: Optional[str] = None
+        self.last_rag_injection_id: Optional[int] = None
+
+        # Set from the websocket thread when messages arrive (see enable_async_notify)
+        self._notify_loop: Optional[asyncio.AbstractEventLoop] = None
+        self.message_event: Optional[asyncio.Event] = None
+
+    def enable_async_notify(self) -> asyncio.Event:
+        """
+        Return an asyncio.Event, bound to the running loop, that is set whenever a
+        message is queued or the socket closes, so consumers can await it instead
+        of polling get_message().
+        """
+        self._notify_loop = asyncio.get_running_loop()
+        self.message_event = asyncio.Event()
+        return self.message_event
+
+    def _notify(self):
+        loop, event = self._notify_loop, self.message_event
+        if loop is not None and not event.is_set():
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Event loop already closed
+                pass
 
     def update_strategy(self, new_strategy: str) -> bool:
         """Update the tool calling strategy dynamically."""
@@ -67,7 +102,7 @@ class OpenAIWebSocketClient:
         }
 
         if self.ws and self.connected:
-            self.ws.send(json.dumps(session_update))
+            self.ws.send(json_dumps(session_update))
             print(f"🎛️ Strategy updated: {old_strategy} → {new_strategy} (tool_choice: {tool_choice})")
             return True
         else:
@@ -154,7 +189,12 @@ TOOL USAGE STRATEGY: Balanced
             on_close=self.on_close,
         )
 
-        self.ws_thread = threading.Thread(target=self.ws.run_forever, daemon=True)
+        # Small realtime JSON frames must not wait on Nagle coalescing
+        self.ws_thread = threading.Thread(
+            target=self.ws.run_forever,
+            kwargs={"sockopt": ((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),)},
+            daemon=True,
+        )
         self.ws_thread.start()
 
         for _ in range(50):
@@ -289,7 +329,7 @@ TOOL USAGE STRATEGY: Balanced
             }
         }
 
-        ws.send(json.dumps(session_config))
+        ws.send(json_dumps(session_config))
         print(f"📤 Session config sent: model={realtime_model}, strategy={self.current_strategy}, tool_choice={tool_choice}")
 
         try:
@@ -311,8 +351,16 @@ TOOL USAGE STRATEGY: Balanced
             print(f"⚠️ Failed to store prompt data: {e}")
 
     def on_message(self, ws, message):
+        # Cheap substring check so per-token delta frames skip json.loads
+        if isinstance(message, str) and not any(
+            marker in message for marker in _INSPECTED_EVENT_MARKERS
+        ):
+            self.incoming_queue.put(message)
+            self._notify()
+            return
+
         try:
-            data = json.loads(message)
+            data = json_loads(message)
             msg_type = data.get('type', 'unknown')
 
             if self.user_uuid:
@@ -344,9 +392,9 @@ TOOL USAGE STRATEGY: Balanced
                                 }
 
                                 if ws and self.connected:
-                                    ws.send(json.dumps(system_response))
+                                    ws.send(json_dumps(system_response))
                                     create_response = {"type": "response.create", "response": {"modalities": ["text", "audio"]}}
-                                    ws.send(json.dumps(create_response))
+                                    ws.send(json_dumps(create_response))
                                     print(f"✅ Voice command confirmation sent via OpenAI for {self.user_uuid}")
 
                                 return
@@ -364,9 +412,9 @@ TOOL USAGE STRATEGY: Balanced
                                 }
 
                                 if ws and self.connected:
-                                    ws.send(json.dumps(error_response))
+                                    ws.send(json_dumps(error_response))
                                     create_response = {"type": "response.create", "response": {"modalities": ["text", "audio"]}}
-                                    ws.send(json.dumps(create_response))
+                                    ws.send(json_dumps(create_response))
 
                                 return
 
@@ -441,14 +489,16 @@ TOOL USAGE STRATEGY: Balanced
         except Exception:
             # Swallow any queue errors
             pass
+        self._notify()
 
     def on_error(self, ws, error):
         pass
 
     def on_close(self, ws, code, msg):
         self.connected = False
+        self._notify()
 
-    def send_message(self, message: str) -> bool:
+    def send_message(self, message: Union[str, bytes]) -> bool:
         if self.ws and self.connected:
             self.ws.send(message)
             return True
@@ -474,7 +524,7 @@ TOOL USAGE STRATEGY: Balanced
             # parse JSON-encoded argument string if needed
             if isinstance(arguments, str):
                 try:
-                    arguments = json.loads(arguments)
+                    arguments = json_loads(arguments)
                 except json.JSONDecodeError:
                     arguments = {}
             response = None
@@ -493,17 +543,17 @@ TOOL USAGE STRATEGY: Balanced
                         "item": {
                             "type": "function_call_output",
                             "call_id": call_id,
-                            "output": json.dumps(docs)
+                            "output": json_dumps(docs)
                         }
                     }
                     if self.ws and self.connected:
-                        self.ws.send(json.dumps(response_event))
+                        self.ws.send(json_dumps(response_event))
                         # Resume generation after function call
                         create_resp = {
                             "type": "response.create",
                             "response": {"modalities": runtime_config.get("REALTIME_MODALITIES", ["text", "audio"])}
                         }
-                        self.ws.send(json.dumps(create_resp))
+                        self.ws.send(json_dumps(create_resp))
                     return
             elif function_name == "update_user_memory":
                 # Handle user memory update function call
@@ -516,16 +566,16 @@ TOOL USAGE STRATEGY: Balanced
                         "item": {
                             "type": "function_call_output",
                             "call_id": call_id,
-                            "output": json.dumps("User memory updated.")
+                            "output": json_dumps("User memory updated.")
                         }
                     }
                     if self.ws and self.connected:
-                        self.ws.send(json.dumps(response_event))
+                        self.ws.send(json_dumps(response_event))
                         create_resp = {
                             "type": "response.create",
                             "response": {"modalities": runtime_config.get("REALTIME_MODALITIES", ["text", "audio"])}
                         }
-                        self.ws.send(json.dumps(create_resp))
+                        self.ws.send(json_dumps(create_resp))
                     return
             else:
                 # Handle unknown function calls gracefully
@@ -535,19 +585,19 @@ TOOL USAGE STRATEGY: Balanced
                     "item": {
                         "type": "function_call_output",
                         "call_id": call_id,
-                        "output": json.dumps(f"Unknown function: {function_name}")
+                        "output": json_dumps(f"Unknown function: {function_name}")
                     }
                 }
                 if self.ws and self.connected:
-                    self.ws.send(json.dumps(response_event))
+                    self.ws.send(json_dumps(response_event))
                     create_resp = {
                         "type": "response.create",
                         "response": {"modalities": runtime_config.get("REALTIME_MODALITIES", ["text", "audio"])}
                     }
-                    self.ws.send(json.dumps(create_resp))
+                    self.ws.send(json_dumps(create_resp))
                 return
 
             if response and self.ws and self.connected:
-                self.ws.send(json.dumps(response))
+                self.ws.send(json_dumps(response))
         except Exception as e:
             print(f"❌ Error in handle_function_call: {e}")
@@ -4,6 +4,7 @@ Simple runtime configuration management for Mobeus Assistant
 """
 import os
 import json
+import stat
 from typing import Any, Dict
 from pathlib import Path
 
@@ -62,11 +63,18 @@ DEFAULT_CONFIG = {
     Keep your responses natural and conversational. Avoid being overly repetitive or verbose.""",
 }
 
+# Numeric keys keep their default's type on write; resolved once here so
+# set_config needs a single dict lookup instead of inspecting defaults
+_COERCE = {
+    key: type(value) for key, value in DEFAULT_CONFIG.items()
+    if type(value) in (int, float)
+}
+
 def _load_from_env():
     """Load configuration from environment variables"""
-    # Start with defaults
-    global _config_store
-    _config_store = DEFAULT_CONFIG.copy()
+    # Start with defaults (mutate in place so the store object never changes identity)
+    _config_store.clear()
+    _config_store.update(DEFAULT_CONFIG)
     
     # Override with environment variables if they exist
     for key, default_value in DEFAULT_CONFIG.items():
@@ -111,14 +119,26 @@ def _load_from_env():
 
 def get(key: str, default: Any = None) -> Any:
     """Get a configuration value"""
-    if not _config_store:
-        _load_from_env()
+    # The store is populated at import and only ever mutated in place, so the
+    # hot read path is a single dict lookup
     return _config_store.get(key, default)
 
 def set_config(key: str, value: Any) -> None:
-    """Set a configuration value"""
+    """
+    Set a configuration value. Numeric keys are coerced to their default's type;
+    raises ValueError when the value cannot be converted without losing data
+    (unparsable input, or a non-integral float for an int key).
+    """
     if not _config_store:
         _load_from_env()
+    coerce = _COERCE.get(key)
+    if coerce is not None and type(value) is not coerce:
+        if coerce is int and isinstance(value, float) and not value.is_integer():
+            raise ValueError(f"{key} must be an integer, got {value!r}")
+        try:
+            value = coerce(value)
+        except (TypeError, ValueError):
+            raise ValueError(f"{key} must be a {coerce.__name__}, got {value!r}") from None
     _config_store[key] = value
 
 def all_config() -> Dict[str, Any]:
@@ -166,10 +186,27 @@ def to_env_file(filepath: str = ".env") -> None:
             escaped_value = _escape_env_value(value)
             updated_lines.append(f"{key}={escaped_value}")
     
-    # Write updated .env file
-    with open(env_path, 'w') as f:
-        for line in updated_lines:
-            f.write(line + '\n')
+    # Write to a temp file and swap it in, so a crash mid-write never leaves a
+    # truncated .env behind. The swap targets the symlink's destination and the
+    # temp file gets the original's permissions (0600 for a new file), so a
+    # locked-down .env holding API keys is never loosened to the umask default
+    target = env_path.resolve()
+    tmp_path = target.with_name(target.name + ".tmp")
+    try:
+        mode = stat.S_IMODE(target.stat().st_mode)
+    except FileNotFoundError:
+        mode = 0o600
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with open(fd, 'w') as f:
+            f.write(''.join(line + '\n' for line in updated_lines))
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, target)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
     
     print(f"✅ Configuration saved to {filepath}")
     
@@ -190,9 +227,8 @@ def _escape_env_value(value: Any) -> str:
 
 def reset_to_defaults() -> None:
     """Reset all configuration to default values"""
-    global _config_store
-    _config_store = DEFAULT_CONFIG.copy()
+    _config_store.clear()
+    _config_store.update(DEFAULT_CONFIG)
 
 # Force initialization on import
-_config_store = {}
 _load_from_env()
\ No newline at end of file
@@ -1,9 +1,12 @@
 # Cleaned main.py - Legacy POCs removed
 import os
+import asyncio
+import contextlib
 from fastapi import FastAPI, UploadFile, File, HTTPException
 from fastapi.responses import StreamingResponse, FileResponse, HTMLResponse
 from contextlib import asynccontextmanager
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 import datetime
 from openai import OpenAI
 from config import OPENAI_API_KEY
@@ -26,12 +29,8 @@ from memory.session_memory import log_interaction
 import logging
 from config import runtime_config
 
-# Enable dashboards
-from stats.debug_dashboard import router as debug_dashboard_router
-from stats.config_dashboard import router as config_dashboard_router
-from stats.main_dashboard import router as main_dashboard_router
-from stats.session_dashboard import router as session_dashboard_router
-from stats.tools_dashboard import router as tools_dashboard_router
+# Enable dashboards (mounted lazily, see below)
+from scripts.dashboard_integration import setup_admin_dashboard
 
 
 logging.basicConfig(level=logging.INFO)
@@ -46,10 +45,24 @@ async def lifespan(app: FastAPI):
         print("✅ FastAPI startup: Database tables initialized")
     else:
         print("⚠️ FastAPI startup: Database initialization failed...")
+
+    # Background writers for batched JSONL logs
+    from chat.orchestrator import token_usage_writer
+    from rag.retriever import debug_log_writer
+    from stats.collector import strategy_log_writer
+    log_writer_tasks = [
+        asyncio.create_task(writer.run())
+        for writer in (token_usage_writer, debug_log_writer, strategy_log_writer)
+    ]
     
     yield  # Application runs here
     
     # Shutdown code here (if needed)
+    for task in log_writer_tasks:
+        task.cancel()
+    for task in log_writer_tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
     print("🛑 Shutting down application")
 
 app = FastAPI(lifespan=lifespan)
@@ -63,6 +76,32 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+class DashboardGZipMiddleware:
+    """
+    Gzip for the dashboard and stats routes only: their HTML and JSON repeat heavily,
+    while the streamed audio endpoints gain nothing and should not be buffered.
+    """
+    PREFIXES = ("/admin", "/stats")
+    # Routes that gzip their own cached bodies; older Starlette releases would
+    # compress an already gzip-encoded response a second time
+    PRECOMPRESSED = frozenset({"/admin/"})
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if (
+            scope["type"] == "http"
+            and scope["path"].startswith(self.PREFIXES)
+            and scope["path"] not in self.PRECOMPRESSED
+        ):
+            await self.gzip(scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+app.add_middleware(DashboardGZipMiddleware, minimum_size=1024)
+
 # Include service routers
 app.include_router(chat_router, prefix="/chat")
 app.include_router(memory_router, prefix="/memory")
@@ -76,12 +115,10 @@ app.include_router(stats_router, prefix="/stats")
 app.include_router(openai_realtime_tokens.router)
 app.include_router(user_identity_routes.router)
 
-# Enable dashboards with /admin prefix
-app.include_router(main_dashboard_router, prefix="/admin")      # /admin/ (main dashboard)
-app.include_router(debug_dashboard_router, prefix="/admin")     # /admin/debug
-app.include_router(config_dashboard_router, prefix="/admin")    # /admin/config
-app.include_router(session_dashboard_router, prefix="/admin")   # /admin/sessions
-app.include_router(tools_dashboard_router, prefix="/admin")      # /admin/tools
+# Enable dashboards with /admin prefix: /admin/ (main), /admin/debug, /admin/config,
+# /admin/sessions, /admin/tools, /admin/rag and POST /admin/batch. The dashboard
+# modules are imported on the first /admin request instead of at startup
+setup_admin_dashboard(app, prefix="/admin")
 
 
 # Initialize OpenAI client
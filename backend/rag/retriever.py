@@ -1,4 +1,5 @@
 import os
+import asyncio
 import time
 import json
 import datetime
@@ -11,6 +12,7 @@ from config import OPENAI_API_KEY, CHROMA_DB_DIR, EMBED_MODEL, DEBUG_LOG_PATH
 from config import runtime_config
 from memory.session_memory import get_all_session_memory, get_memory_stats
 from memory.persistent_memory import get_summary
+from stats.collector import BufferedJsonlWriter
 
 # Print debug information about the environment
 print(f"🔍 RAG Module Debug: Log path is {DEBUG_LOG_PATH}")
@@ -43,10 +45,14 @@ try:
 except Exception as e:
     print(f"❌ Failed to write test log entry: {e}")
 
+# Debug entries are batched and appended by a background task started in the app lifespan
+debug_log_writer = BufferedJsonlWriter(DEBUG_LOG_PATH)
+
 def log_debug(query, chunks, answer, timings):
     """
-    Write debug logs to the configured debug log file.
-    Ensures the file exists and properly appends without creating duplicates.
+    Queue a debug log entry for the configured debug log file.
+    Entries are appended in batches by debug_log_writer, so callers on the
+    event loop never block on file I/O.
     
     Args:
         query: The query being answered
@@ -54,32 +60,22 @@ def log_debug(query, chunks, answer, timings):
         answer: The generated answer
         timings: Dictionary of timing information
     """
-    try:
-        print(f"📝 Attempting to log query: '{query[:30]}...' to {DEBUG_LOG_PATH}")
-        # Check if the directory exists and create it if needed
-        log_dir = os.path.dirname(DEBUG_LOG_PATH)
-        if log_dir and not os.path.exists(log_dir):
-            print(f"📁 Creating log directory: {log_dir}")
-            os.makedirs(log_dir, exist_ok=True)
-            
-        # Create the entry to log
-        entry = json.dumps({
-            "timestamp": datetime.datetime.now().isoformat(),
-            "query": query,
-            "top_chunks": chunks,
-            "answer": answer,
-            "timings": timings
-        })
-        
-        # Write to the log file, ensuring we append
-        with open(DEBUG_LOG_PATH, "a") as f:
-            f.write(entry + "\n")
-        print(f"✅ Successfully logged query to {DEBUG_LOG_PATH}")   
-    except Exception as e:
-        print(f"⚠️ Warning: Failed to write to debug log: {e}")
+    debug_log_writer.put({
+        "timestamp": datetime.datetime.now().isoformat(),
+        "query": query,
+        "top_chunks": chunks,
+        "answer": answer,
+        "timings": timings
+    })
 
 from typing import Optional
 
+# Appended to the system prompt when retrieval finds nothing for the query
+NO_DOCUMENTS_INSTRUCTION = (
+    "No matching documents were found in the Mobeus knowledge base for this query. "
+    "Answer from general knowledge and say that you have no internal documentation on it."
+)
+
 def query_rag(query: str, uuid: str) -> dict:
     """
     Enhanced RAG query that uses runtime config and new memory system
@@ -120,7 +116,8 @@ def query_rag(query: str, uuid: str) -> dict:
         context_parts.append("Recent Conversation:\n" + "\n".join(conversation_context))
     
     # 3. Add RAG results
-    if results and results['documents'] and results['documents'][0]:
+    has_documents = bool(results and results['documents'] and results['documents'][0])
+    if has_documents:
         rag_context = "\n".join(results['documents'][0])
         context_parts.append(f"Relevant Information:\n{rag_context}")
     
@@ -137,6 +134,15 @@ def query_rag(query: str, uuid: str) -> dict:
     }
     
     system_message = tone_prompts.get(tone_style, tone_prompts["empathetic"])
+    if not has_documents:
+        system_message += " " + NO_DOCUMENTS_INSTRUCTION
+    
+    # Only send a context block when there is context, so empty retrievals
+    # don't spend input tokens on an empty "Context:" prefix
+    if full_context:
+        user_content = f"Context:\n{full_context}\n\nQuery: {query}"
+    else:
+        user_content = query
     
     # Call OpenAI with config values
     # Call OpenAI completion and measure completion latency
@@ -145,7 +151,7 @@ def query_rag(query: str, uuid: str) -> dict:
         model=gpt_model,  # Configurable model
         messages=[
             {"role": "system", "content": system_message},
-            {"role": "user", "content": f"Context:\n{full_context}\n\nQuery: {query}"}
+            {"role": "user", "content": user_content}
         ],
         temperature=rag_temperature  # Configurable temperature
     )
@@ -203,7 +209,8 @@ async def retrieve_documents(query: str, n_results: int | None = None):
     if n_results is None:
         raise ValueError("n_results cannot be None")
     n_results = int(n_results)
-    results = collection.query(query_texts=[query], n_results=n_results)
+    # chromadb embeds the query over HTTP and searches synchronously; keep that off the event loop
+    results = await asyncio.to_thread(collection.query, query_texts=[query], n_results=n_results)
     documents = results.get("documents")
     texts = documents[0] if documents and len(documents) > 0 and documents[0] is not None else []
     metadatas_list = results.get("metadatas")
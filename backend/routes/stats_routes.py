@@ -24,19 +24,18 @@ async def get_strategy_changes(limit: int = Query(20, description="Max number of
 async def get_function_analysis(limit: int = Query(50, description="Max number of function calls"),
                                filter: Optional[str] = Query(None, description="Filter by function name")):
     """Return aggregated function call analytics."""
-    from stats.collector import get_function_calls, analyze_function_calls
-    calls = get_function_calls(limit=limit, filter_query=filter)
-    return analyze_function_calls(calls)
+    from stats.collector import get_function_calls_with_analysis
+    _, analysis = get_function_calls_with_analysis(limit=limit, filter_query=filter)
+    return analysis
 
 @router.get("/data")
 async def get_stats_data(limit: int = Query(50, description="Max number of function calls"),
                          filter: Optional[str] = Query(None, description="Filter by function name")):
     """Return combined function calls, strategy changes, and analytics."""
-    from stats.collector import get_function_calls, get_strategy_changes, analyze_function_calls
+    from stats.collector import get_function_calls_with_analysis, get_strategy_changes
     from stats.tools_dashboard import TOOL_STRATEGIES
-    calls = get_function_calls(limit=limit, filter_query=filter)
+    calls, analysis = get_function_calls_with_analysis(limit=limit, filter_query=filter)
     changes = get_strategy_changes(limit=20)
-    analysis = analyze_function_calls(calls)
     return {
         "function_calls": calls,
         "strategy_changes": changes,
@@ -3,20 +3,29 @@
 This module integrates the admin dashboard with the main Mobeus backend.
 Includes fallback options in case modules can't be imported.
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse, RedirectResponse
+from pydantic import BaseModel
+import asyncio
 import importlib
+import posixpath
 import sys
+from typing import Any, Dict, Optional
+from urllib.parse import unquote
 
-def setup_admin_dashboard(app: FastAPI, prefix: str = "/admin"):
+import httpx
+
+from stats.collector import get_queue_logger
+
+logger = get_queue_logger(__name__)
+
+def _build_dashboard_app() -> FastAPI:
     """
-    Set up all admin dashboard routes with proper prefix
-    to avoid conflicts with existing routes.
-    
-    Args:
-        app: The FastAPI application instance
-        prefix: URL prefix for all dashboard routes (default: "/admin")
+    Import all dashboard components (with fallbacks for missing dependencies)
+    and assemble them into one sub-application.
     """
+    dashboard_app = FastAPI(docs_url=None, redoc_url=None, openapi_url=None)
+
     # Import routers with fallbacks for missing dependencies
     routers_to_include = []
     
@@ -25,13 +34,13 @@ def setup_admin_dashboard(app: FastAPI, prefix: str = "/admin"):
         from stats.main_dashboard import router as main_dashboard_router
         routers_to_include.append(("Main Dashboard", main_dashboard_router))
     except ImportError as e:
-        print(f"Warning: Could not import main dashboard: {e}")
+        logger.warning("Could not import main dashboard: %s", e)
         # Try the simple dashboard as fallback
         try:
             from stats.simple_dashboard import router as simple_dashboard_router
             routers_to_include.append(("Simple Dashboard", simple_dashboard_router))
         except ImportError as e2:
-            print(f"Warning: Could not import simple dashboard: {e2}")
+            logger.warning("Could not import simple dashboard: %s", e2)
     
     # Try to import other dashboard components
     dashboard_modules = [
@@ -48,20 +57,19 @@ def setup_admin_dashboard(app: FastAPI, prefix: str = "/admin"):
             if hasattr(module, 'router'):
                 routers_to_include.append((name, module.router))
             else:
-                print(f"Warning: {name} module does not have a 'router' attribute")
+                logger.warning("%s module does not have a 'router' attribute", name)
         except ImportError as e:
-            print(f"Warning: Could not import {name}: {e}")
+            logger.warning("Could not import %s: %s", name, e)
     
-    # Mount all dashboard routers with the admin prefix
     for name, router in routers_to_include:
-        app.include_router(router, prefix=prefix)
-        print(f"✅ {name} mounted at {prefix}")
+        dashboard_app.include_router(router)
+        logger.info("✅ %s loaded", name)
     
     if not routers_to_include:
-        print("❌ No dashboard components could be loaded")
+        logger.error("❌ No dashboard components could be loaded")
         
         # Create a simple fallback route
-        @app.get(f"{prefix}/", include_in_schema=False)
+        @dashboard_app.get("/", include_in_schema=False)
         async def admin_fallback():
             return HTMLResponse(content="""
             <html>
@@ -72,6 +80,130 @@ def setup_admin_dashboard(app: FastAPI, prefix: str = "/admin"):
                 </body>
             </html>
             """)
+
+    return dashboard_app
+
+
+class LazyDashboardApp:
+    """
+    ASGI app that defers importing the dashboard modules (DB, templating, chart
+    helpers) until the first request under its mount point.
+    """
+
+    def __init__(self):
+        self._app: Optional[FastAPI] = None
+
+    async def __call__(self, scope, receive, send):
+        if self._app is None:
+            self._app = _build_dashboard_app()
+        await self._app(scope, receive, send)
+
+
+# Upper bound on sub-requests accepted by one /batch call
+MAX_BATCH_REQUESTS = 20
+
+
+class BatchSubRequest(BaseModel):
+    path: str
+    method: str = "GET"
+    body: Optional[Any] = None
+
+
+class BatchRequest(BaseModel):
+    requests: Dict[str, BatchSubRequest]
+
+
+def _normalize_batch_path(raw: str) -> Optional[str]:
+    """
+    Percent-decode and resolve dot segments in a sub-request path, keeping the
+    query string and a trailing slash. Returns None for non-absolute paths.
+    """
+    path, sep, query = raw.partition("?")
+    path = unquote(path)
+    if not path.startswith("/"):
+        return None
+    normalized = posixpath.normpath(path)
+    if path.endswith("/") and normalized != "/":
+        normalized += "/"
+    return normalized + sep + query
+
+
+def _register_batch_endpoint(app: FastAPI, prefix: str):
+    """
+    Add ``POST {prefix}/batch`` so the admin UI can fetch several dashboard
+    endpoints in one round trip. Sub-requests are dispatched in-process
+    through the ASGI app and run concurrently.
+    """
+    batch_path = f"{prefix}/batch"
+
+    @app.post(batch_path, include_in_schema=False)
+    async def admin_batch(batch: BatchRequest):
+        if len(batch.requests) > MAX_BATCH_REQUESTS:
+            raise HTTPException(status_code=400, detail=f"At most {MAX_BATCH_REQUESTS} requests per batch")
+        targets = []
+        for key, sub in batch.requests.items():
+            # Only dashboard endpoints may be batched, and never the batch endpoint itself.
+            # Dot segments are resolved first so "/admin/../x" cannot escape the prefix
+            target = _normalize_batch_path(sub.path)
+            path = target.split("?", 1)[0] if target else ""
+            if not path.startswith(f"{prefix}/") or path == batch_path:
+                raise HTTPException(status_code=400, detail=f"Invalid path for '{key}': {sub.path}")
+            targets.append(target)
+
+        # App errors come back as 500 responses instead of failing the whole batch.
+        # Sub-responses are decoded right here, so ask for them uncompressed rather
+        # than have the gzip middleware compress what httpx then decompresses
+        transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://admin-batch",
+            headers={"Accept-Encoding": "identity"},
+        ) as client:
+            async def dispatch(sub: BatchSubRequest, target: str) -> Dict[str, Any]:
+                response = await client.request(
+                    sub.method.upper(),
+                    target,
+                    json=sub.body,
+                )
+                try:
+                    body = response.json()
+                except ValueError:
+                    body = response.text
+                return {"status": response.status_code, "body": body}
+
+            results = await asyncio.gather(
+                *(dispatch(sub, target) for sub, target in zip(batch.requests.values(), targets)),
+                return_exceptions=True,
+            )
+
+        response: Dict[str, Any] = {}
+        for key, result in zip(batch.requests.keys(), results):
+            if isinstance(result, BaseException):
+                logger.error("Batch sub-request '%s' failed: %s", key, result)
+                result = {"status": 500, "body": {"detail": "Internal Server Error"}}
+            response[key] = result
+        return response
+
+
+def setup_admin_dashboard(app: FastAPI, prefix: str = "/admin"):
+    """
+    Set up all admin dashboard routes with proper prefix
+    to avoid conflicts with existing routes.
+
+    The dashboard modules are imported on the first request under ``prefix``
+    rather than at startup, keeping cold start and baseline memory low.
+    
+    Args:
+        app: The FastAPI application instance
+        prefix: URL prefix for all dashboard routes (default: "/admin")
+
+    Also exposes ``POST {prefix}/batch`` for fetching several dashboard
+    endpoints in one request.
+    """
+    # Registered before the mount, which would otherwise capture {prefix}/batch
+    _register_batch_endpoint(app, prefix)
+    app.mount(prefix, LazyDashboardApp())
+    logger.info("✅ Admin dashboard mounted at %s (loaded on first request)", prefix)
     
     # Add redirection from admin root to main dashboard
     @app.get(prefix, include_in_schema=False)
@@ -2,57 +2,55 @@
 
 import os
 import json
+import asyncio
 import datetime
 
-def ensure_log_file_exists():
+from stats.collector import get_queue_logger
+
+logger = get_queue_logger(__name__)
+
+def _append_line(path: str, line: str) -> None:
+    with open(path, "a") as f:
+        f.write(line)
+
+async def ensure_log_file_exists():
     """
     Ensure log file exists on application startup.
-    Place this in your FastAPI startup code.
+    Place this in your FastAPI startup code (await it from the lifespan).
+    File I/O runs in a worker thread so the event loop is never blocked.
     """
     try:
         # Import config to get the path
         from config import DEBUG_LOG_PATH
-        
+
         # Create directory if needed
         log_dir = os.path.dirname(DEBUG_LOG_PATH)
         if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir, exist_ok=True)
-            print(f"📁 Created log directory: {log_dir}")
-        
-        # Create file if it doesn't exist
-        if not os.path.exists(DEBUG_LOG_PATH):
-            with open(DEBUG_LOG_PATH, "a") as f:
-                startup_entry = {
-                    "timestamp": datetime.datetime.now().isoformat(),
-                    "message": "Application startup - log file initialized",
-                    "query": "system",
-                    "top_chunks": [],
-                    "answer": "System startup",
-                    "timings": {"total": 0.0}
-                }
-                f.write(json.dumps(startup_entry) + "\n")
-            print(f"📝 Created log file: {DEBUG_LOG_PATH}")
+            await asyncio.to_thread(os.makedirs, log_dir, exist_ok=True)
+            logger.info("📁 Created log directory: %s", log_dir)
+
+        # One startup entry per boot; it also creates the file when missing
+        created = not os.path.exists(DEBUG_LOG_PATH)
+        startup_entry = {
+            "timestamp": datetime.datetime.now().isoformat(),
+            "message": "Application startup - log file initialized" if created else "Application startup",
+            "query": "system",
+            "top_chunks": [],
+            "answer": "System startup",
+            "timings": {"total": 0.0}
+        }
+        await asyncio.to_thread(_append_line, DEBUG_LOG_PATH, json.dumps(startup_entry) + "\n")
+
+        if created:
+            logger.info("📝 Created log file: %s", DEBUG_LOG_PATH)
         else:
-            print(f"✅ Log file already exists: {DEBUG_LOG_PATH}")
-            
-        # Write startup entry regardless
-        with open(DEBUG_LOG_PATH, "a") as f:
-            startup_entry = {
-                "timestamp": datetime.datetime.now().isoformat(),
-                "message": "Application startup",
-                "query": "system",
-                "top_chunks": [],
-                "answer": "System startup",
-                "timings": {"total": 0.0}
-            }
-            f.write(json.dumps(startup_entry) + "\n")
-            
-        print(f"✅ Added startup entry to log file")
+            logger.info("✅ Log file already exists: %s", DEBUG_LOG_PATH)
+        logger.info("✅ Added startup entry to log file")
         return True
     except Exception as e:
-        print(f"❌ Error ensuring log file exists: {e}")
+        logger.error("❌ Error ensuring log file exists: %s", e)
         return False
 
 if __name__ == "__main__":
     # Test the function directly
-    ensure_log_file_exists()
\ No newline at end of file
+    asyncio.run(ensure_log_file_exists())
@@ -1,9 +1,52 @@
 import os
+import re
+import sys
+import mmap
 import json
+import queue
+import logging
+import logging.handlers
+import time
+import threading
+import atexit
+import asyncio
 import datetime
-from typing import List, Dict, Any, Optional
+from collections import Counter, OrderedDict, defaultdict
+from functools import lru_cache
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 
 from config import DEBUG_LOG_PATH, LOG_DIR
+
+# orjson is optional; fall back to the stdlib encoder when it is missing
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+    print("Warning: orjson not installed. Falling back to stdlib json for logs.")
+
+# psutil is optional; the dashboards check their own HAS_PSUTIL before sampling
+try:
+    import psutil
+    HAS_PSUTIL = True
+except ImportError:
+    HAS_PSUTIL = False
+
+# Shared JSON codec for the stats and chat modules; parses bytes or str and
+# orjson.JSONDecodeError subclasses json's, so existing handlers still apply
+json_loads = orjson.loads if HAS_ORJSON else json.loads
+
+def json_dumps_bytes(obj: Any, indent: bool = False, non_str_keys: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes, with orjson when available; unknown types become str."""
+    if HAS_ORJSON:
+        option = (orjson.OPT_INDENT_2 if indent else 0) | (orjson.OPT_NON_STR_KEYS if non_str_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, indent=2 if indent else None, default=str).encode("utf-8")
+
+def json_dumps(obj: Any, indent: bool = False, non_str_keys: bool = False) -> str:
+    """Serialize to a JSON string, with orjson when available."""
+    return json_dumps_bytes(obj, indent, non_str_keys).decode("utf-8")
+
 # Tool Strategy definitions (moved from tools_dashboard to avoid circular import)
 TOOL_STRATEGIES = {
     "auto": {
@@ -41,6 +84,190 @@ STRATEGY_LOG_PATH = os.path.join(
     LOG_DIR, os.getenv("MOBEUS_STRATEGY_LOG", "strategy_changes.jsonl")
 )
 
+# One listener thread drains log records for every get_queue_logger() logger
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_listener: Optional[logging.handlers.QueueListener] = None
+
+def get_queue_logger(name: str, level: str = "INFO") -> logging.Logger:
+    """
+    Return a logger whose records are written to stdout by a background
+    QueueListener thread, so callers on the event loop never block on the write.
+
+    QueueHandler.prepare still merges the message and its args in the calling
+    thread, so keep per-message work behind isEnabledFor / DEBUG level checks.
+    """
+    global _log_listener
+    logger = logging.getLogger(name)
+    if not logger.handlers:
+        logger.setLevel(level.upper())
+        logger.propagate = False
+        logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+    if _log_listener is None:
+        _log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+    return logger
+
+logger = get_queue_logger(__name__)
+
+# psutil.cpu_percent(interval=None) reports usage since the previous call made
+# anywhere in the process, so the main and debug dashboards share one sample
+# instead of shrinking each other's measurement window
+CPU_SAMPLE_MIN_INTERVAL = 1.0
+_cpu_lock = threading.Lock()
+# (monotonic time of the last psutil read, percent it returned)
+_cpu_sample: Tuple[float, float] = (time.monotonic(), 0.0)
+if HAS_PSUTIL:
+    # Start the first window; the very first call always reports 0.0
+    psutil.cpu_percent(interval=None)
+
+def cpu_percent() -> float:
+    """
+    System-wide CPU percent without blocking, measured over at least
+    CPU_SAMPLE_MIN_INTERVAL seconds; reads within that interval reuse the sample.
+    """
+    global _cpu_sample
+    with _cpu_lock:
+        sampled_at, value = _cpu_sample
+        now = time.monotonic()
+        if now - sampled_at >= CPU_SAMPLE_MIN_INTERVAL:
+            value = psutil.cpu_percent(interval=None)
+            _cpu_sample = (now, value)
+        return value
+
+def _dumps_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize a log entry as one UTF-8 encoded JSONL line."""
+    return json_dumps_bytes(entry) + b"\n"
+
+
+class BufferedJsonlWriter:
+    """
+    Collects JSONL log entries in memory and appends them in batches.
+
+    ``put`` is non-blocking and safe to call from any thread; a single
+    ``run`` task started at app startup flushes pending entries every
+    ``flush_interval`` seconds with one write per batch against a file
+    handle that stays open between flushes. ``path`` may be a callable so
+    the target file can rotate (e.g. daily).
+    """
+
+    def __init__(
+        self,
+        path: "str | Callable[[], str]",
+        flush_interval: float = 0.1,
+        max_batch: int = 500,
+    ):
+        self._path = path
+        self.flush_interval = flush_interval
+        self.max_batch = max_batch
+        self._pending: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
+        self._fp = None
+        self._fp_path: Optional[str] = None
+        # Entries queued outside the app lifespan still reach disk
+        atexit.register(self.close)
+
+    def put(self, entry: Dict[str, Any]) -> None:
+        """Queue an entry for the next flush."""
+        self._pending.put(entry)
+
+    def _current_path(self) -> str:
+        return self._path() if callable(self._path) else self._path
+
+    def flush(self) -> int:
+        """Write all pending entries, one write() per batch. Returns the number written."""
+        written = 0
+        while True:
+            lines: List[bytes] = []
+            while len(lines) < self.max_batch:
+                try:
+                    lines.append(_dumps_line(self._pending.get_nowait()))
+                except queue.Empty:
+                    break
+            if not lines:
+                return written
+            try:
+                path = self._current_path()
+                if self._fp is None or path != self._fp_path:
+                    if self._fp is not None:
+                        self._fp.close()
+                    log_dir = os.path.dirname(path)
+                    if log_dir:
+                        os.makedirs(log_dir, exist_ok=True)
+                    self._fp = open(path, "ab")
+                    self._fp_path = path
+                self._fp.write(b"".join(lines))
+                self._fp.flush()
+                written += len(lines)
+            except Exception as e:
+                logger.warning("⚠️ Failed to write log batch to %s: %s", self._fp_path, e)
+                return written
+
+    async def run(self) -> None:
+        """Flush pending entries periodically until cancelled."""
+        try:
+            while True:
+                await asyncio.sleep(self.flush_interval)
+                self.flush()
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        """Flush any pending entries and close the file handle."""
+        self.flush()
+        if self._fp is not None:
+            self._fp.close()
+            self._fp = None
+            self._fp_path = None
+
+
+def _raw_filter_needle(filter_query: Optional[str]) -> Optional[bytes]:
+    """
+    Lowercased filter as bytes for a substring pre-check on raw log lines, or None
+    when the query has characters JSON may escape, or the ": " / ", " separators
+    that compact writers such as orjson omit (the raw line could then miss it).
+    """
+    if not filter_query:
+        return None
+    needle = filter_query.lower()
+    if not (needle.isascii() and needle.isprintable()) or '"' in needle or "\\" in needle:
+        return None
+    if ": " in needle or ", " in needle:
+        return None
+    return needle.encode()
+
+# "calling function: name" / "using tool: name" mentions in debug-log answers
+_FUNCTION_MENTION_RE = re.compile(
+    r"(?:calling function|using tool):\s*['\"(\[{]*([^\s'\"()\[\]{}]+)", re.IGNORECASE
+)
+# Literal parts of those mentions; debug-log lines without either are never parsed
+_FUNCTION_MENTION_MARKERS = (b"calling function", b"using tool")
+
+def tail_lines(path: str) -> Iterator[bytes]:
+    """
+    Yield the non-empty lines of a file from last to first. The file is
+    memory-mapped and walked backward with rfind, so only the pages near
+    the tail are touched when the caller stops early.
+    """
+    with open(path, "rb") as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be mapped
+            return
+        try:
+            end = mm.size()
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end) + 1
+                line = mm[start:end]
+                if line.strip():
+                    yield line
+                end = start - 1
+        finally:
+            mm.close()
+
+# Strategy flips are appended in batches by a background task (see main.lifespan)
+strategy_log_writer = BufferedJsonlWriter(STRATEGY_LOG_PATH)
+
 def log_strategy_change(user_uuid: str, old_strategy: str, new_strategy: str) -> None:
     """Log strategy changes for analysis."""
     entry = {
@@ -50,75 +277,131 @@ def log_strategy_change(user_uuid: str, old_strategy: str, new_strategy: str) ->
         "new_strategy": new_strategy,
         "type": "strategy_change"
     }
-    with open(STRATEGY_LOG_PATH, "a") as f:
-        f.write(json.dumps(entry) + "\n")
+    strategy_log_writer.put(entry)
+
+# Parsed function-call results, keyed on both logs' (mtime_ns, size) plus the request
+# arguments; an append to either log changes the key, the TTL bounds anything else
+FUNCTION_CALLS_CACHE_TTL = 30.0
+FUNCTION_CALLS_CACHE_SIZE = 128
+# Entries are [cached_at, function_calls, analysis or None]
+_function_calls_cache: "OrderedDict[tuple, list]" = OrderedDict()
+# Dashboard routes read through the cache from worker threads
+_function_calls_lock = threading.Lock()
+
+def _file_signature(path: str) -> tuple:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+def _function_calls_entry(limit: int, filter_query: Optional[str]) -> list:
+    key = (
+        FUNCTION_LOG_PATH, _file_signature(FUNCTION_LOG_PATH),
+        DEBUG_LOG_PATH, _file_signature(DEBUG_LOG_PATH),
+        limit, filter_query,
+    )
+    now = time.monotonic()
+    with _function_calls_lock:
+        cached = _function_calls_cache.get(key)
+        if cached is not None and now - cached[0] < FUNCTION_CALLS_CACHE_TTL:
+            _function_calls_cache.move_to_end(key)
+            return cached
+    
+    # Read outside the lock; concurrent misses for the same key just both read
+    entry = [now, _read_function_calls(limit, filter_query), None]
+    with _function_calls_lock:
+        _function_calls_cache[key] = entry
+        _function_calls_cache.move_to_end(key)
+        while len(_function_calls_cache) > FUNCTION_CALLS_CACHE_SIZE:
+            _function_calls_cache.popitem(last=False)
+    return entry
 
 def get_function_calls(
     limit: int = 50,
     filter_query: Optional[str] = None,
 ) -> List[Dict[str, Any]]:
-    """Extract function call data from logs or debug file."""
+    """
+    Extract function call data from logs or debug file. Results are cached until
+    either log changes or FUNCTION_CALLS_CACHE_TTL passes; treat them as read-only.
+    """
+    return _function_calls_entry(limit, filter_query)[1]
+
+def get_function_calls_with_analysis(
+    limit: int = 50,
+    filter_query: Optional[str] = None,
+) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+    """
+    Function calls together with their analyze_function_calls() summary. The
+    summary is cached with the calls, so repeat dashboard hits skip both passes.
+    """
+    entry = _function_calls_entry(limit, filter_query)
+    if entry[2] is None:
+        entry[2] = analyze_function_calls(entry[1])
+    return entry[1], entry[2]
+
+def _read_function_calls(limit: int, filter_query: Optional[str]) -> List[Dict[str, Any]]:
     function_calls: List[Dict[str, Any]] = []
+    query_lower = filter_query.lower() if filter_query else None
+    # Lines that cannot contain the filter text are skipped before being parsed
+    needle = _raw_filter_needle(filter_query)
     # Try dedicated function call log first
     if os.path.exists(FUNCTION_LOG_PATH):
         try:
-            with open(FUNCTION_LOG_PATH, "r") as f:
-                lines = f.readlines()
-            for line in reversed(lines):
+            for line in tail_lines(FUNCTION_LOG_PATH):
+                if needle and needle not in line.lower():
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                 except json.JSONDecodeError:
                     continue
-                # Filter if requested
-                if filter_query:
+                # The raw-bytes check is only a prefilter (it also matches key names
+                # and other fields); the precise name/arguments match happens here
+                if query_lower:
                     fname = entry.get("function_name", "")
                     args = entry.get("arguments", {})
-                    if filter_query.lower() not in fname.lower() and \
-                       filter_query.lower() not in json.dumps(args).lower():
+                    if query_lower not in fname.lower() and \
+                       query_lower not in json.dumps(args).lower():
                         continue
                 function_calls.append(entry)
                 if len(function_calls) >= limit:
                     return function_calls
         except Exception:
-            pass
+            logger.exception("Error reading function log %s", FUNCTION_LOG_PATH)
     # Fallback to debug log
     if os.path.exists(DEBUG_LOG_PATH):
         try:
-            with open(DEBUG_LOG_PATH, "r") as f:
-                lines = f.readlines()
-            for line in reversed(lines):
+            for line in tail_lines(DEBUG_LOG_PATH):
+                line_lower = line.lower()
+                if needle and needle not in line_lower:
+                    continue
+                if not any(marker in line_lower for marker in _FUNCTION_MENTION_MARKERS):
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                 except json.JSONDecodeError:
                     continue
                 answer = entry.get("answer", "")
-                if "function" in answer.lower() or "tool" in answer.lower():
-                    fname = None
-                    args: Dict[str, Any] = {}
-                    # Attempt to extract function name
-                    if "calling function:" in answer.lower():
-                        part = answer.split("calling function:", 1)[1].strip()
-                        fname = part.split()[0].strip("'\"()[]{}").strip()
-                    elif "using tool:" in answer.lower():
-                        part = answer.split("using tool:", 1)[1].strip()
-                        fname = part.split()[0].strip("'\"()[]{}").strip()
-                    if fname:
-                        if filter_query and filter_query.lower() not in fname.lower():
-                            continue
-                        function_calls.append({
-                            "timestamp": entry.get("timestamp", ""),
-                            "query": entry.get("query", ""),
-                            "function_name": fname,
-                            "arguments": args,
-                            "result": None,
-                            "execution_time": None,
-                            "success": None,
-                            "strategy": "unknown"
-                        })
-                        if len(function_calls) >= limit:
-                            return function_calls
+                # Extract the function name in one case-insensitive scan
+                match = _FUNCTION_MENTION_RE.search(answer) if isinstance(answer, str) else None
+                if match:
+                    fname = match.group(1)
+                    if query_lower and query_lower not in fname.lower():
+                        continue
+                    function_calls.append({
+                        "timestamp": entry.get("timestamp", ""),
+                        "query": entry.get("query", ""),
+                        "function_name": fname,
+                        "arguments": {},
+                        "result": None,
+                        "execution_time": None,
+                        "success": None,
+                        "strategy": "unknown"
+                    })
+                    if len(function_calls) >= limit:
+                        return function_calls
         except Exception:
-            pass
+            logger.exception("Error reading debug log for function calls %s", DEBUG_LOG_PATH)
     # Generate sample data if empty
     if not function_calls:
         function_calls = generate_sample_function_calls(limit)
@@ -129,47 +412,51 @@ def get_strategy_changes(limit: int = 20) -> List[Dict[str, Any]]:
     changes: List[Dict[str, Any]] = []
     if os.path.exists(STRATEGY_LOG_PATH):
         try:
-            with open(STRATEGY_LOG_PATH, "r") as f:
-                lines = f.readlines()
-            for line in reversed(lines):
+            for line in tail_lines(STRATEGY_LOG_PATH):
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                 except json.JSONDecodeError:
                     continue
                 changes.append(entry)
                 if len(changes) >= limit:
                     break
         except Exception:
-            pass
+            logger.exception("Error reading strategy change log %s", STRATEGY_LOG_PATH)
     return changes
 
+_SAMPLE_FUNCTIONS = (
+    "search_knowledge_base",
+    "update_user_memory",
+    "get_weather",
+    "search_web",
+    "calculate",
+)
+
 def generate_sample_function_calls(count: int = 10) -> List[Dict[str, Any]]:
     """Generate sample function call data for demonstration."""
-    sample_functions = [
-        "search_knowledge_base",
-        "update_user_memory",
-        "get_weather",
-        "search_web",
-        "calculate",
-    ]
+    # Timestamps are anchored to the current minute, so repeat visits reuse one build
+    return list(_sample_function_calls(count, int(time.time() // 60)))
+
+@lru_cache(maxsize=32)
+def _sample_function_calls(count: int, epoch_minute: int) -> Tuple[Dict[str, Any], ...]:
     sample_strategies = list(TOOL_STRATEGIES.keys())
-    now = datetime.datetime.now()
+    now = datetime.datetime.fromtimestamp(epoch_minute * 60)
     samples: List[Dict[str, Any]] = []
     for i in range(count):
-        idx = i % len(sample_functions)
+        idx = i % len(_SAMPLE_FUNCTIONS)
         timestamp = (now - datetime.timedelta(minutes=i * 5)).isoformat()
         success = (i % 10) != 0
         samples.append({
             "timestamp": timestamp,
             "query": f"Sample query {i+1}",
-            "function_name": sample_functions[idx],
+            "function_name": _SAMPLE_FUNCTIONS[idx],
             "arguments": {"query": f"Sample query {i+1}"},
             "result": {"answer": "Sample result"} if success else {"error": "Function execution failed"},
             "execution_time": (i % 5) * 0.1 + 0.1,
             "success": success,
             "strategy": sample_strategies[i % len(sample_strategies)],
         })
-    return samples
+    return tuple(samples)
 
 def analyze_function_calls(
     function_calls: List[Dict[str, Any]]
@@ -185,33 +472,45 @@ def analyze_function_calls(
             "strategy_effectiveness": {},
         }
     total = len(function_calls)
-    success_count = sum(1 for c in function_calls if c.get("success"))
-    success_rate = (success_count / total) * 100 if total else 0
-    freq: Dict[str, int] = {}
-    times: Dict[str, List[float]] = {}
-    strat_stats: Dict[str, Dict[str, int]] = {}
+    # Single pass: frequencies, per-function time sums/counts and strategy stats
+    freq: Counter = Counter()
+    time_sum: Dict[str, float] = defaultdict(float)
+    time_cnt: Dict[str, int] = defaultdict(int)
+    # Calls whose outcome was logged, and how many of those succeeded
+    succ_total = 0
+    succ_true = 0
+    # strategy -> [total, logged outcomes, success]
+    strat_stats: Dict[str, List[int]] = defaultdict(lambda: [0, 0, 0])
     for call in function_calls:
         fname = call.get("function_name", "unknown")
-        strat = call.get("strategy", "unknown")
-        freq[fname] = freq.get(fname, 0) + 1
+        freq[fname] += 1
         et = call.get("execution_time")
         if isinstance(et, (int, float)):
-            times.setdefault(fname, []).append(et)
-        ss = strat_stats.setdefault(strat, {"total": 0, "success": 0})
-        ss["total"] += 1
-        if call.get("success"):
-            ss["success"] += 1
-    avg_times: Dict[str, float] = {f: sum(t) / len(t) for f, t in times.items() if t}
-    all_times = [val for sub in times.values() for val in sub]
-    avg_all = sum(all_times) / len(all_times) if all_times else 0
+            time_sum[fname] += et
+            time_cnt[fname] += 1
+        sc = call.get("success")
+        ss = strat_stats[call.get("strategy", "unknown")]
+        ss[0] += 1
+        if sc is not None:
+            ss[1] += 1
+            succ_total += 1
+        if sc:
+            ss[2] += 1
+            succ_true += 1
+    # Entries recovered from the debug log carry no outcome and don't count as failures
+    success_rate = (succ_true / succ_total) * 100 if succ_total else 0
+    avg_times: Dict[str, float] = {f: time_sum[f] / time_cnt[f] for f in time_sum}
+    # Overall average from the running per-function sums, no list of all times
+    all_time_cnt = sum(time_cnt.values())
+    avg_all = sum(time_sum.values()) / all_time_cnt if all_time_cnt else 0
     strat_eff: Dict[str, Dict[str, float]] = {
-        strat: {"success_rate": (data["success"] / data["total"]) * 100, "total_calls": data["total"]}
-        for strat, data in strat_stats.items() if data.get("total")
+        strat: {"success_rate": (succ / logged) * 100 if logged else 0, "total_calls": tot}
+        for strat, (tot, logged, succ) in strat_stats.items()
     }
     return {
         "total_calls": total,
         "success_rate": success_rate,
-        "function_frequency": freq,
+        "function_frequency": dict(freq),
         "avg_execution_time": avg_all,
         "execution_times": avg_times,
         "strategy_effectiveness": strat_eff,
@@ -570,7 +570,11 @@ async def update_config(request: Request):
     
     # Update runtime config
     for key, value in updated_config.items():
-        runtime_config.set_config(key, value)
+        try:
+            runtime_config.set_config(key, value)
+        except ValueError as e:
+            # Keep the current value for fields that do not fit their type
+            print(f"⚠️ Ignoring invalid config value: {e}")
     
     # Save to .env file
     try:
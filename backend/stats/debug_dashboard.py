@@ -1,14 +1,24 @@
 # routes/dashboard/debug_dashboard.py
 import os
+import html
+import hashlib
+import asyncio
 import json
+import time
 import datetime
-from typing import List, Dict, Any, Optional
+from functools import lru_cache
+from itertools import islice
+from typing import Iterator, List, Dict, Any, Optional, Tuple
+from urllib.parse import quote
 from fastapi import APIRouter, Request, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response
+from jinja2 import Environment, BaseLoader, select_autoescape
 import os.path
 from config import DEBUG_LOG_PATH
+from stats.collector import tail_lines, _raw_filter_needle, get_queue_logger, json_dumps_bytes, json_loads, cpu_percent
 
 router = APIRouter()
+logger = get_queue_logger(__name__)
 
 # Try to import psutil but make it optional
 try:
@@ -18,8 +28,16 @@ except ImportError:
     HAS_PSUTIL = False
     print("Warning: psutil not installed. System stats will be unavailable.")
 
+def _json_response(payload: Dict[str, Any]) -> Response:
+    """JSON response for /debug/data; orjson serializes large payloads straight to bytes."""
+    return Response(json_dumps_bytes(payload), media_type="application/json")
+
+@lru_cache(maxsize=4096)
 def format_time(seconds: float) -> str:
-    """Format time in seconds to a human-readable string with appropriate units."""
+    """
+    Format time in seconds to a human-readable string with appropriate units.
+    Memoized: logged timings repeat often (0, missing fields), so most calls are hits.
+    """
     if seconds < 0.001:
         return f"{seconds * 1000000:.1f}μs"
     elif seconds < 1:
@@ -27,8 +45,21 @@ def format_time(seconds: float) -> str:
     else:
         return f"{seconds:.2f}s"
 
+# Seconds a system stats sample is reused for
+SYSTEM_STATS_TTL = 1.0
+_last_stats: Tuple[float, Dict[str, Any]] = (0.0, {})
+
 def get_system_stats() -> Dict[str, Any]:
-    """Get system statistics like CPU, memory usage, etc. with proper error handling."""
+    """
+    Get system statistics like CPU, memory usage, etc. with proper error handling.
+    A sample is reused for SYSTEM_STATS_TTL seconds so bursts of requests share it.
+    """
+    global _last_stats
+    sampled_at, cached = _last_stats
+    now = time.monotonic()
+    if cached and now - sampled_at < SYSTEM_STATS_TTL:
+        return cached
+    
     stats = {
         "cpu_percent": 0,
         "memory_percent": 0,
@@ -41,7 +72,8 @@ def get_system_stats() -> Dict[str, Any]:
         return stats
     
     try:
-        stats["cpu_percent"] = psutil.cpu_percent(interval=0.1)
+        # Non-blocking: shared CPU sample instead of sleeping 100ms
+        stats["cpu_percent"] = cpu_percent()
         stats["memory_percent"] = psutil.virtual_memory().percent
         
         # This might fail in some Docker environments due to permission issues
@@ -52,82 +84,111 @@ def get_system_stats() -> Dict[str, Any]:
             stats["connections_error"] = "Permission denied"
             
     except Exception as e:
-        print(f"Error getting system stats: {e}")
+        logger.exception("Error getting system stats")
         stats["error"] = str(e)
     
+    _last_stats = (now, stats)
     return stats
 
-def get_log_entries(limit: int = 50, filter_query: Optional[str] = None) -> List[Dict[str, Any]]:
+def iter_log_entries(filter_query: Optional[str] = None, format_display: bool = True) -> Iterator[Dict[str, Any]]:
     """
-    Get log entries from the debug log file with proper error handling.
+    Yield parsed debug log entries newest-first, one at a time, so memory stays
+    bounded by what the caller consumes rather than by the size of the log.
     
     Args:
-        limit: Maximum number of entries to return
         filter_query: Optional string to filter entries by query text
-        
-    Returns:
-        List of log entry dictionaries
+        format_display: Add timing percentages and formatted display strings
     """
-    entries = []
+    query_lower = filter_query.lower() if filter_query else None
+    needle = _raw_filter_needle(filter_query)
     
     try:
-        # Check if log file exists and is readable
-        if not os.path.exists(DEBUG_LOG_PATH):
-            print(f"Warning: Debug log file not found at {DEBUG_LOG_PATH}")
-            return entries
-            
-        # Handle potential file read issues
+        # One stat call covers both the existence and the empty-file checks
         try:
-            with open(DEBUG_LOG_PATH, "r") as f:
-                lines = f.readlines()
-        except (PermissionError, IOError) as e:
-            print(f"Error reading log file: {e}")
-            return entries
+            if os.stat(DEBUG_LOG_PATH).st_size == 0:
+                return
+        except FileNotFoundError:
+            logger.warning("Debug log file not found at %s", DEBUG_LOG_PATH)
+            return
             
-        # Process log entries with error handling for each line
-        for line in reversed(lines):
+        # Read backward from the end of the file; only as much of it as the
+        # caller pulls is touched
+        for line in tail_lines(DEBUG_LOG_PATH):
+            # Cheap substring check on the raw bytes; only candidate lines are parsed
+            if needle and needle not in line.lower():
+                continue
             try:
-                entry = json.loads(line)
+                entry = json_loads(line)
+            except json.JSONDecodeError:
+                # Skip invalid JSON lines without failing (orjson's error subclasses this)
+                continue
                 
-                # Apply filter if provided
-                if filter_query and filter_query.lower() not in entry.get("query", "").lower():
-                    continue
-                    
-                # Calculate additional metrics
-                timings = entry.get("timings", {})
-                if timings:
-                    # Format timing values for display with fallbacks for missing data
-                    timings_formatted = {}
-                    
-                    # Calculate retrieval percentage of total time
-                    if "retrieval" in timings and "total" in timings and timings["total"] > 0:
-                        timings["retrieval_percent"] = (timings["retrieval"] / timings["total"]) * 100
-                        timings_formatted["retrieval_percent"] = f"{timings['retrieval_percent']:.1f}%"
-                    
-                    # Calculate GPT percentage of total time
-                    if "gpt" in timings and "total" in timings and timings["total"] > 0:
-                        timings["gpt_percent"] = (timings["gpt"] / timings["total"]) * 100
-                        timings_formatted["gpt_percent"] = f"{timings['gpt_percent']:.1f}%"
-                    
-                    # Format timing values for display
-                    for key, value in timings.items():
-                        if isinstance(value, (int, float)) and not key.endswith("_percent"):
-                            timings_formatted[f"{key}_formatted"] = format_time(value)
-                    
-                    # Add formatted timings to entry
-                    entry["timings_formatted"] = timings_formatted
+            # Apply filter if provided (exact check: the needle may have hit another field)
+            if query_lower and query_lower not in entry.get("query", "").lower():
+                continue
                 
-                entries.append(entry)
+            # Calculate additional metrics (only the HTML view displays them); entries
+            # without a positive total have nothing useful to format and are passed through
+            timings = entry.get("timings") or {}
+            if format_display and (timings.get("total") or 0) > 0:
+                # Format timing values for display with fallbacks for missing data
+                timings_formatted = {}
                 
-                if len(entries) >= limit:
-                    break
-            except json.JSONDecodeError:
-                # Skip invalid JSON lines without failing
-                continue
-    except Exception as e:
-        print(f"Error processing log entries: {e}")
+                # Calculate retrieval percentage of total time
+                if "retrieval" in timings:
+                    timings["retrieval_percent"] = (timings["retrieval"] / timings["total"]) * 100
+                    timings_formatted["retrieval_percent"] = f"{timings['retrieval_percent']:.1f}%"
+                
+                # Calculate GPT percentage of total time
+                if "gpt" in timings:
+                    timings["gpt_percent"] = (timings["gpt"] / timings["total"]) * 100
+                    timings_formatted["gpt_percent"] = f"{timings['gpt_percent']:.1f}%"
+                
+                # Format timing values for display
+                for key, value in timings.items():
+                    if isinstance(value, (int, float)) and not key.endswith("_percent"):
+                        timings_formatted[f"{key}_formatted"] = format_time(value)
+                
+                # Add formatted timings to entry
+                entry["timings_formatted"] = timings_formatted
+            
+            yield entry
+    except (PermissionError, IOError):
+        logger.exception("Error reading log file %s", DEBUG_LOG_PATH)
+    except Exception:
+        logger.exception("Error processing log entries")
+
+def get_log_entries(
+    limit: int = 50, filter_query: Optional[str] = None, format_display: bool = True
+) -> List[Dict[str, Any]]:
+    """
+    Get log entries from the debug log file with proper error handling.
     
-    return entries
+    Args:
+        limit: Maximum number of entries to return
+        filter_query: Optional string to filter entries by query text
+        format_display: Add timing percentages and formatted display strings
+        
+    Returns:
+        List of log entry dictionaries
+    """
+    return list(islice(iter_log_entries(filter_query, format_display), max(limit, 0)))
+
+def summarize_entries(entries: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Average total/GPT/retrieval timings across entries in a single pass."""
+    s_tot = s_gpt = s_ret = 0.0
+    for e in entries:
+        t = e.get("timings") or {}
+        s_tot += t.get("total", 0)
+        s_gpt += t.get("gpt", 0)
+        s_ret += t.get("retrieval", 0)
+    count = max(len(entries), 1)
+    return {
+        "total_entries": float(len(entries)),
+        "avg_total_time": s_tot / count,
+        "avg_gpt_time": s_gpt / count,
+        "avg_retrieval_time": s_ret / count,
+    }
 
 @router.get("/debug", response_class=HTMLResponse)
 async def debug_dashboard(
@@ -140,34 +201,18 @@ async def debug_dashboard(
     Returns HTML rendering of the debug information.
     """
     try:
-        # Get log entries with proper error handling
-        entries = get_log_entries(limit=limit, filter_query=filter)
+        # Log-derived sections come from a cache keyed on the log file's mtime and size;
+        # only the system stats are gathered and rendered per request. Log reads,
+        # parsing and psutil calls run in worker threads so the event loop stays free
+        before_stats, after_stats, entry_count = await asyncio.to_thread(
+            _render_cached, limit, filter, _log_signature()
+        )
         
         # Get system stats
-        system_stats = get_system_stats()
-        
-        # Calculate summary statistics with fallbacks for empty entries
-        summary: Dict[str, float] = {
-            "total_entries": float(len(entries)),
-            "avg_total_time": 0.0,
-            "avg_gpt_time": 0.0,
-            "avg_retrieval_time": 0.0,
-        }
-        
-        if entries:
-            # Calculate averages with proper error handling
-            total_times = [e.get("timings", {}).get("total", 0) for e in entries]
-            gpt_times = [e.get("timings", {}).get("gpt", 0) for e in entries]
-            retrieval_times = [e.get("timings", {}).get("retrieval", 0) for e in entries]
-            
-            summary["avg_total_time"] = sum(total_times) / max(len(total_times), 1)
-            summary["avg_gpt_time"] = sum(gpt_times) / max(len(gpt_times), 1)
-            summary["avg_retrieval_time"] = sum(retrieval_times) / max(len(retrieval_times), 1)
+        system_stats = await asyncio.to_thread(get_system_stats)
         
-        # Render HTML with all components
-        # Using a more modular approach
-        html = render_debug_dashboard(entries, system_stats, summary, limit, filter)
-        return HTMLResponse(content=html)
+        page = "".join([before_stats, _render_system_stats(system_stats, entry_count), after_stats])
+        return HTMLResponse(content=page)
         
     except Exception as e:
         # Fallback HTML in case of error
@@ -187,25 +232,19 @@ async def debug_dashboard(
             <div class="error">
                 <h2>Error rendering dashboard</h2>
                 <p>An error occurred while rendering the dashboard.</p>
-                <pre>{str(e)}</pre>
+                <pre>{html.escape(str(e))}</pre>
             </div>
             <p><a href="./">Return to Main Dashboard</a></p>
             <hr>
             <h3>Raw JSON API</h3>
-            <p>You can still access the debug data as JSON via: <a href="./debug/data?limit={limit}&filter={filter or ''}">./debug/data</a></p>
+            <p>You can still access the debug data as JSON via: <a href="./debug/data?limit={limit}&filter={html.escape(quote(filter or ''))}">./debug/data</a></p>
         </body>
         </html>
         """
         return HTMLResponse(content=error_html)
 
-def render_debug_dashboard(entries, system_stats, summary, limit, filter):
-    """
-    Render the debug dashboard HTML with proper error handling.
-    Breaks down the template into manageable chunks.
-    """
-    # CSS styles
-    css = """
-    <style>
+# CSS styles (static); served from /debug/debug.css so browsers cache it once
+_CSS = """
         :root {
             --primary: #2563eb;
             --primary-light: #dbeafe;
@@ -484,12 +523,24 @@ def render_debug_dashboard(entries, system_stats, summary, limit, filter):
                 flex-direction: column;
             }
         }
-    </style>
-    """
-    
-    # Create header and filter form
-    filter_value = filter or ""
-    header_html = f"""
+"""
+# Content hash in the stylesheet URL, so the year-long cache lifetime is safe across deploys
+_CSS_VERSION = hashlib.blake2b(_CSS.encode(), digest_size=6).hexdigest()
+
+# Templates are compiled once at import and rendered per request; autoescape
+# covers every log-derived value (query, answer, sources, filter)
+_env = Environment(loader=BaseLoader(), autoescape=select_autoescape(["html"]))
+
+_PAGE_TOP_SRC = """
+    <!DOCTYPE html>
+    <html lang="en">
+    <head>
+        <meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width, initial-scale=1.0">
+        <title>Mobeus Assistant — Debug Logs</title>
+        <link rel="stylesheet" href="./debug/debug.css?v={{ css_version }}">
+    </head>
+    <body>
     <div class="container">
         <div class="breadcrumb">
             <a href="./">Dashboard</a>
@@ -510,12 +561,12 @@ def render_debug_dashboard(entries, system_stats, summary, limit, filter):
                     <div class="filters">
                         <div class="form-group">
                             <label for="limit">Max Entries</label>
-                            <input type="number" id="limit" name="limit" value="{limit}" min="1" max="1000">
+                            <input type="number" id="limit" name="limit" value="{{ limit }}" min="1" max="1000">
                         </div>
                         
                         <div class="form-group">
                             <label for="filter">Filter by Query</label>
-                            <input type="text" id="filter" name="filter" value="{filter_value}" placeholder="Filter by query text...">
+                            <input type="text" id="filter" name="filter" value="{{ filter or '' }}" placeholder="Filter by query text...">
                         </div>
                         
                         <div class="form-group" style="justify-content: flex-end;">
@@ -525,10 +576,9 @@ def render_debug_dashboard(entries, system_stats, summary, limit, filter):
                 </form>
             </div>
         </div>
-    """
-    
-    # Create system stats section
-    system_stats_html = f"""
+"""
+
+_SYSTEM_STATS_SRC = """
     <div class="card">
         <div class="card-header">
             System Stats
@@ -536,39 +586,38 @@ def render_debug_dashboard(entries, system_stats, summary, limit, filter):
         <div class="card-body">
             <div class="stats-grid">
                 <div class="stat-card">
-                    <div class="stat-value {'warning' if system_stats.get('cpu_percent', 0) > 70 else 'good'}">
-                        {system_stats.get('cpu_percent', 0)}%
+                    <div class="stat-value {{ 'warning' if system_stats.get('cpu_percent', 0) > 70 else 'good' }}">
+                        {{ system_stats.get('cpu_percent', 0) }}%
                     </div>
                     <div class="stat-label">CPU Usage</div>
                 </div>
                 
                 <div class="stat-card">
-                    <div class="stat-value {'warning' if system_stats.get('memory_percent', 0) > 80 else 'good'}">
-                        {system_stats.get('memory_percent', 0)}%
+                    <div class="stat-value {{ 'warning' if system_stats.get('memory_percent', 0) > 80 else 'good' }}">
+                        {{ system_stats.get('memory_percent', 0) }}%
                     </div>
                     <div class="stat-label">Memory Usage</div>
                 </div>
                 
                 <div class="stat-card">
                     <div class="stat-value">
-                        {system_stats.get('active_connections', 0)}
+                        {{ system_stats.get('active_connections', 0) }}
                     </div>
                     <div class="stat-label">Active Connections</div>
                 </div>
                 
                 <div class="stat-card">
                     <div class="stat-value">
-                        {len(entries)}
+                        {{ entry_count }}
                     </div>
                     <div class="stat-label">Log Entries</div>
                 </div>
             </div>
         </div>
     </div>
-    """
-    
-    # Create RAG performance summary
-    performance_html = f"""
+"""
+
+_PAGE_BOTTOM_SRC = """
     <div class="card">
         <div class="card-header">
             RAG Performance Summary
@@ -577,68 +626,50 @@ def render_debug_dashboard(entries, system_stats, summary, limit, filter):
             <div class="stats-grid">
                 <div class="stat-card">
                     <div class="stat-value">
-                        {format_time(summary.get('avg_total_time', 0))}
+                        {{ format_time(summary.get('avg_total_time', 0)) }}
                     </div>
                     <div class="stat-label">Avg Total Time</div>
                 </div>
                 
                 <div class="stat-card">
                     <div class="stat-value">
-                        {format_time(summary.get('avg_gpt_time', 0))}
+                        {{ format_time(summary.get('avg_gpt_time', 0)) }}
                     </div>
                     <div class="stat-label">Avg GPT Time</div>
                 </div>
                 
                 <div class="stat-card">
                     <div class="stat-value">
-                        {format_time(summary.get('avg_retrieval_time', 0))}
+                        {{ format_time(summary.get('avg_retrieval_time', 0)) }}
                     </div>
                     <div class="stat-label">Avg Retrieval Time</div>
                 </div>
                 
                 <div class="stat-card">
                     <div class="stat-value">
-                        {summary.get('avg_gpt_time', 0) / max(summary.get('avg_total_time', 1), 0.001) * 100:.1f}%
+                        {{ '%.1f' % gpt_share }}%
                     </div>
                     <div class="stat-label">GPT % of Total</div>
                 </div>
             </div>
         </div>
     </div>
-    """
     
-    # Create log entries table
-    logs_html = """
     <div class="card">
         <div class="card-header">
             Log Entries
-    """
-    
-    # Add count of entries shown
-    if entries:
-        logs_html += f"""
-            <span class="badge badge-success">{len(entries)} entries</span>
-        """
-    else:
-        logs_html += """
+            {% if rows %}
+            <span class="badge badge-success">{{ rows|length }} entries</span>
+            {% else %}
             <span class="badge badge-warning">No entries found</span>
-        """
-        
-    logs_html += """
+            {% endif %}
         </div>
         <div class="card-body">
-    """
-    
-    # If no entries found
-    if not entries:
-        logs_html += """
+            {% if not rows %}
             <div class="no-data">
                 <p>No log entries found. Try adjusting your filters or check if the log file exists.</p>
             </div>
-        """
-    else:
-        # Build table for entries
-        logs_html += """
+            {% else %}
             <div style="overflow-x: auto;">
                 <table>
                     <thead>
@@ -650,122 +681,151 @@ def render_debug_dashboard(entries, system_stats, summary, limit, filter):
                         </tr>
                     </thead>
                     <tbody>
-        """
-        
-        # Add each log entry to table
-        for entry in entries:
-            # Get timestamp with fallback
-            timestamp = entry.get("timestamp", "N/A")
-            if timestamp != "N/A":
-                try:
-                    # Format timestamp if it's a valid ISO date
-                    dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-                    timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
-                except (ValueError, TypeError):
-                    # Keep original if we can't parse it
-                    pass
-            
-            # Get query text with fallback
-            query = entry.get("query", "")
-            if len(query) > 50:
-                query_display = query[:50] + "..."
-            else:
-                query_display = query
-            
-            # Get timing information with fallbacks
-            timings = entry.get("timings", {})
-            timings_formatted = entry.get("timings_formatted", {})
-            
-            total_time = timings.get("total", 0)
-            total_time_formatted = timings_formatted.get("total_formatted", "N/A")
-            
-            # Get sources with fallback
-            sources = entry.get("sources", [])
-            sources_display = ", ".join([s.get("filename", "unknown") if isinstance(s, dict) else str(s) for s in sources[:3]])
-            if len(sources) > 3:
-                sources_display += f" + {len(sources) - 3} more"
-            
-            # Build the table row for this entry
-            logs_html += f"""
+                        {% for row in rows %}
                         <tr>
-                            <td>{timestamp}</td>
-                            <td>{query_display}</td>
+                            <td>{{ row.timestamp }}</td>
+                            <td>{{ row.query_display }}</td>
                             <td>
-                                <div>Total: {total_time_formatted}</div>
-                                <div>Retrieval: {timings_formatted.get("retrieval_formatted", "N/A")}</div>
-                                <div>GPT: {timings_formatted.get("gpt_formatted", "N/A")}</div>
+                                <div>Total: {{ row.timings_formatted.get("total_formatted", "N/A") }}</div>
+                                <div>Retrieval: {{ row.timings_formatted.get("retrieval_formatted", "N/A") }}</div>
+                                <div>GPT: {{ row.timings_formatted.get("gpt_formatted", "N/A") }}</div>
                             </td>
                             <td>
                                 <details>
                                     <summary>View Details</summary>
                                     <div style="margin-top: 0.5rem;">
                                         <h4>Query</h4>
-                                        <p>{query}</p>
+                                        <p>{{ row.query }}</p>
                                         
                                         <h4>Sources</h4>
-                                        <p>{sources_display}</p>
+                                        <p>{{ row.sources_display }}</p>
                                         
                                         <h4>Answer</h4>
                                         <div style="max-height: 300px; overflow-y: auto; background-color: var(--gray-100); padding: 0.75rem; border-radius: 0.375rem; font-family: ui-monospace, SFMono-Regular, Menlo, Monaco, Consolas, monospace; font-size: 0.875rem; white-space: pre-wrap; word-break: break-word;">
-                                        {entry.get("answer", "N/A")}
+                                        {{ row.answer }}
                                     </div>
                                 </details>
                             </td>
                         </tr>
-            """
-        
-        # Close table
-        logs_html += """
+                        {% endfor %}
                     </tbody>
                 </table>
             </div>
-        """
-    
-    # Close logs section
-    logs_html += """
+            {% endif %}
         </div>
     </div>
-    """
     
-    # Add footer
-    footer = f"""
     <div class="footer">
         <p>
-            Raw data available as <a href="./debug/data?limit={limit}&filter={filter or ''}">JSON API</a>
-            | Log file: {DEBUG_LOG_PATH}
+            Raw data available as <a href="./debug/data?limit={{ limit }}&filter={{ (filter or '')|urlencode }}">JSON API</a>
+            | Log file: {{ log_path }}
         </p>
         <p>
             <a href="./">Back to Dashboard</a>
         </p>
     </div>
-    """
-    
-    # Close container
-    footer += """
     </div> <!-- end container -->
-    """
-    
-    # Combine all HTML sections
-    html = f"""
-    <!DOCTYPE html>
-    <html lang="en">
-    <head>
-        <meta charset="UTF-8">
-        <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <title>Mobeus Assistant — Debug Logs</title>
-        {css}
-    </head>
-    <body>
-        {header_html}
-        {system_stats_html}
-        {performance_html}
-        {logs_html}
-        {footer}
     </body>
     </html>
+"""
+
+_PAGE_TOP_TPL = _env.from_string(_PAGE_TOP_SRC)
+_SYSTEM_STATS_TPL = _env.from_string(_SYSTEM_STATS_SRC)
+_PAGE_BOTTOM_TPL = _env.from_string(_PAGE_BOTTOM_SRC)
+
+def _render_system_stats(system_stats: Dict[str, Any], entry_count: int) -> str:
+    """System stats card; rendered on every request so it stays live."""
+    return _SYSTEM_STATS_TPL.render(system_stats=system_stats, entry_count=entry_count)
+
+def render_debug_dashboard(entries, system_stats, summary, limit, filter):
     """
+    Render the debug dashboard HTML with proper error handling.
+    Breaks down the template into manageable chunks.
+    """
+    before_stats, after_stats = _render_page_parts(entries, summary, limit, filter)
+    return "".join([before_stats, _render_system_stats(system_stats, len(entries)), after_stats])
+
+@lru_cache(maxsize=8192)
+def _fmt_ts(timestamp: str) -> str:
+    """Display form of an ISO timestamp, memoized since the same lines are re-rendered on refresh."""
+    if timestamp == "N/A":
+        return timestamp
+    try:
+        # Format timestamp if it's a valid ISO date
+        dt = datetime.datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+        return dt.strftime("%Y-%m-%d %H:%M:%S")
+    except (ValueError, TypeError, AttributeError):
+        # Keep original if we can't parse it
+        return timestamp
+
+def _row_context(entry: Dict[str, Any]) -> Dict[str, Any]:
+    """Display values for one log entry row."""
+    # Get timestamp with fallback
+    timestamp = _fmt_ts(entry.get("timestamp", "N/A"))
+    
+    # Get query text with fallback
+    query = entry.get("query", "")
+    query_display = query[:50] + "..." if len(query) > 50 else query
+    
+    # Get sources with fallback
+    sources = entry.get("sources", [])
+    sources_display = ", ".join(s.get("filename", "unknown") if isinstance(s, dict) else str(s) for s in sources[:3])
+    if len(sources) > 3:
+        sources_display += f" + {len(sources) - 3} more"
     
-    return html
+    return {
+        "timestamp": timestamp,
+        "query": query,
+        "query_display": query_display,
+        "sources_display": sources_display,
+        "answer": entry.get("answer", "N/A"),
+        "timings_formatted": entry.get("timings_formatted", {}),
+    }
+
+def _render_page_parts(entries, summary, limit, filter) -> Tuple[str, str]:
+    """
+    Render everything that depends only on the log entries, split around the
+    system stats card so cached output can be combined with live stats.
+    """
+    before_stats = _PAGE_TOP_TPL.render(css_version=_CSS_VERSION, limit=limit, filter=filter)
+    after_stats = _PAGE_BOTTOM_TPL.render(
+        rows=[_row_context(entry) for entry in entries],
+        summary=summary,
+        gpt_share=summary.get('avg_gpt_time', 0) / max(summary.get('avg_total_time', 1), 0.001) * 100,
+        limit=limit,
+        filter=filter,
+        log_path=DEBUG_LOG_PATH,
+        format_time=format_time,
+    )
+    return before_stats, after_stats
+
+def _log_signature() -> Tuple[int, int]:
+    """(mtime_ns, size) of the debug log from a single stat call; (0, 0) when missing."""
+    try:
+        st = os.stat(DEBUG_LOG_PATH)
+    except OSError:
+        return 0, 0
+    return st.st_mtime_ns, st.st_size
+
+@lru_cache(maxsize=32)
+def _render_cached(limit: int, filter: Optional[str], log_signature: Tuple[int, int]) -> Tuple[str, str, int]:
+    """
+    Log-derived parts of the dashboard for one (limit, filter) pair. Keyed on the
+    log file's mtime and size, so a new log write invalidates it implicitly.
+    """
+    entries = get_log_entries(limit=limit, filter_query=filter)
+    summary = summarize_entries(entries)
+    before_stats, after_stats = _render_page_parts(entries, summary, limit, filter)
+    return before_stats, after_stats, len(entries)
+
+@router.get("/debug/debug.css")
+async def get_debug_css():
+    """Static stylesheet for the debug dashboard."""
+    return Response(
+        content=_CSS,
+        media_type="text/css",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 @router.get("/debug/data")
 async def get_debug_data(
@@ -777,38 +837,24 @@ async def get_debug_data(
     Provides the same debug data as the HTML dashboard but in JSON format.
     """
     try:
-        entries = get_log_entries(limit=limit, filter_query=filter)
-        system_stats = get_system_stats()
+        # Raw entries only: JSON consumers don't use the display-formatted timings
+        entries = await asyncio.to_thread(get_log_entries, limit, filter, False)
+        system_stats = await asyncio.to_thread(get_system_stats)
         
-        # Calculate summaries
-        summary = {
-            "total_entries": float(len(entries)),
-            "avg_total_time": 0.0,
-            "avg_gpt_time": 0.0,
-            "avg_retrieval_time": 0.0
-        }
+        summary = summarize_entries(entries)
         
-        if entries:
-            total_times = [e.get("timings", {}).get("total", 0) for e in entries]
-            gpt_times = [e.get("timings", {}).get("gpt", 0) for e in entries]
-            retrieval_times = [e.get("timings", {}).get("retrieval", 0) for e in entries]
-            
-            summary["avg_total_time"] = sum(total_times) / max(len(total_times), 1)
-            summary["avg_gpt_time"] = sum(gpt_times) / max(len(gpt_times), 1)
-            summary["avg_retrieval_time"] = sum(retrieval_times) / max(len(retrieval_times), 1)
-        
-        return {
+        return _json_response({
             "entries": entries,
             "system_stats": system_stats,
             "summary": summary
-        }
+        })
     except Exception as e:
-        return {
+        return _json_response({
             "error": str(e),
             "entries": [],
             "system_stats": {},
             "summary": {}
-        }
+        })
 
 @router.get("/debug/sessions")
 async def get_debug_sessions():
@@ -1,11 +1,20 @@
 # routes/dashboard/main_dashboard.py
 import os
+import asyncio
 import datetime
+import gzip
+import hashlib
+import time
 import platform
+import re
+from importlib.metadata import version, PackageNotFoundError
 from fastapi import APIRouter, Request, Query
-from fastapi.responses import HTMLResponse, RedirectResponse
+from fastapi.responses import HTMLResponse, RedirectResponse, Response
+from jinja2 import Environment, BaseLoader, select_autoescape
+from markupsafe import Markup
 from typing import List, Dict, Any, Optional
 import sys
+from stats.collector import cpu_percent
 
 # Create router
 router = APIRouter()
@@ -18,24 +27,145 @@ except ImportError:
     HAS_PSUTIL = False
     print("Warning: psutil not installed. System stats will be limited.")
 
+
+def _safe_version(name):
+    """Installed version of ``name``, or None when it is not installed."""
+    try:
+        return version(name)
+    except PackageNotFoundError:
+        return None
+
+
+# Installed packages cannot change while the process runs, so look the
+# whitelist up once instead of scanning every distribution per request.
+_KEY_PACKAGES = tuple(
+    (name, pkg_version)
+    for name in sorted((
+        'fastapi', 'openai', 'chromadb', 'uvicorn', 'psycopg2', 'psycopg2-binary',
+        'pydantic', 'python-dotenv', 'websockets', 'requests', 'numpy', 'pandas'
+    ))
+    if (pkg_version := _safe_version(name)) is not None
+)
+
+
+def _set_uptime(system, boot_time):
+    """Store uptime both whole and pre-split for the metric card."""
+    uptime = datetime.datetime.now() - datetime.datetime.fromtimestamp(boot_time)
+    head = f"{uptime.days} days"
+    tail = f"{uptime.seconds // 3600} hours, {(uptime.seconds // 60) % 60} minutes"
+    system["uptime"] = f"{head}, {tail}"
+    system["uptime_head"] = head
+    system["uptime_tail"] = tail
+
+
+def _read_system_fast():
+    """
+    Read memory and disk usage directly from /proc/meminfo and statvfs.
+    Linux only; uses the same percent formulas as psutil.
+    """
+    memory = {}
+    with open('/proc/meminfo', 'rb') as f:
+        for line in f:
+            key, _, rest = line.partition(b':')
+            if key in (b'MemTotal', b'MemAvailable'):
+                memory[key] = int(rest.split()[0]) * 1024
+                if len(memory) == 2:
+                    break
+    
+    memory_total = memory[b'MemTotal']
+    memory_available = memory[b'MemAvailable']
+    
+    disk = os.statvfs('/')
+    disk_total = disk.f_blocks * disk.f_frsize
+    disk_free = disk.f_bavail * disk.f_frsize
+    disk_used = (disk.f_blocks - disk.f_bfree) * disk.f_frsize
+    disk_usable = disk_used + disk_free
+    
+    return {
+        "memory_total": memory_total,
+        "memory_available": memory_available,
+        "memory_percent": round((memory_total - memory_available) / memory_total * 100, 1) if memory_total else 0,
+        "disk_total": disk_total,
+        "disk_free": disk_free,
+        "disk_percent": round(disk_used / disk_usable * 100, 1) if disk_usable else 0,
+    }
+
+
+def _read_boot_time():
+    """Boot time as a Unix timestamp, or None when it cannot be determined."""
+    try:
+        if sys.platform.startswith("linux"):
+            with open('/proc/stat', 'rb') as f:
+                for line in f:
+                    if line.startswith(b'btime'):
+                        return float(line.split()[1])
+        if HAS_PSUTIL:
+            return psutil.boot_time()
+    except Exception as e:
+        print(f"Error getting boot time: {e}")
+    return None
+
+
+# Fixed for the life of the process, so resolved once at import
 try:
-    import pkg_resources
-    HAS_PKG_RESOURCES = True
-except ImportError:
-    HAS_PKG_RESOURCES = False
-    print("Warning: pkg_resources not available. Package info will be limited.")
+    _PLATFORM = platform.platform()
+    _PROCESSOR = platform.processor() or "Unknown"
+except Exception as e:
+    print(f"Error getting basic system info: {e}")
+    _PLATFORM = _PROCESSOR = "Unknown"
+_PY_VERSION = platform.python_version()
+_BOOT_TIME = _read_boot_time()
+
+
+SYSTEM_INFO_TTL = 1.0
+_last_system_info = (0.0, None)
+# Single-flight guard: concurrent requests on a cache miss share one refresh
+_refresh_lock = asyncio.Lock()
+
+
+def _fresh_system_info():
+    """The cached sample if it is younger than SYSTEM_INFO_TTL, else None."""
+    sampled_at, cached = _last_system_info
+    if cached is not None and time.monotonic() - sampled_at < SYSTEM_INFO_TTL:
+        return cached
+    return None
+
+
+async def get_system_info_async():
+    """
+    Event-loop friendly get_system_info(): a fresh sample is returned directly,
+    otherwise one worker-thread refresh runs while other callers wait for it.
+    """
+    cached = _fresh_system_info()
+    if cached is not None:
+        return cached
+    async with _refresh_lock:
+        cached = _fresh_system_info()
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(get_system_info)
+
 
 def get_system_info():
     """
     Get system information for the dashboard with proper error handling.
     Returns fallback values if dependencies are missing.
+    The result is reused for SYSTEM_INFO_TTL seconds so polling tabs share it.
     """
+    global _last_system_info
+    cached = _fresh_system_info()
+    if cached is not None:
+        return cached
+    now = time.monotonic()
+    
     system_info = {
         "system": {
-            "os": "Unknown",
-            "processor": "Unknown",
-            "python_version": platform.python_version(),
-            "uptime": "Unknown"
+            "os": _PLATFORM,
+            "processor": _PROCESSOR,
+            "python_version": _PY_VERSION,
+            "uptime": "Unknown",
+            "uptime_head": "Unknown",
+            "uptime_tail": ""
         },
         "resources": {
             "cpu_percent": 0,
@@ -46,33 +176,37 @@ def get_system_info():
             "disk_free": 0,
             "disk_percent": 0
         },
-        "packages": []
+        "packages": list(_KEY_PACKAGES)
     }
     
-    # Basic system info that doesn't require psutil
-    try:
-        system_info["system"]["os"] = platform.platform()
-        system_info["system"]["processor"] = platform.processor() or "Unknown"
-    except Exception as e:
-        print(f"Error getting basic system info: {e}")
+    if _BOOT_TIME is not None:
+        _set_uptime(system_info["system"], _BOOT_TIME)
     
-    # Resource info that requires psutil
-    if HAS_PSUTIL:
+    # Resource info: straight from /proc on Linux, psutil elsewhere
+    fast = None
+    if sys.platform.startswith("linux"):
+        try:
+            fast = _read_system_fast()
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Could not read /proc system info, falling back to psutil: {e}")
+    
+    if fast is not None:
+        system_info["resources"].update(fast)
+        if HAS_PSUTIL:
+            try:
+                system_info["resources"]["cpu_percent"] = cpu_percent()
+            except Exception as e:
+                print(f"Error getting CPU usage: {e}")
+    elif HAS_PSUTIL:
         try:
-            # Uptime
-            boot_time = psutil.boot_time()
-            uptime = datetime.datetime.now() - datetime.datetime.fromtimestamp(boot_time)
-            uptime_str = f"{uptime.days} days, {uptime.seconds // 3600} hours, {(uptime.seconds // 60) % 60} minutes"
-            system_info["system"]["uptime"] = uptime_str
-            
             # Memory
             memory = psutil.virtual_memory()
             system_info["resources"]["memory_total"] = memory.total
             system_info["resources"]["memory_available"] = memory.available
             system_info["resources"]["memory_percent"] = memory.percent
             
-            # CPU
-            system_info["resources"]["cpu_percent"] = psutil.cpu_percent(interval=0.1)
+            # CPU (non-blocking: shared sample from stats.collector)
+            system_info["resources"]["cpu_percent"] = cpu_percent()
             
             # Disk
             try:
@@ -86,33 +220,12 @@ def get_system_info():
         except Exception as e:
             print(f"Error getting detailed system info: {e}")
     
-    # Package info that requires pkg_resources
-    if HAS_PKG_RESOURCES:
-        try:
-            key_packages = [
-                'fastapi', 'openai', 'chromadb', 'uvicorn', 'psycopg2', 'psycopg2-binary',
-                'pydantic', 'python-dotenv', 'websockets', 'requests', 'numpy', 'pandas'
-            ]
-            
-            installed_packages = []
-            for dist in pkg_resources.working_set:
-                if dist.key.lower() in [pkg.lower() for pkg in key_packages]:
-                    installed_packages.append((dist.key, dist.version))
-            
-            system_info["packages"] = sorted(installed_packages, key=lambda x: x[0].lower())
-        except Exception as e:
-            print(f"Error getting package info: {e}")
-    
+    _last_system_info = (now, system_info)
     return system_info
 
-def render_dashboard_html(system_info):
-    """
-    Render the HTML for the main dashboard.
-    Breaks down the large template into manageable sections.
-    """
-    # Common CSS
-    css = """
-    <style>
+# Static page fragments, built once at import instead of on every request.
+# CSS is served from /dashboard.css so browsers download it once.
+_CSS = """
         :root {
             --primary-color: #2563eb;
             --primary-light: rgba(37, 99, 235, 0.1);
@@ -448,179 +561,28 @@ def render_dashboard_html(system_info):
                 grid-template-columns: 1fr;
             }
         }
-    </style>
-    """
-    
-    # Create HTML head
-    head = f"""
+"""
+# Content hash in the stylesheet URL keeps the year-long cache safe across deploys
+_CSS_VERSION = hashlib.blake2b(_CSS.encode(), digest_size=6).hexdigest()
+
+_HEAD_HTML = f"""
     <!DOCTYPE html>
     <html lang="en">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>Mobeus Assistant — Admin Dashboard</title>
-        {css}
+        <link rel="stylesheet" href="./dashboard.css?v={_CSS_VERSION}">
     </head>
     """
-    
-    # Create dashboard metrics (safely handle potentially missing data)
-    cpu_percent = system_info.get("resources", {}).get("cpu_percent", 0)
-    memory_percent = system_info.get("resources", {}).get("memory_percent", 0)
-    memory_available = system_info.get("resources", {}).get("memory_available", 0)
-    disk_percent = system_info.get("resources", {}).get("disk_percent", 0)
-    disk_free = system_info.get("resources", {}).get("disk_free", 0)
-    
-    # Format memory and disk values
-    memory_available_gb = memory_available / (1024 * 1024 * 1024) if memory_available else 0
-    disk_free_gb = disk_free / (1024 * 1024 * 1024) if disk_free else 0
-    
-    # Create metrics HTML with proper error handling for missing data
-    metrics_html = f"""
-    <div class="dashboard-grid">
-        <div class="metric">
-            <div class="metric-header">
-                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                    <polyline points="22 12 18 12 15 21 9 3 6 12 2 12"></polyline>
-                </svg>
-                CPU Usage
-            </div>
-            <div class="metric-value">{cpu_percent}%</div>
-            <div class="progress-bar">
-                <div 
-                    class="progress-bar-fill {'good' if cpu_percent < 50 else 'warning' if cpu_percent < 80 else 'bad'}"
-                    style="width: {cpu_percent}%;"
-                ></div>
-            </div>
-        </div>
-        
-        <div class="metric">
-            <div class="metric-header">
-                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                    <rect x="1" y="4" width="22" height="16" rx="2" ry="2"></rect>
-                    <line x1="1" y1="10" x2="23" y2="10"></line>
-                </svg>
-                Memory Usage
-            </div>
-            <div class="metric-value">{memory_percent}%</div>
-            <div class="metric-description">
-                {memory_available_gb:.1f} GB available
-            </div>
-            <div class="progress-bar">
-                <div 
-                    class="progress-bar-fill {'good' if memory_percent < 60 else 'warning' if memory_percent < 85 else 'bad'}"
-                    style="width: {memory_percent}%;"
-                ></div>
-            </div>
-        </div>
-        
-        <div class="metric">
-            <div class="metric-header">
-                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                    <circle cx="12" cy="12" r="10"></circle>
-                    <polyline points="12 6 12 12 16 14"></polyline>
-                </svg>
-                System Uptime
-            </div>
-            <div class="metric-value">{system_info.get('system', {}).get('uptime', 'Unknown').split(',')[0]}</div>
-            <div class="metric-description">
-                {', '.join(system_info.get('system', {}).get('uptime', '').split(',')[1:]) if ',' in system_info.get('system', {}).get('uptime', '') else ''}
-            </div>
-        </div>
-        
-        <div class="metric">
-            <div class="metric-header">
-                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                    <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
-                    <polyline points="3.27 6.96 12 12.01 20.73 6.96"></polyline>
-                    <line x1="12" y1="22.08" x2="12" y2="12"></line>
-                </svg>
-                Disk Usage
-            </div>
-            <div class="metric-value">{disk_percent}%</div>
-            <div class="metric-description">
-                {disk_free_gb:.1f} GB free
-            </div>
-            <div class="progress-bar">
-                <div 
-                    class="progress-bar-fill {'good' if disk_percent < 70 else 'warning' if disk_percent < 90 else 'bad'}"
-                    style="width: {disk_percent}%;"
-                ></div>
-            </div>
-        </div>
-    </div>
-    """
-    
-    # Create system info display with error handling
-    sys_os = system_info.get("system", {}).get("os", "Unknown")
-    sys_processor = system_info.get("system", {}).get("processor", "Unknown")
-    sys_python = system_info.get("system", {}).get("python_version", "Unknown")
-    sys_uptime = system_info.get("system", {}).get("uptime", "Unknown")
-    memory_total = system_info.get("resources", {}).get("memory_total", 0) / (1024 * 1024 * 1024) if system_info.get("resources", {}).get("memory_total", 0) else 0
-    disk_total = system_info.get("resources", {}).get("disk_total", 0) / (1024 * 1024 * 1024) if system_info.get("resources", {}).get("disk_total", 0) else 0
-    
-    system_info_html = f"""
-    <div class="grid-2">
-        <div class="card" id="system-info">
-            <div class="card-header">
-                System Information
-            </div>
-            <div class="card-body">
-                <div class="system-info">
-                    <div class="system-info-label">Operating System</div>
-                    <div>{sys_os}</div>
-                    
-                    <div class="system-info-label">Processor</div>
-                    <div>{sys_processor}</div>
-                    
-                    <div class="system-info-label">Python Version</div>
-                    <div>{sys_python}</div>
-                    
-                    <div class="system-info-label">Memory</div>
-                    <div>{memory_total:.1f} GB Total</div>
-                    
-                    <div class="system-info-label">Disk</div>
-                    <div>{disk_total:.1f} GB Total</div>
-                    
-                    <div class="system-info-label">Uptime</div>
-                    <div>{sys_uptime}</div>
-                </div>
-            </div>
-        </div>
-    """
-    
-    # Create package list HTML
-    packages_html = """
-        <div class="card">
-            <div class="card-header">
-                Key Packages
-            </div>
-            <div class="card-body">
-                <div class="package-list">
-    """
-    
-    # Add package information with safe iteration
-    packages = system_info.get("packages", [])
-    for pkg in packages:
-        if len(pkg) >= 2:  # Ensure package tuple has at least two elements
-            package_name = pkg[0]
-            package_version = pkg[1]
-            packages_html += f"""
-                    <div class="package">
-                        <span class="package-name">{package_name}</span>
-                        <span class="package-version">{package_version}</span>
-                    </div>
-            """
-    
-    # Close package list divs
-    packages_html += """
-                </div>
-            </div>
-        </div>
-    </div>
-    """
-    
-    # Create dashboard links grid
-    dashboard_links = """
+
+# The card CTAs share one chevron <symbol> instead of repeating the inline SVG
+_DASHBOARD_LINKS = """
+    <svg xmlns="http://www.w3.org/2000/svg" aria-hidden="true" style="position: absolute; width: 0; height: 0; overflow: hidden;">
+        <symbol id="icon-chevron" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+            <polyline points="9 18 15 12 9 6"></polyline>
+        </symbol>
+    </svg>
     <h2>Admin Dashboards</h2>
     
     <div class="dashboard-grid">
@@ -638,9 +600,7 @@ def render_dashboard_html(system_info):
                 </div>
                 <div class="dashboard-card-cta">
                     Open Configuration
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <polyline points="9 18 15 12 9 6"></polyline>
-                    </svg>
+                    <svg width="16" height="16"><use href="#icon-chevron"></use></svg>
                 </div>
             </div>
         </a>
@@ -658,9 +618,7 @@ def render_dashboard_html(system_info):
                 </div>
                 <div class="dashboard-card-cta">
                     View Logs
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <polyline points="9 18 15 12 9 6"></polyline>
-                    </svg>
+                    <svg width="16" height="16"><use href="#icon-chevron"></use></svg>
                 </div>
             </div>
         </a>
@@ -686,9 +644,7 @@ def render_dashboard_html(system_info):
                 </div>
                 <div class="dashboard-card-cta">
                     View Tool Analytics
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <polyline points="9 18 15 12 9 6"></polyline>
-                    </svg>
+                    <svg width="16" height="16"><use href="#icon-chevron"></use></svg>
                 </div>
             </div>
         </a>
@@ -709,17 +665,14 @@ def render_dashboard_html(system_info):
                 </div>
                 <div class="dashboard-card-cta">
                     Manage Sessions
-                    <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="currentColor" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
-                        <polyline points="9 18 15 12 9 6"></polyline>
-                    </svg>
+                    <svg width="16" height="16"><use href="#icon-chevron"></use></svg>
                 </div>
             </div>
         </a>
     </div>
     """
-    
-    # Create the sidebar HTML
-    sidebar = """
+
+_SIDEBAR = """
     <div class="sidebar">
         <div class="sidebar-header">
             <div class="logo">
@@ -800,35 +753,272 @@ def render_dashboard_html(system_info):
         </div>
     </div>
     """
-    
-    # Create main content HTML
-    main_content = f"""
+
+
+# Everything but the values is compiled once at import; autoescape covers the
+# system and package strings, the static fragments go in as trusted markup
+_env = Environment(loader=BaseLoader(), autoescape=select_autoescape(["html"]))
+
+_PAGE_SRC = """
+    {{ head }}
+    <body>
+        {{ sidebar }}
+        
     <div class="main-content">
         <div class="header">
             <h1>Mobeus Assistant Admin Dashboard</h1>
         </div>
         
-        {metrics_html}
         
-        {dashboard_links}
+    <div class="dashboard-grid">
+        <div class="metric">
+            <div class="metric-header">
+                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                    <polyline points="22 12 18 12 15 21 9 3 6 12 2 12"></polyline>
+                </svg>
+                CPU Usage
+            </div>
+            <div class="metric-value">{{ cpu_percent }}%</div>
+            <div class="progress-bar">
+                <div 
+                    class="progress-bar-fill {{ cpu_class }}"
+                    style="width: {{ cpu_percent }}%;"
+                ></div>
+            </div>
+        </div>
+        
+        <div class="metric">
+            <div class="metric-header">
+                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                    <rect x="1" y="4" width="22" height="16" rx="2" ry="2"></rect>
+                    <line x1="1" y1="10" x2="23" y2="10"></line>
+                </svg>
+                Memory Usage
+            </div>
+            <div class="metric-value">{{ memory_percent }}%</div>
+            <div class="metric-description">
+                {{ '%.1f'|format(memory_available_gb) }} GB available
+            </div>
+            <div class="progress-bar">
+                <div 
+                    class="progress-bar-fill {{ memory_class }}"
+                    style="width: {{ memory_percent }}%;"
+                ></div>
+            </div>
+        </div>
         
-        {system_info_html}
+        <div class="metric">
+            <div class="metric-header">
+                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                    <circle cx="12" cy="12" r="10"></circle>
+                    <polyline points="12 6 12 12 16 14"></polyline>
+                </svg>
+                System Uptime
+            </div>
+            <div class="metric-value">{{ uptime_head }}</div>
+            <div class="metric-description">
+                {{ uptime_tail }}
+            </div>
+        </div>
         
-        {packages_html}
+        <div class="metric">
+            <div class="metric-header">
+                <svg xmlns="http://www.w3.org/2000/svg" width="16" height="16" viewBox="0 0 24 24" fill="none" stroke="#6b7280" stroke-width="2" stroke-linecap="round" stroke-linejoin="round">
+                    <path d="M21 16V8a2 2 0 0 0-1-1.73l-7-4a2 2 0 0 0-2 0l-7 4A2 2 0 0 0 3 8v8a2 2 0 0 0 1 1.73l7 4a2 2 0 0 0 2 0l7-4A2 2 0 0 0 21 16z"></path>
+                    <polyline points="3.27 6.96 12 12.01 20.73 6.96"></polyline>
+                    <line x1="12" y1="22.08" x2="12" y2="12"></line>
+                </svg>
+                Disk Usage
+            </div>
+            <div class="metric-value">{{ disk_percent }}%</div>
+            <div class="metric-description">
+                {{ '%.1f'|format(disk_free_gb) }} GB free
+            </div>
+            <div class="progress-bar">
+                <div 
+                    class="progress-bar-fill {{ disk_class }}"
+                    style="width: {{ disk_percent }}%;"
+                ></div>
+            </div>
+        </div>
+    </div>
+        
+        {{ dashboard_links }}
+        
+        
+    <div class="grid-2">
+        <div class="card" id="system-info">
+            <div class="card-header">
+                System Information
+            </div>
+            <div class="card-body">
+                <div class="system-info">
+                    <div class="system-info-label">Operating System</div>
+                    <div>{{ sys_os }}</div>
+                    
+                    <div class="system-info-label">Processor</div>
+                    <div>{{ sys_processor }}</div>
+                    
+                    <div class="system-info-label">Python Version</div>
+                    <div>{{ sys_python }}</div>
+                    
+                    <div class="system-info-label">Memory</div>
+                    <div>{{ '%.1f'|format(memory_total) }} GB Total</div>
+                    
+                    <div class="system-info-label">Disk</div>
+                    <div>{{ '%.1f'|format(disk_total) }} GB Total</div>
+                    
+                    <div class="system-info-label">Uptime</div>
+                    <div>{{ sys_uptime }}</div>
+                </div>
+            </div>
+        </div>
+    
+        
+        <div class="card">
+            <div class="card-header">
+                Key Packages
+            </div>
+            <div class="card-body">
+                <div class="package-list">
+    {% for pkg in packages if pkg|length >= 2 %}
+                    <div class="package">
+                        <span class="package-name">{{ pkg[0] }}</span>
+                        <span class="package-version">{{ pkg[1] }}</span>
+                    </div>
+            {% endfor %}
+                </div>
+            </div>
+        </div>
+    </div>
+    
     </div>
-    """
     
-    # Combine all HTML parts
-    full_html = f"""
-    {head}
-    <body>
-        {sidebar}
-        {main_content}
     </body>
     </html>
     """
+
+
+
+def _minify(markup):
+    """Drop source indentation; a newline is still whitespace to the browser."""
+    return re.sub(r"\n\s*", "\n", markup).strip()
+
+
+_PAGE_TPL = _env.from_string(_minify(_PAGE_SRC), globals={
+    "head": Markup(_minify(_HEAD_HTML)),
+    "sidebar": Markup(_minify(_SIDEBAR)),
+    "dashboard_links": Markup(_minify(_DASHBOARD_LINKS)),
+})
+
+_GB = 1073741824  # 1024 ** 3
+
+# Progress-bar class per whole percent (0-100), indexed instead of re-comparing
+_CPU_CLASSES = ('good',) * 50 + ('warning',) * 30 + ('bad',) * 21
+_MEMORY_CLASSES = ('good',) * 60 + ('warning',) * 25 + ('bad',) * 16
+_DISK_CLASSES = ('good',) * 70 + ('warning',) * 20 + ('bad',) * 11
+
+
+def _level_class(classes, percent):
+    return classes[min(max(int(percent), 0), 100)]
+
+
+def render_dashboard_html(system_info):
+    """
+    Render the HTML for the main dashboard.
+    Only the values are computed here; the page itself is the precompiled _PAGE_TPL.
+    """
+    # Look every value up once (safely handle potentially missing data)
+    resources = system_info.get("resources", {})
+    system = system_info.get("system", {})
+    cpu_percent = resources.get("cpu_percent", 0)
+    memory_percent = resources.get("memory_percent", 0)
+    disk_percent = resources.get("disk_percent", 0)
+    sys_os = system.get("os", "Unknown")
+    sys_processor = system.get("processor", "Unknown")
+    sys_python = system.get("python_version", "Unknown")
+    sys_uptime = system.get("uptime", "Unknown")
     
-    return full_html
+    # Format memory and disk values
+    memory_available_gb = (resources.get("memory_available") or 0) / _GB
+    disk_free_gb = (resources.get("disk_free") or 0) / _GB
+    memory_total = (resources.get("memory_total") or 0) / _GB
+    disk_total = (resources.get("disk_total") or 0) / _GB
+    
+    return _PAGE_TPL.render(
+        cpu_percent=cpu_percent,
+        cpu_class=_level_class(_CPU_CLASSES, cpu_percent),
+        memory_percent=memory_percent,
+        memory_available_gb=memory_available_gb,
+        memory_class=_level_class(_MEMORY_CLASSES, memory_percent),
+        uptime_head=system.get("uptime_head", "Unknown"),
+        uptime_tail=system.get("uptime_tail", ""),
+        disk_percent=disk_percent,
+        disk_free_gb=disk_free_gb,
+        disk_class=_level_class(_DISK_CLASSES, disk_percent),
+        sys_os=sys_os,
+        sys_processor=sys_processor,
+        sys_python=sys_python,
+        sys_uptime=sys_uptime,
+        memory_total=memory_total,
+        disk_total=disk_total,
+        packages=system_info.get("packages", []),
+    )
+
+
+# Last rendered page, its ETag and (once asked for) its gzip body, keyed on
+# the system_info sample it was built from. get_system_info() hands out the
+# same dict for SYSTEM_INFO_TTL seconds, so polls inside that window reuse
+# the already encoded and compressed bytes.
+_last_page = (None, b"", "", None)
+
+
+def _render_page_bytes(system_info):
+    global _last_page
+    rendered_for, page, etag, _ = _last_page
+    if rendered_for is not system_info:
+        page = render_dashboard_html(system_info).encode("utf-8")
+        etag = '"' + hashlib.blake2b(page, digest_size=8).hexdigest() + '"'
+        _last_page = (system_info, page, etag, None)
+    return page, etag
+
+
+def _gzip_page_bytes(system_info):
+    """Gzipped page and its ETag, compressed once per sample."""
+    global _last_page
+    page, etag = _render_page_bytes(system_info)
+    rendered_for, _, _, compressed = _last_page
+    if compressed is None:
+        compressed = gzip.compress(page, compresslevel=9)
+        _last_page = (rendered_for, page, etag, compressed)
+    return compressed, etag[:-1] + '-gzip"'
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip: an explicit gzip entry, else "*", with q > 0."""
+    qvalues = {}
+    for part in accept_encoding.split(","):
+        coding, *params = part.split(";")
+        q = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding.strip().lower()] = q
+    return qvalues.get("gzip", qvalues.get("*", 0.0)) > 0
+
+
+@router.get("/dashboard.css")
+async def get_dashboard_css():
+    """Static stylesheet for the main dashboard."""
+    return Response(
+        content=_CSS,
+        media_type="text/css",
+        headers={"Cache-Control": "public, max-age=31536000, immutable"},
+    )
 
 
 @router.get("/", response_class=HTMLResponse)
@@ -837,13 +1027,21 @@ async def main_dashboard(request: Request):
     Main dashboard that integrates all individual dashboards.
     """
     try:
-        # Get system information with proper error handling
-        system_info = get_system_info()
-        
-        # Render HTML with all the components
-        html = render_dashboard_html(system_info)
+        # Get system information with proper error handling; the psutil
+        # calls run in a worker thread so the event loop stays free
+        system_info = await get_system_info_async()
         
-        return HTMLResponse(content=html)
+        # Render HTML with all the components; unchanged pages revalidate as 304.
+        # Compressed here once per sample, so the gzip middleware passes it through
+        if _accepts_gzip(request.headers.get("accept-encoding", "")):
+            page, etag = _gzip_page_bytes(system_info)
+            headers = {"ETag": etag, "Content-Encoding": "gzip", "Vary": "Accept-Encoding"}
+        else:
+            page, etag = _render_page_bytes(system_info)
+            headers = {"ETag": etag, "Vary": "Accept-Encoding"}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers={"ETag": etag, "Vary": "Accept-Encoding"})
+        return HTMLResponse(content=page, headers=headers)
     except Exception as e:
         # Provide a simple fallback in case of error
         error_html = f"""
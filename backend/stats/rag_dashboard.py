@@ -3,10 +3,12 @@ import os
 import json
 import datetime
 import statistics
+from collections import Counter
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Request, Query
 from fastapi.responses import HTMLResponse, JSONResponse
 from config import DEBUG_LOG_PATH
+from stats.collector import tail_lines
 
 router = APIRouter()
 
@@ -22,20 +24,19 @@ def get_rag_performance_data(limit: int = 100, filter_query: Optional[str] = Non
         Dictionary of RAG performance metrics
     """
     entries = []
+    query_lower = filter_query.lower() if filter_query else None
     
     try:
         if not os.path.exists(DEBUG_LOG_PATH):
             return {"error": "Debug log file not found", "entries": []}
             
-        with open(DEBUG_LOG_PATH, "r") as f:
-            lines = f.readlines()
-            
-        for line in reversed(lines):
+        # Newest-first straight from the file tail; stops once `limit` entries are found
+        for line in tail_lines(DEBUG_LOG_PATH):
             try:
                 entry = json.loads(line)
                 
                 # Apply filter if provided
-                if filter_query and filter_query.lower() not in entry.get("query", "").lower():
+                if query_lower and query_lower not in entry.get("query", "").lower():
                     continue
                 
                 entries.append(entry)
@@ -58,7 +59,7 @@ def get_rag_performance_data(limit: int = 100, filter_query: Optional[str] = Non
     # Calculate metrics for retrieved chunks
     chunk_counts = []
     chunk_scores = []
-    source_frequency = {}
+    source_frequency: Counter = Counter()
     
     for entry in entries:
         chunks = entry.get("top_chunks", [])
@@ -71,7 +72,7 @@ def get_rag_performance_data(limit: int = 100, filter_query: Optional[str] = Non
             
             # Count sources
             source = chunk.get("source", "unknown")
-            source_frequency[source] = source_frequency.get(source, 0) + 1
+            source_frequency[source] += 1
     
     # Calculate average chunks per query
     avg_chunks = sum(chunk_counts) / total_entries if chunk_counts else 0
@@ -87,7 +88,7 @@ def get_rag_performance_data(limit: int = 100, filter_query: Optional[str] = Non
         }
     
     # Sort sources by frequency
-    top_sources = sorted(source_frequency.items(), key=lambda x: x[1], reverse=True)[:10]
+    top_sources = source_frequency.most_common(10)
     
     return {
         "entries": entries,
@@ -144,26 +145,27 @@ def analyze_source_relevance(entries):
         elif "?" in query:
             query_type = "question"
         
-        if query_type not in query_source_map:
-            query_source_map[query_type] = {}
+        type_sources = query_source_map.setdefault(query_type, {})
         
         for chunk in chunks:
             source = chunk.get("source", "unknown")
             score = chunk.get("score", 0)
             
-            if source not in query_source_map[query_type]:
-                query_source_map[query_type][source] = {
+            # One lookup per chunk; the stats dict is then updated through a local
+            data = type_sources.get(source)
+            if data is None:
+                data = type_sources[source] = {
                     "count": 0,
                     "total_score": 0,
                     "example_queries": []
                 }
             
-            query_source_map[query_type][source]["count"] += 1
-            query_source_map[query_type][source]["total_score"] += score
+            data["count"] += 1
+            data["total_score"] += score
             
             # Store a few example queries for each source
-            if len(query_source_map[query_type][source]["example_queries"]) < 3:
-                query_source_map[query_type][source]["example_queries"].append(query)
+            if len(data["example_queries"]) < 3:
+                data["example_queries"].append(query)
     
     # Calculate average score for each source per query type
     for query_type, sources in query_source_map.items():
@@ -11,6 +11,7 @@ from memory.db import get_connection, execute_db_operation
 from pydantic import BaseModel
 from config import runtime_config
 from config import LOG_DIR
+from stats.collector import tail_lines
 
 router = APIRouter()
 
@@ -218,23 +219,27 @@ def get_comprehensive_final_prompt_fixed(uuid: str) -> Dict[str, Any]:
         prompts_log = os.path.join(LOG_DIR, "actual_prompts.jsonl")
         if os.path.exists(prompts_log):
             print(f"🔍 Checking prompts log file for {uuid}")
-            with open(prompts_log, "r") as f:
-                for line in reversed(f.readlines()):
-                    try:
-                        entry = json.loads(line)
-                        if entry.get("user_uuid") == uuid:
-                            print(f"✅ Found prompt in log file: {len(entry.get('final_prompt', ''))} chars")
-                            return {
-                                "final_prompt": entry.get("final_prompt", ""),
-                                "source": "LOGFILE_FALLBACK",
-                                "prompt_length": entry.get("prompt_length", 0),
-                                "estimated_tokens": entry.get("estimated_tokens", 0),
-                                "strategy": entry.get("strategy", "auto"),
-                                "model": entry.get("model", "unknown"),
-                                "timestamp": entry.get("timestamp", "")
-                            }
-                    except:
-                        continue
+            # Newest-first from the file tail; lines without the UUID are never parsed
+            plain = uuid.isascii() and uuid.isprintable() and '"' not in uuid and "\\" not in uuid
+            needle = uuid.encode() if plain else b""
+            for line in tail_lines(prompts_log):
+                if needle not in line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                    if entry.get("user_uuid") == uuid:
+                        print(f"✅ Found prompt in log file: {len(entry.get('final_prompt', ''))} chars")
+                        return {
+                            "final_prompt": entry.get("final_prompt", ""),
+                            "source": "LOGFILE_FALLBACK",
+                            "prompt_length": entry.get("prompt_length", 0),
+                            "estimated_tokens": entry.get("estimated_tokens", 0),
+                            "strategy": entry.get("strategy", "auto"),
+                            "model": entry.get("model", "unknown"),
+                            "timestamp": entry.get("timestamp", "")
+                        }
+                except:
+                    continue
     except Exception as e:
         print(f"⚠️ Error checking log file: {e}")
     
@@ -1,25 +1,33 @@
 # Enhanced tools_dashboard.py with Strategy Control
 import os
 import json
+import asyncio
 import datetime
+from functools import lru_cache
+from html import escape
+from string import Template
 from typing import List, Dict, Any, Optional
 from fastapi import APIRouter, Request, Query
-from fastapi.responses import HTMLResponse, JSONResponse
+from fastapi.responses import HTMLResponse, JSONResponse, Response, StreamingResponse
 from config import DEBUG_LOG_PATH
 from config import LOG_DIR
-from stats.collector import TOOL_STRATEGIES
-
-
-router = APIRouter()
-
-
 from stats.collector import (
+    TOOL_STRATEGIES,
     get_function_calls,
+    get_function_calls_with_analysis,
     get_strategy_changes,
     generate_sample_function_calls,
     analyze_function_calls,
+    json_dumps,
+    json_dumps_bytes,
 )
 
+router = APIRouter()
+
+def _dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize dashboard data to a JSON string; log entries may carry non-str keys."""
+    return json_dumps(obj, indent=indent, non_str_keys=True)
+
 @router.get("/tools", response_class=HTMLResponse)
 async def tools_dashboard(
     request: Request,
@@ -28,59 +36,46 @@ async def tools_dashboard(
 ):
     """Enhanced Tool/Function Calling Dashboard with Strategy Control."""
     
-    function_calls = get_function_calls(limit=limit, filter_query=filter)
-    strategy_changes = get_strategy_changes(limit=20)
-    analysis = analyze_function_calls(function_calls)
+    # Blocking log reads run in worker threads, both logs at once
+    (function_calls, analysis), strategy_changes = await asyncio.gather(
+        asyncio.to_thread(get_function_calls_with_analysis, limit, filter),
+        asyncio.to_thread(get_strategy_changes, 20),
+    )
     
-    # Convert data to JSON for JavaScript
-    data_json = json.dumps({
+    # Convert data to JSON for JavaScript; "<" is escaped so log text can't close the <script>
+    data_json = _dumps({
         "function_calls": function_calls,
         "strategy_changes": strategy_changes,
         "analysis": analysis,
         "strategies": TOOL_STRATEGIES
-    })
+    }).replace("<", "\\u003c")
 
-    table_rows = []
-    for call in function_calls:
-        strategy = call.get('strategy', 'auto')
-        strategy_info = TOOL_STRATEGIES.get(strategy, {'color': 'gray', 'label': strategy})
+    head = _PAGE_HEAD_TEMPLATE.substitute(
+        total_calls=analysis["total_calls"],
+        success_class=(
+            'good' if analysis["success_rate"] >= 95 else
+            'warning' if analysis["success_rate"] >= 80 else
+            'bad'
+        ),
+        success_rate=f'{analysis["success_rate"]:.1f}',
+        avg_execution_ms=f'{analysis["avg_execution_time"] * 1000:.1f}',
+        unique_tools=len(analysis["function_frequency"]),
+        call_count=len(function_calls),
+    )
+    tail = _PAGE_TAIL_TEMPLATE.substitute(data_json=data_json)
     
-        table_rows.append(f"""
-        <tr>
-            <td>{call.get("timestamp", "")}</td>
-            <td>
-                <span class="strategy-badge {strategy_info['color']}">
-                    {strategy_info['label']}
-                </span>
-            </td>
-            <td>{call.get("function_name", "")}</td>
-            <td>
-                <span class="status-badge {'status-success' if call.get('success', False) else 'status-error'}">
-                    {'Success' if call.get('success', False) else 'Error'}
-                </span>
-            </td>
-            <td>{f"{call.get('execution_time', 0) * 1000:.1f}ms" if call.get('execution_time') is not None else "N/A"}</td>
-            <td>
-                <details>
-                    <summary>View Details</summary>
-                    <div>
-                        <h3>Query</h3>
-                        <p>{call.get("query", "")}</p>
-                    
-                        <h3>Arguments</h3>
-                        <div class="code-block">{json.dumps(call.get("arguments", {}), indent=2)}</div>
-                    
-                        <h3>Result</h3>
-                        <div class="code-block">{json.dumps(call.get("result", {}), indent=2)}</div>
-                    </div>
-                </details>
-            </td>
-        </tr>
-        """)
-
-    table_rows_html = "".join(table_rows)    
+    # Stream the page: the head goes out before any row is rendered
+    def render():
+        yield head
+        for call in function_calls:
+            yield _render_row(call)
+        yield tail
     
-    html = f"""
+    return StreamingResponse(render(), media_type="text/html")
+
+# Static page shell, built once at import; string.Template needs no brace doubling
+# for the CSS/JS, only "$$" for literal dollars in the JS template strings
+_PAGE_SRC = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -89,7 +84,7 @@ async def tools_dashboard(
         <title>Mobeus Assistant — Tool Control Dashboard</title>
         <script src="https://cdn.jsdelivr.net/npm/chart.js@3.7.1/dist/chart.min.js"></script>
         <style>
-            :root {{
+            :root {
                 --primary-color: #2563eb;
                 --primary-light: rgba(37, 99, 235, 0.1);
                 --secondary-color: #1e40af;
@@ -101,104 +96,104 @@ async def tools_dashboard(
                 --warning-color: #f59e0b;
                 --bad-color: #ef4444;
                 --code-bg: #f3f4f6;
-            }}
+            }
             
-            * {{
+            * {
                 box-sizing: border-box;
                 margin: 0;
                 padding: 0;
-            }}
+            }
             
-            body {{
+            body {
                 font-family: -apple-system, BlinkMacSystemFont, "Segoe UI", Roboto, "Helvetica Neue", Arial, sans-serif;
                 background-color: var(--background-color);
                 color: var(--text-color);
                 line-height: 1.5;
-            }}
+            }
             
-            .dashboard {{
+            .dashboard {
                 max-width: 1400px;
                 margin: 0 auto;
                 padding: 1.5rem;
-            }}
+            }
             
-            .header {{
+            .header {
                 display: flex;
                 justify-content: space-between;
                 align-items: center;
                 margin-bottom: 1.5rem;
-            }}
+            }
             
-            h1, h2, h3 {{
+            h1, h2, h3 {
                 font-weight: 600;
-            }}
+            }
             
-            h1 {{
+            h1 {
                 font-size: 1.5rem;
-            }}
+            }
             
-            h2 {{
+            h2 {
                 font-size: 1.25rem;
                 margin-bottom: 1rem;
-            }}
+            }
             
-            .breadcrumb {{
+            .breadcrumb {
                 display: flex;
                 align-items: center;
                 gap: 0.5rem;
                 font-size: 0.875rem;
                 margin-bottom: 1rem;
-            }}
+            }
             
-            .breadcrumb a {{
+            .breadcrumb a {
                 color: var(--primary-color);
                 text-decoration: none;
-            }}
+            }
             
-            .breadcrumb span {{
+            .breadcrumb span {
                 color: #6b7280;
-            }}
+            }
             
-            .card {{
+            .card {
                 background-color: var(--card-color);
                 border-radius: 0.5rem;
                 box-shadow: 0 1px 3px rgba(0, 0, 0, 0.1);
                 overflow: hidden;
                 margin-bottom: 1.5rem;
-            }}
+            }
             
-            .card-header {{
+            .card-header {
                 padding: 1rem;
                 border-bottom: 1px solid var(--border-color);
                 font-weight: 600;
                 display: flex;
                 justify-content: space-between;
                 align-items: center;
-            }}
+            }
             
-            .card-body {{
+            .card-body {
                 padding: 1rem;
-            }}
+            }
             
             /* Strategy Control Styles */
-            .strategy-controls {{
+            .strategy-controls {
                 display: flex;
                 align-items: center;
                 gap: 1rem;
                 margin-bottom: 1.5rem;
-            }}
+            }
             
-            .strategy-selector {{
+            .strategy-selector {
                 display: flex;
                 align-items: center;
                 gap: 0.5rem;
-            }}
+            }
             
-            .strategy-dropdown {{
+            .strategy-dropdown {
                 position: relative;
-            }}
+            }
             
-            .strategy-button {{
+            .strategy-button {
                 display: flex;
                 align-items: center;
                 gap: 0.5rem;
@@ -209,13 +204,13 @@ async def tools_dashboard(
                 cursor: pointer;
                 transition: all 0.2s;
                 font-size: 0.875rem;
-            }}
+            }
             
-            .strategy-button:hover {{
+            .strategy-button:hover {
                 background-color: #f9fafb;
-            }}
+            }
             
-            .strategy-badge {{
+            .strategy-badge {
                 display: inline-flex;
                 align-items: center;
                 gap: 0.25rem;
@@ -223,15 +218,15 @@ async def tools_dashboard(
                 border-radius: 0.375rem;
                 font-size: 0.75rem;
                 font-weight: 500;
-            }}
+            }
             
-            .strategy-badge.blue {{ background-color: rgba(37, 99, 235, 0.1); color: #2563eb; }}
-            .strategy-badge.green {{ background-color: rgba(16, 185, 129, 0.1); color: #10b981; }}
-            .strategy-badge.purple {{ background-color: rgba(139, 92, 246, 0.1); color: #8b5cf6; }}
-            .strategy-badge.gray {{ background-color: rgba(107, 114, 128, 0.1); color: #6b7280; }}
-            .strategy-badge.red {{ background-color: rgba(239, 68, 68, 0.1); color: #ef4444; }}
+            .strategy-badge.blue { background-color: rgba(37, 99, 235, 0.1); color: #2563eb; }
+            .strategy-badge.green { background-color: rgba(16, 185, 129, 0.1); color: #10b981; }
+            .strategy-badge.purple { background-color: rgba(139, 92, 246, 0.1); color: #8b5cf6; }
+            .strategy-badge.gray { background-color: rgba(107, 114, 128, 0.1); color: #6b7280; }
+            .strategy-badge.red { background-color: rgba(239, 68, 68, 0.1); color: #ef4444; }
             
-            .strategy-menu {{
+            .strategy-menu {
                 position: fixed;
                 background-color: var(--card-color);
                 border: 1px solid var(--border-color);
@@ -241,42 +236,42 @@ async def tools_dashboard(
                 display: none;
                 min-width: 300px;
                 max-width: 400px;
-            }}
+            }
             
-            .strategy-menu.show {{
+            .strategy-menu.show {
                 display: block;
-            }}
+            }
             
-            .strategy-option {{
+            .strategy-option {
                 padding: 0.75rem;
                 cursor: pointer;
                 border-bottom: 1px solid var(--border-color);
                 transition: background-color 0.2s;
-            }}
+            }
             
-            .strategy-option:last-child {{
+            .strategy-option:last-child {
                 border-bottom: none;
-            }}
+            }
             
-            .strategy-option:hover {{
+            .strategy-option:hover {
                 background-color: #f9fafb;
-            }}
+            }
             
-            .strategy-option.active {{
+            .strategy-option.active {
                 background-color: var(--primary-light);
-            }}
+            }
             
-            .strategy-title {{
+            .strategy-title {
                 font-weight: 500;
                 margin-bottom: 0.25rem;
-            }}
+            }
             
-            .strategy-description {{
+            .strategy-description {
                 font-size: 0.75rem;
                 color: #6b7280;
-            }}
+            }
             
-            .current-strategy {{
+            .current-strategy {
                 display: flex;
                 align-items: center;
                 gap: 0.5rem;
@@ -284,103 +279,103 @@ async def tools_dashboard(
                 background-color: var(--primary-light);
                 border-radius: 0.375rem;
                 font-size: 0.875rem;
-            }}
+            }
             
-            .status-indicator {{
+            .status-indicator {
                 width: 8px;
                 height: 8px;
                 border-radius: 50%;
                 background-color: var(--good-color);
                 animation: pulse 2s infinite;
-            }}
+            }
             
-            @keyframes pulse {{
-                0%, 100% {{ opacity: 1; }}
-                50% {{ opacity: 0.5; }}
-            }}
+            @keyframes pulse {
+                0%, 100% { opacity: 1; }
+                50% { opacity: 0.5; }
+            }
             
             /* Rest of existing styles */
-            .metrics-grid {{
+            .metrics-grid {
                 display: grid;
                 grid-template-columns: repeat(auto-fill, minmax(200px, 1fr));
                 gap: 1rem;
                 margin-bottom: 1.5rem;
-            }}
+            }
             
-            .metric {{
+            .metric {
                 background-color: #f9fafb;
                 border-radius: 0.5rem;
                 padding: 1rem;
                 text-align: center;
-            }}
+            }
             
-            .metric-value {{
+            .metric-value {
                 font-size: 1.5rem;
                 font-weight: 600;
                 margin-bottom: 0.25rem;
-            }}
+            }
             
-            .metric-label {{
+            .metric-label {
                 font-size: 0.75rem;
                 color: #6b7280;
                 text-transform: uppercase;
                 letter-spacing: 0.05em;
-            }}
+            }
             
-            .grid-layout {{
+            .grid-layout {
                 display: grid;
                 grid-template-columns: repeat(auto-fit, minmax(400px, 1fr));
                 gap: 1.5rem;
-            }}
+            }
             
-            .chart-container {{
+            .chart-container {
                 height: 300px;
                 margin-bottom: 1.5rem;
-            }}
+            }
             
-            .table-container {{
+            .table-container {
                 overflow-x: auto;
-            }}
+            }
             
-            table {{
+            table {
                 width: 100%;
                 border-collapse: collapse;
-            }}
+            }
             
-            th, td {{
+            th, td {
                 text-align: left;
                 padding: 0.75rem 1rem;
                 border-bottom: 1px solid var(--border-color);
-            }}
+            }
             
-            th {{
+            th {
                 background-color: #f9fafb;
                 font-weight: 500;
-            }}
+            }
             
-            tr:hover {{
+            tr:hover {
                 background-color: #f9fafb;
-            }}
+            }
             
-            .status-badge {{
+            .status-badge {
                 display: inline-block;
                 padding: 0.25rem 0.5rem;
                 border-radius: 9999px;
                 font-size: 0.75rem;
                 font-weight: 500;
-            }}
+            }
             
-            .status-success {{
+            .status-success {
                 background-color: rgba(16, 185, 129, 0.1);
                 color: #10b981;
-            }}
+            }
             
-            .status-error {{
+            .status-error {
                 background-color: rgba(239, 68, 68, 0.1);
                 color: #ef4444;
-            }}
+            }
             
-            .code-block {{
+            .code-block {
                 background-color: var(--code-bg);
                 border-radius: 0.375rem;
                 padding: 0.75rem;
@@ -390,32 +385,32 @@ async def tools_dashboard(
                 overflow-wrap: break-word;
                 max-height: 200px;
                 overflow-y: auto;
-            }}
+            }
             
-            .good {{ color: var(--good-color); }}
-            .warning {{ color: var(--warning-color); }}
-            .bad {{ color: var(--bad-color); }}
+            .good { color: var(--good-color); }
+            .warning { color: var(--warning-color); }
+            .bad { color: var(--bad-color); }
             
-            details {{
+            details {
                 margin-top: 0.5rem;
-            }}
+            }
             
-            summary {{
+            summary {
                 cursor: pointer;
                 margin-bottom: 0.5rem;
                 font-weight: 500;
-            }}
+            }
             
-            @media (max-width: 768px) {{
-                .strategy-controls {{
+            @media (max-width: 768px) {
+                .strategy-controls {
                     flex-direction: column;
                     align-items: stretch;
-                }}
+                }
                 
-                .grid-layout {{
+                .grid-layout {
                     grid-template-columns: 1fr;
-                }}
-            }}
+                }
+            }
         </style>
     </head>
     <body>
@@ -471,23 +466,19 @@ async def tools_dashboard(
                 <div class="card-body">
                     <div class="metrics-grid">
                         <div class="metric">
-                            <div class="metric-value">{analysis["total_calls"]}</div>
+                            <div class="metric-value">$total_calls</div>
                             <div class="metric-label">Total Tool Calls</div>
                         </div>
                         <div class="metric">
-                            <div class="metric-value {
-                                'good' if analysis["success_rate"] >= 95 else
-                                'warning' if analysis["success_rate"] >= 80 else
-                                'bad'
-                            }">{analysis["success_rate"]:.1f}%</div>
+                            <div class="metric-value $success_class">$success_rate%</div>
                             <div class="metric-label">Success Rate</div>
                         </div>
                         <div class="metric">
-                            <div class="metric-value">{analysis["avg_execution_time"] * 1000:.1f}ms</div>
+                            <div class="metric-value">${avg_execution_ms}ms</div>
                             <div class="metric-label">Avg Execution Time</div>
                         </div>
                         <div class="metric">
-                            <div class="metric-value">{len(analysis["function_frequency"])}</div>
+                            <div class="metric-value">$unique_tools</div>
                             <div class="metric-label">Unique Tools Used</div>
                         </div>
                     </div>
@@ -521,7 +512,7 @@ async def tools_dashboard(
             <div class="card">
                 <div class="card-header">
                     Recent Tool Calls
-                    <span>{len(function_calls)} calls</span>
+                    <span>$call_count calls</span>
                 </div>
                 <div class="card-body">
                     <div class="table-container">
@@ -537,7 +528,7 @@ async def tools_dashboard(
                                 </tr>
                             </thead>
                             <tbody>
-                                {table_rows_html}
+                                $table_rows
                             </tbody>
                         </table>
                     </div>
@@ -548,7 +539,7 @@ async def tools_dashboard(
 
         <script>
         // Parse dashboard data
-        const dashboardData = {data_json};
+        const dashboardData = $data_json;
         let currentStrategy = 'auto';
 
         // WebSocket connection for real-time updates
@@ -556,52 +547,52 @@ async def tools_dashboard(
         let isConnected = false;
 
         // Initialize dashboard WebSocket connection
-        function initializeDashboardWebSocket() {{
+        function initializeDashboardWebSocket() {
             const protocol = window.location.protocol === 'https:' ? 'wss:' : 'ws:';
-            const wsUrl = `${{protocol}}//${{window.location.host}}/chat/admin/dashboard`;
+            const wsUrl = `$${protocol}//$${window.location.host}/chat/admin/dashboard`;
     
             console.log('🔗 Connecting dashboard WebSocket:', wsUrl);
     
             dashboardSocket = new WebSocket(wsUrl);
     
-            dashboardSocket.onopen = function(event) {{
+            dashboardSocket.onopen = function(event) {
                 console.log('✅ Dashboard WebSocket connected');
                 isConnected = true;
                 updateConnectionStatus(true);
-            }};
+            };
     
-            dashboardSocket.onmessage = function(event) {{
+            dashboardSocket.onmessage = function(event) {
                 const data = JSON.parse(event.data);
                 handleWebSocketMessage(data);
-            }};
+            };
     
-            dashboardSocket.onclose = function(event) {{
+            dashboardSocket.onclose = function(event) {
                 console.log('🔌 Dashboard WebSocket disconnected');
                 isConnected = false;
                 updateConnectionStatus(false);
         
                 // Attempt to reconnect after 3 seconds
                 setTimeout(initializeDashboardWebSocket, 3000);
-            }};
+            };
     
-            dashboardSocket.onerror = function(error) {{
+            dashboardSocket.onerror = function(error) {
                 console.error('❌ Dashboard WebSocket error:', error);
                 isConnected = false;
                 updateConnectionStatus(false);
-            }};
-        }}
+            };
+        }
 
         // Handle WebSocket messages
-        function handleWebSocketMessage(data) {{
+        function handleWebSocketMessage(data) {
             console.log('📨 Dashboard received:', data.type, data);
     
-            switch(data.type) {{
+            switch(data.type) {
                 case 'session_status':
                     updateSessionStatus(data);
                     break;
             
                 case 'session_connected':
-                    showNotification(`New voice session connected (Strategy: ${{data.strategy}})`, 'success');
+                    showNotification(`New voice session connected (Strategy: $${data.strategy})`, 'success');
                     updateSessionCount(data.total_sessions);
                     break;
             
@@ -611,67 +602,67 @@ async def tools_dashboard(
                     break;
             
                 case 'broadcast_confirmed':
-                    showNotification(`Strategy broadcast successful! ${{data.sessions_updated}} sessions updated to '${{data.strategy}}'`, 'success');
+                    showNotification(`Strategy broadcast successful! $${data.sessions_updated} sessions updated to '$${data.strategy}'`, 'success');
                     break;
             
                 case 'strategy_broadcast_completed':
-                    if (data.sessions_updated > 0) {{
-                        showNotification(`${{data.sessions_updated}} voice sessions updated to '${{data.new_strategy}}'`, 'success');
-                    }}
+                    if (data.sessions_updated > 0) {
+                        showNotification(`$${data.sessions_updated} voice sessions updated to '$${data.new_strategy}'`, 'success');
+                    }
                     break;
             
                 default:
                     console.log('📨 Unhandled message type:', data.type);
-            }}
-        }}
+            }
+        }
 
         // Update connection status indicator
-        function updateConnectionStatus(connected) {{
+        function updateConnectionStatus(connected) {
             const indicator = document.getElementById('connection-status');
-            if (indicator) {{
+            if (indicator) {
                 indicator.style.backgroundColor = connected ? '#10b981' : '#ef4444';
                 indicator.title = connected ? 'Connected to live sessions' : 'Disconnected';
-            }}
-        }}
+            }
+        }
 
         // Update session count display
-        function updateSessionCount(count) {{
+        function updateSessionCount(count) {
             const statusElement = document.getElementById('current-strategy-info');
-            if (statusElement) {{
+            if (statusElement) {
                 statusElement.innerHTML = `
                     <div class="status-indicator"></div>
-                    <span>${{count}} active voice session${{count !== 1 ? 's' : ''}}</span>
+                    <span>$${count} active voice session$${count !== 1 ? 's' : ''}</span>
                 `;
-            }}
-        }}
+            }
+        }
 
         // Update session status from WebSocket
-        function updateSessionStatus(data) {{
+        function updateSessionStatus(data) {
             console.log('📊 Session status:', data);
             updateSessionCount(data.total_sessions);
     
             // Update any session-specific UI elements here
-            if (data.active_sessions && data.active_sessions.length > 0) {{
+            if (data.active_sessions && data.active_sessions.length > 0) {
                 const latestSession = data.active_sessions[data.active_sessions.length - 1];
-                if (latestSession.strategy !== currentStrategy) {{
+                if (latestSession.strategy !== currentStrategy) {
                     // Update UI to reflect the strategy of the most recent session
                     updateCurrentStrategy(latestSession.strategy);
-                }}
-            }}
-        }}
+                }
+            }
+        }
 
         // Send strategy broadcast to all voice sessions
-        function sendStrategyBroadcast(strategy) {{
-            if (!isConnected || !dashboardSocket) {{
+        function sendStrategyBroadcast(strategy) {
+            if (!isConnected || !dashboardSocket) {
                 showNotification('Not connected to voice sessions!', 'error');
                 return false;
-            }}
+            }
     
-            const message = {{
+            const message = {
                 type: 'broadcast_strategy_update',
                 strategy: strategy,
                 timestamp: new Date().toISOString()
-            }};
+            };
     
             dashboardSocket.send(JSON.stringify(message));
             console.log('📡 Broadcasting strategy update:', strategy);
@@ -679,15 +670,15 @@ async def tools_dashboard(
             // Show immediate feedback
             showNotification(`Broadcasting strategy change to all voice sessions...`, 'info');
             return true;
-        }}
+        }
 
         // Show notification to user
-        function showNotification(message, type = 'info') {{
+        function showNotification(message, type = 'info') {
             const notification = document.createElement('div');
-            notification.className = `notification notification-${{type}}`;
+            notification.className = `notification notification-$${type}`;
             notification.innerHTML = `
                 <div class="notification-content">
-                    <span>${{message}}</span>
+                    <span>$${message}</span>
                     <button onclick="this.parentElement.parentElement.remove()">×</button>
                 </div>
             `;
@@ -696,15 +687,15 @@ async def tools_dashboard(
             document.body.appendChild(notification);
     
             // Auto-remove after 5 seconds
-            setTimeout(() => {{
-                if (notification.parentElement) {{
+            setTimeout(() => {
+                if (notification.parentElement) {
                     notification.remove();
-                }}
-            }}, 5000);
-        }}
+                }
+            }, 5000);
+        }
 
         // Initialize strategy dropdown
-        function initializeStrategyControls() {{
+        function initializeStrategyControls() {
             console.log('🔧 Initializing strategy controls...');
     
             const menuElement = document.getElementById('strategy-menu');
@@ -713,53 +704,53 @@ async def tools_dashboard(
             const strategies = dashboardData.strategies;
             console.log('Strategies object:', strategies);
     
-            if (!strategies) {{
+            if (!strategies) {
                 console.error('❌ No strategies found in dashboardData');
                 return;
-            }}
+            }
     
             // Clear existing options
             menuElement.innerHTML = '';
     
-            Object.entries(strategies).forEach(([key, strategy]) => {{
-                console.log(`Adding strategy: ${{key}}`, strategy);
+            Object.entries(strategies).forEach(([key, strategy]) => {
+                console.log(`Adding strategy: $${key}`, strategy);
                 const option = document.createElement('div');
                 option.className = 'strategy-option';
                 option.dataset.strategy = key;
                 option.innerHTML = `
                     <div class="strategy-title">
-                        <span class="strategy-badge ${{strategy.color}}">${{strategy.label}}</span>
+                        <span class="strategy-badge $${strategy.color}">$${strategy.label}</span>
                     </div>
-                    <div class="strategy-description">${{strategy.description}}</div>
+                    <div class="strategy-description">$${strategy.description}</div>
                 `;
                 option.onclick = () => selectStrategy(key);
                 menuElement.appendChild(option);
-            }});
+            });
     
             console.log('✅ Strategy controls initialized');
             updateCurrentStrategy(currentStrategy);
-        }}
+        }
 
-        function toggleStrategyMenu() {{
+        function toggleStrategyMenu() {
             const menu = document.getElementById('strategy-menu');
             const button = document.getElementById('strategy-button');
     
             console.log('🔽 Toggle menu clicked, current classes:', menu.className);
     
-            if (menu.classList.contains('show')) {{
+            if (menu.classList.contains('show')) {
                 menu.classList.remove('show');
-            }} else {{
+            } else {
                 // Position the menu relative to the button
                 const buttonRect = button.getBoundingClientRect();
                 menu.style.top = (buttonRect.bottom + 5) + 'px';
                 menu.style.left = buttonRect.left + 'px';
                 menu.classList.add('show');
-            }}
+            }
     
             console.log('🔽 After toggle, classes:', menu.className);
-        }}
+        }
 
-        function selectStrategy(strategyKey) {{
+        function selectStrategy(strategyKey) {
             console.log('🎛️ Strategy selected:', strategyKey);
     
             currentStrategy = strategyKey;
@@ -771,17 +762,17 @@ async def tools_dashboard(
             // Close menu
             document.getElementById('strategy-menu').classList.remove('show');
     
-            if (success) {{
+            if (success) {
                 // Show immediate visual feedback
                 const button = document.getElementById('strategy-button');
                 button.style.backgroundColor = '#10b981';
-                setTimeout(() => {{
+                setTimeout(() => {
                     button.style.backgroundColor = '';
-                }}, 1000);
-            }}
-        }}
+                }, 1000);
+            }
+        }
 
-        function updateCurrentStrategy(strategyKey) {{
+        function updateCurrentStrategy(strategyKey) {
             const strategy = dashboardData.strategies[strategyKey];
             if (!strategy) return;
     
@@ -789,107 +780,107 @@ async def tools_dashboard(
             const badge = document.getElementById('current-strategy-badge');
             const label = document.getElementById('current-strategy-label');
     
-            if (badge && label) {{
-                badge.className = `strategy-badge ${{strategy.color}}`;
+            if (badge && label) {
+                badge.className = `strategy-badge $${strategy.color}`;
                 label.textContent = strategy.label;
-            }}
+            }
     
             // Update info text
             const info = document.getElementById('current-strategy-info');
-            if (info && !info.innerHTML.includes('active voice session')) {{
+            if (info && !info.innerHTML.includes('active voice session')) {
                 info.innerHTML = `
                     <div class="status-indicator"></div>
-                    <span>${{strategy.description}}</span>
+                    <span>$${strategy.description}</span>
                 `;
-            }}
+            }
     
             // Update active state in menu
-            document.querySelectorAll('.strategy-option').forEach(option => {{
+            document.querySelectorAll('.strategy-option').forEach(option => {
                 option.classList.toggle('active', option.dataset.strategy === strategyKey);
-            }});
-        }}
+            });
+        }
 
         // Close dropdown when clicking outside
-        document.addEventListener('click', (e) => {{
-            if (!e.target.closest('.strategy-dropdown')) {{
+        document.addEventListener('click', (e) => {
+            if (!e.target.closest('.strategy-dropdown')) {
                 document.getElementById('strategy-menu').classList.remove('show');
-            }}
-        }});
+            }
+        });
 
         // Initialize charts
-        function initializeCharts() {{
+        function initializeCharts() {
             // Strategy Effectiveness Chart
             const strategyCtx = document.getElementById('strategyEffectivenessChart').getContext('2d');
-            const strategyData = dashboardData.analysis.strategy_effectiveness || {{}};
+            const strategyData = dashboardData.analysis.strategy_effectiveness || {};
     
-            new Chart(strategyCtx, {{
+            new Chart(strategyCtx, {
                 type: 'bar',
-                data: {{
+                data: {
                     labels: Object.keys(strategyData),
-                    datasets: [{{
+                    datasets: [{
                         label: 'Success Rate (%)',
                         data: Object.values(strategyData).map(s => s.success_rate || 0),
                         backgroundColor: '#3b82f6',
                         borderColor: '#2563eb',
                         borderWidth: 1
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{ display: false }}
-                    }},
-                    scales: {{
-                        y: {{
+                    plugins: {
+                        legend: { display: false }
+                    },
+                    scales: {
+                        y: {
                             beginAtZero: true,
                             max: 100,
-                            title: {{
+                            title: {
                                 display: true,
                                 text: 'Success Rate (%)'
-                            }}
-                        }},
-                    }}
-                }}
-            }});
+                            }
+                        },
+                    }
+                }
+            });
     
             // Function Success Chart
             const functionCtx = document.getElementById('functionSuccessChart').getContext('2d');
-            const functionFreq = dashboardData.analysis.function_frequency || {{}};
+            const functionFreq = dashboardData.analysis.function_frequency || {};
     
-            new Chart(functionCtx, {{
+            new Chart(functionCtx, {
                 type: 'doughnut',
-                data: {{
+                data: {
                     labels: Object.keys(functionFreq),
-                    datasets: [{{
+                    datasets: [{
                         data: Object.values(functionFreq),
                         backgroundColor: [
                             '#3b82f6', '#10b981', '#f59e0b', '#ef4444', '#8b5cf6'
                         ]
-                    }}]
-                }},
-                options: {{
+                    }]
+                },
+                options: {
                     responsive: true,
                     maintainAspectRatio: false,
-                    plugins: {{
-                        legend: {{
+                    plugins: {
+                        legend: {
                             position: 'bottom'
-                        }}
-                    }}
-                }}
-            }});
-        }}
+                        }
+                    }
+                }
+            });
+        }
 
         // Initialize everything when DOM is loaded
-        document.addEventListener('DOMContentLoaded', () => {{
+        document.addEventListener('DOMContentLoaded', () => {
             initializeStrategyControls();
             initializeCharts();
             initializeDashboardWebSocket();
-        }});
+        });
 
         // Add notification styles
         const notificationStyles = `
-            .notification {{
+            .notification {
                 position: fixed;
                 top: 20px;
                 right: 20px;
@@ -900,51 +891,51 @@ async def tools_dashboard(
                 box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
                 z-index: 10000;
                 animation: slideIn 0.3s ease-out;
-            }}
+            }
     
-            .notification-success {{
+            .notification-success {
                 background-color: #d1fae5;
                 border: 1px solid #10b981;
                 color: #065f46;
-            }}
+            }
     
-            .notification-error {{
+            .notification-error {
                 background-color: #fee2e2;
                 border: 1px solid #ef4444;
                 color: #991b1b;
-            }}
+            }
     
-            .notification-info {{
+            .notification-info {
                 background-color: #dbeafe;
                 border: 1px solid #3b82f6;
                 color: #1e40af;
-            }}
+            }
     
-            .notification-content {{
+            .notification-content {
                 display: flex;
                 justify-content: space-between;
                 align-items: center;
-            }}
+            }
     
-            .notification button {{
+            .notification button {
                 background: none;
                 border: none;
                 font-size: 1.2rem;
                 cursor: pointer;
                 padding: 0;
                 margin-left: 1rem;
-            }}
+            }
     
-            @keyframes slideIn {{
-                from {{
+            @keyframes slideIn {
+                from {
                     transform: translateX(100%);
                     opacity: 0;
-                }}
-                to {{
+                }
+                to {
                     transform: translateX(0);
                     opacity: 1;
-                }}
-            }}
+                }
+            }
         `;
 
         // Inject notification styles
@@ -955,9 +946,95 @@ async def tools_dashboard(
     </body>
     </html>
     """
-    
-    return HTMLResponse(content=html)
+# Split around the rows so the page can be streamed head, rows, tail
+_PAGE_HEAD_SRC, _PAGE_TAIL_SRC = _PAGE_SRC.split("$table_rows")
+_PAGE_HEAD_TEMPLATE = Template(_PAGE_HEAD_SRC)
+_PAGE_TAIL_TEMPLATE = Template(_PAGE_TAIL_SRC)
 
+_ROW_TEMPLATE = Template("""
+        <tr>
+            <td>$timestamp</td>
+            <td>
+                <span class="strategy-badge $strategy_color">
+                    $strategy_label
+                </span>
+            </td>
+            <td>$function_name</td>
+            <td>
+                <span class="status-badge $status_class">
+                    $status_text
+                </span>
+            </td>
+            <td>$execution_time</td>
+            <td>
+                <details>
+                    <summary>View Details</summary>
+                    <div>
+                        <h3>Query</h3>
+                        <p>$query</p>
+                    
+                        <h3>Arguments</h3>
+                        <div class="code-block">$arguments</div>
+                    
+                        <h3>Result</h3>
+                        <div class="code-block">$result</div>
+                    </div>
+                </details>
+            </td>
+        </tr>
+        """)
+
+def _display_json(value: Any) -> str:
+    """Pretty JSON for a details block; values logged as JSON strings are shown as-is."""
+    if isinstance(value, str):
+        return value
+    return _dumps(value, indent=True)
+
+def _render_row(call: Dict[str, Any]) -> str:
+    """One table row; the per-row values are computed once as locals."""
+    strategy = call.get('strategy', 'auto')
+    strategy_info = TOOL_STRATEGIES.get(strategy, {'color': 'gray', 'label': strategy})
+    execution_time = call.get('execution_time')
+    return _render_row_html(
+        str(call.get("timestamp", "")),
+        str(strategy_info['color']),
+        str(strategy_info['label']),
+        str(call.get("function_name", "")),
+        bool(call.get('success', False)),
+        f"{execution_time * 1000:.1f}ms" if execution_time is not None else "N/A",
+        str(call.get("query", "")),
+        _display_json(call.get("arguments", {})),
+        _display_json(call.get("result", {})),
+    )
+
+@lru_cache(maxsize=4096)
+def _render_row_html(
+    timestamp: str,
+    strategy_color: str,
+    strategy_label: str,
+    function_name: str,
+    success: bool,
+    execution_time: str,
+    query: str,
+    arguments: str,
+    result: str,
+) -> str:
+    """
+    Escaped row HTML. Log fields are user-controlled, so everything is escaped;
+    the same historical entries come back on every refresh, so rows are memoized.
+    """
+    return _ROW_TEMPLATE.substitute(
+        timestamp=escape(timestamp),
+        strategy_color=escape(strategy_color),
+        strategy_label=escape(strategy_label),
+        function_name=escape(function_name),
+        status_class='status-success' if success else 'status-error',
+        status_text='Success' if success else 'Error',
+        execution_time=execution_time,
+        query=escape(query),
+        arguments=escape(arguments),
+        result=escape(result),
+    )
 
 @router.get("/tools/data")
 async def get_tools_data(
@@ -965,13 +1042,16 @@ async def get_tools_data(
     filter: Optional[str] = Query(None, description="Filter by function name")
 ):
     """API endpoint to get function call data as JSON for external use."""
-    function_calls = get_function_calls(limit=limit, filter_query=filter)
-    strategy_changes = get_strategy_changes(limit=20)
-    analysis = analyze_function_calls(function_calls)
+    # Blocking log reads run in worker threads, both logs at once
+    (function_calls, analysis), strategy_changes = await asyncio.gather(
+        asyncio.to_thread(get_function_calls_with_analysis, limit, filter),
+        asyncio.to_thread(get_strategy_changes, 20),
+    )
     
-    return JSONResponse({
+    payload = {
         "function_calls": function_calls,
         "strategy_changes": strategy_changes,
         "analysis": analysis,
         "strategies": TOOL_STRATEGIES
-    })
\ No newline at end of file
+    }
+    return Response(json_dumps_bytes(payload, non_str_keys=True), media_type="application/json")
\ No newline at end of file
@@ -54,14 +54,25 @@ class BaseVideoProcessor(ABC):
         ...
 
 
+# One long-lived processor per provider, so any client/session state it holds
+# is reused across requests instead of rebuilt per call
+_processors: Dict[str, BaseVideoProcessor] = {}
+
+
 def get_video_processor(provider_name: Optional[str] = None) -> BaseVideoProcessor:
     """
-    Factory to retrieve the configured video processor provider.
+    Factory to retrieve the shared instance of the configured video processor provider.
     """
     key = provider_name or runtime_config.get("VIDEO_PROVIDER", "d-id")
+    processor = _processors.get(key)
+    if processor is not None:
+        return processor
     if key == "d-id":
-        return DIdVideoProcessor()
-    raise ValueError(f"Unsupported video processor provider: {key}")
+        processor = DIdVideoProcessor()
+    else:
+        raise ValueError(f"Unsupported video processor provider: {key}")
+    _processors[key] = processor
+    return processor
 
 
 class DIdVideoProcessor(BaseVideoProcessor):
@@ -59,6 +59,30 @@ def handle_summary_request(
     if not detect_summary_request(message_text):
         return False
 
+    run_summary_request(
+        memory_client,
+        user_uuid,
+        send_json,
+        modalities=modalities,
+        confirmation_text=confirmation_text,
+        error_text=error_text,
+    )
+    return True
+
+
+def run_summary_request(
+    memory_client,
+    user_uuid: str,
+    send_json,
+    modalities=None,
+    confirmation_text: str = None,
+    error_text: str = None,
+) -> None:
+    """
+    Force a session summary via memory_client and emit the system and response
+    messages through send_json, for a request detect_summary_request already matched.
+    This is the blocking part of handle_summary_request (DB and LLM calls).
+    """
     # Force summary in persistent memory
     success = memory_client.force_session_summary(
         user_uuid, "user_requested_mid_session"
@@ -90,6 +114,4 @@ def handle_summary_request(
     # Resume assistant response if modalities specified
     if modalities:
         resume_event = {"type": "response.create", "response": {"modalities": modalities}}
-        send_json(resume_event)
-
-    return True
\ No newline at end of file
+        send_json(resume_event)
\ No newline at end of file
@@ -1,12 +1,42 @@
 import io
+import asyncio
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Any
+from typing import AsyncGenerator, Any, Optional
 
+import httpx
 import openai
 from openai import AsyncOpenAI
 
 from config import OPENAI_API_KEY
 
+# Upper bound on transcription requests in flight to OpenAI at once
+MAX_CONCURRENT_TRANSCRIPTIONS = 32
+
+_async_client: Optional[AsyncOpenAI] = None
+_transcription_slots = asyncio.Semaphore(MAX_CONCURRENT_TRANSCRIPTIONS)
+
+
+def get_async_openai_client() -> AsyncOpenAI:
+    """
+    Return the process-wide AsyncOpenAI client, creating it on first use.
+    Sharing one client keeps TLS connections alive across requests instead
+    of handshaking with a fresh connection pool per transcription.
+    """
+    global _async_client
+    if _async_client is None:
+        _async_client = AsyncOpenAI(
+            api_key=OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=64,
+                    max_keepalive_connections=32,
+                    keepalive_expiry=30,
+                ),
+                timeout=httpx.Timeout(600.0, connect=5.0),
+            ),
+        )
+    return _async_client
+
 
 class BaseSpeechRecognizer(ABC):
     @abstractmethod
@@ -39,11 +69,12 @@ class WhisperRecognizer(BaseSpeechRecognizer):
         Transcribe the full audio bytes and return the text.
         """
         file_obj = io.BytesIO(audio_bytes)
-        client   = AsyncOpenAI(api_key=OPENAI_API_KEY)
-        response = await client.audio.transcriptions.create(
-            file=file_obj,
-            model=self.model,
-        )
+        client   = get_async_openai_client()
+        async with _transcription_slots:
+            response = await client.audio.transcriptions.create(
+                file=file_obj,
+                model=self.model,
+            )
         return response.text
 
 
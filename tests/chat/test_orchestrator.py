@@ -0,0 +1,72 @@
+import asyncio
+
+from backend.chat import orchestrator
+
+
+class FakeClient:
+    def __init__(self, accept):
+        self.current_strategy = "auto"
+        self.last_rag_injection_id = None
+        self.accept = accept
+        self.sent = []
+
+    def send_message(self, message):
+        self.sent.append(message)
+        return self.accept
+
+
+def test_rag_dedup_key_set_only_after_successful_send(monkeypatch):
+    async def fake_retrieve(query, top_k=None):
+        return [{"text": "doc", "source": "kb.md"}]
+
+    monkeypatch.setattr(orchestrator, "retrieve_documents", fake_retrieve)
+
+    client = FakeClient(accept=False)
+    asyncio.run(orchestrator.inject_rag_context(client, "what is mobeus"))
+    assert client.last_rag_injection_id is None
+
+    client.accept = True
+    asyncio.run(orchestrator.inject_rag_context(client, "what is mobeus"))
+    assert len(client.sent) == 2
+    assert client.last_rag_injection_id is not None
+
+    asyncio.run(orchestrator.inject_rag_context(client, "what is mobeus"))
+    assert len(client.sent) == 2
+
+
+class SlowSocket:
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.texts = []
+        self.json = []
+
+    async def send_text(self, text):
+        await asyncio.sleep(self.delay)
+        self.texts.append(text)
+
+    async def send_json(self, message):
+        self.json.append(message)
+
+
+def test_strategy_request_during_inflight_broadcast_is_applied(monkeypatch):
+    monkeypatch.setattr(orchestrator, "STRATEGY_BROADCAST_DEBOUNCE", 0.01)
+
+    async def run():
+        manager = orchestrator.SessionManager()
+        voice = SlowSocket(delay=0.1)
+        first, second = SlowSocket(), SlowSocket()
+        manager.voice_sessions["u1"] = voice
+        manager.session_strategies["u1"] = "auto"
+        manager.dashboard_sessions.update({first, second})
+
+        manager.request_strategy_broadcast("required", first)
+        await asyncio.sleep(0.05)
+        manager.request_strategy_broadcast("none", second)
+        await asyncio.wait_for(manager._debounce_task, 1)
+        return manager, voice, second
+
+    manager, voice, second = asyncio.run(run())
+    assert manager.session_strategies["u1"] == "none"
+    assert manager._pending_strategy is None
+    assert len(voice.texts) == 2
+    assert {"type": "broadcast_confirmed", "strategy": "none", "sessions_updated": 1} in second.json
@@ -0,0 +1,54 @@
+import stat
+
+import pytest
+
+from backend.config import runtime_config
+
+
+def test_set_config_coerces_and_rejects_lossy_numbers(monkeypatch):
+    monkeypatch.setitem(runtime_config._config_store, "RAG_RESULT_COUNT", 5)
+    monkeypatch.setitem(runtime_config._config_store, "TEMPERATURE", 0.7)
+
+    runtime_config.set_config("RAG_RESULT_COUNT", 7.0)
+    assert runtime_config.get("RAG_RESULT_COUNT") == 7
+    assert type(runtime_config.get("RAG_RESULT_COUNT")) is int
+
+    runtime_config.set_config("TEMPERATURE", 1)
+    assert type(runtime_config.get("TEMPERATURE")) is float
+
+    with pytest.raises(ValueError):
+        runtime_config.set_config("RAG_RESULT_COUNT", 5.7)
+    with pytest.raises(ValueError):
+        runtime_config.set_config("RAG_RESULT_COUNT", "many")
+    assert runtime_config.get("RAG_RESULT_COUNT") == 7
+
+
+def test_to_env_file_keeps_mode_and_symlink(tmp_path):
+    real = tmp_path / "real.env"
+    real.write_text("OPENAI_API_KEY=sk-secret\n")
+    real.chmod(0o600)
+    link = tmp_path / ".env"
+    link.symlink_to(real)
+
+    runtime_config.to_env_file(str(link))
+
+    assert link.is_symlink()
+    assert "OPENAI_API_KEY=sk-secret" in real.read_text()
+    assert "RAG_RESULT_COUNT=" in real.read_text()
+    assert stat.S_IMODE(real.stat().st_mode) == 0o600
+    assert not (tmp_path / "real.env.tmp").exists()
+
+
+def test_to_env_file_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    env = tmp_path / ".env"
+    env.write_text("A=1\n")
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(runtime_config.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        runtime_config.to_env_file(str(env))
+
+    assert env.read_text() == "A=1\n"
+    assert list(tmp_path.iterdir()) == [env]
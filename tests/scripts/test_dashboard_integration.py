@@ -0,0 +1,60 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from backend.scripts.dashboard_integration import _register_batch_endpoint
+
+
+def _client():
+    app = FastAPI()
+
+    @app.get("/admin/ok")
+    async def ok():
+        return {"ok": True}
+
+    @app.get("/admin/boom")
+    async def boom():
+        raise RuntimeError("boom")
+
+    @app.get("/admin/encoding")
+    async def encoding(request: Request):
+        return {"accept_encoding": request.headers.get("accept-encoding")}
+
+    @app.get("/secret")
+    async def secret():
+        return {"secret": True}
+
+    _register_batch_endpoint(app, "/admin")
+    return TestClient(app)
+
+
+def test_batch_rejects_paths_escaping_the_prefix():
+    client = _client()
+    for path in ("/admin/../secret", "/admin/%2e%2e/secret", "//admin/ok", "/admin/batch/."):
+        response = client.post("/admin/batch", json={"requests": {"a": {"path": path}}})
+        assert response.status_code == 400, path
+
+
+def test_batch_reports_failing_sub_request_per_item():
+    response = _client().post("/admin/batch", json={"requests": {
+        "good": {"path": "/admin/ok"},
+        "bad": {"path": "/admin/boom"},
+    }})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["good"] == {"status": 200, "body": {"ok": True}}
+    assert body["bad"]["status"] == 500
+
+
+def test_batch_sub_requests_ask_for_uncompressed_responses():
+    response = _client().post("/admin/batch", json={"requests": {"enc": {"path": "/admin/encoding"}}})
+    assert response.json()["enc"]["body"] == {"accept_encoding": "identity"}
+
+
+def test_main_app_mounts_dashboards_and_batch():
+    from backend.main import app
+
+    client = TestClient(app)
+    assert client.get("/admin/", headers={"Accept-Encoding": "identity"}).status_code == 200
+    response = client.post("/admin/batch", json={"requests": {"cfg": {"path": "/admin/config/api"}}})
+    assert response.status_code == 200
+    assert response.json()["cfg"]["status"] == 200
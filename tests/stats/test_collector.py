@@ -0,0 +1,174 @@
+import json
+
+import pytest
+
+from backend.stats import collector
+from backend.stats.collector import BufferedJsonlWriter, tail_lines
+
+
+def test_buffered_writer_batches_until_flush(tmp_path):
+    path = tmp_path / "events.jsonl"
+    writer = BufferedJsonlWriter(str(path))
+    writer.put({"n": 1})
+    writer.put({"n": 2})
+    assert not path.exists()
+
+    assert writer.flush() == 2
+    writer.close()
+    lines = path.read_text().splitlines()
+    assert [json.loads(line)["n"] for line in lines] == [1, 2]
+
+
+def test_buffered_writer_follows_rotating_path(tmp_path):
+    target = {"path": str(tmp_path / "day1.jsonl")}
+    writer = BufferedJsonlWriter(lambda: target["path"])
+    writer.put({"day": 1})
+    writer.flush()
+    target["path"] = str(tmp_path / "day2.jsonl")
+    writer.put({"day": 2})
+    writer.close()
+    assert json.loads((tmp_path / "day1.jsonl").read_text())["day"] == 1
+    assert json.loads((tmp_path / "day2.jsonl").read_text())["day"] == 2
+
+
+def test_tail_lines_reads_backward(tmp_path):
+    path = tmp_path / "log.jsonl"
+    path.write_text("".join(json.dumps({"n": i}) + "\n" for i in range(50)) + "\n")
+    lines = list(tail_lines(str(path)))
+    assert [json.loads(line)["n"] for line in lines] == list(range(49, -1, -1))
+
+    empty = tmp_path / "empty.jsonl"
+    empty.write_text("")
+    assert list(tail_lines(str(empty))) == []
+
+
+def test_get_function_calls_filters_before_parsing(tmp_path, monkeypatch):
+    path = tmp_path / "function_calls.jsonl"
+    entries = [
+        {"function_name": "search_knowledge_base", "arguments": {"query": "pricing"}},
+        {"function_name": "update_user_memory", "arguments": {"information": "likes tea"}},
+    ]
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries) + "{not json\n")
+    monkeypatch.setattr(collector, "FUNCTION_LOG_PATH", str(path))
+
+    calls = collector.get_function_calls(limit=10, filter_query="PRICING")
+    assert [c["function_name"] for c in calls] == ["search_knowledge_base"]
+
+
+def test_get_function_calls_filter_ignores_other_fields(tmp_path, monkeypatch):
+    path = tmp_path / "function_calls.jsonl"
+    entries = [
+        {"function_name": "search_knowledge_base", "arguments": {"query": "result timestamp"},
+         "result": "ok", "success": True, "timestamp": "2024-01-01"},
+        {"function_name": "update_user_memory", "arguments": {"information": "likes tea"},
+         "result": "ok", "success": True, "timestamp": "2024-01-02"},
+    ]
+    path.write_text("".join(json.dumps(e) + "\n" for e in entries))
+    monkeypatch.setattr(collector, "FUNCTION_LOG_PATH", str(path))
+
+    for query in ("result", "timestamp"):
+        calls = collector.get_function_calls(limit=10, filter_query=query)
+        assert [c["function_name"] for c in calls] == ["search_knowledge_base"]
+
+
+def test_get_function_calls_filter_with_separators_matches_compact_lines(tmp_path, monkeypatch):
+    path = tmp_path / "function_calls.jsonl"
+    entry = {"function_name": "search_knowledge_base", "arguments": {"ids": [1, 2]}}
+    path.write_text(json.dumps(entry, separators=(",", ":")) + "\n")
+    monkeypatch.setattr(collector, "FUNCTION_LOG_PATH", str(path))
+
+    calls = collector.get_function_calls(limit=10, filter_query="1, 2")
+    assert [c["function_name"] for c in calls] == ["search_knowledge_base"]
+
+
+def test_get_function_calls_falls_back_to_debug_log_mentions(tmp_path, monkeypatch):
+    debug_path = tmp_path / "rag_debug.jsonl"
+    debug_path.write_text(
+        json.dumps({"query": "a", "answer": "Calling function: search_knowledge_base"}) + "\n"
+        + json.dumps({"query": "b", "answer": "plain answer"}) + "\n"
+        + json.dumps({"query": "c", "answer": "using tool: 'update_user_memory'"}) + "\n"
+    )
+    monkeypatch.setattr(collector, "FUNCTION_LOG_PATH", str(tmp_path / "missing.jsonl"))
+    monkeypatch.setattr(collector, "DEBUG_LOG_PATH", str(debug_path))
+
+    calls = collector.get_function_calls(limit=10)
+    assert [(c["query"], c["function_name"]) for c in calls] == [
+        ("c", "update_user_memory"),
+        ("a", "search_knowledge_base"),
+    ]
+
+
+def test_get_function_calls_cache_invalidates_on_append(tmp_path, monkeypatch):
+    path = tmp_path / "function_calls.jsonl"
+    path.write_text(json.dumps({"function_name": "first"}) + "\n")
+    monkeypatch.setattr(collector, "FUNCTION_LOG_PATH", str(path))
+    monkeypatch.setattr(collector, "_function_calls_cache", collector.OrderedDict())
+
+    first = collector.get_function_calls(limit=10)
+    assert collector.get_function_calls(limit=10) is first
+
+    with open(path, "a") as f:
+        f.write(json.dumps({"function_name": "second"}) + "\n")
+    calls = collector.get_function_calls(limit=10)
+    assert [c["function_name"] for c in calls] == ["second", "first"]
+
+
+def test_analyze_function_calls_aggregates_in_one_pass():
+    calls = [
+        {"function_name": "search", "execution_time": 0.2, "success": True, "strategy": "auto"},
+        {"function_name": "search", "execution_time": 0.4, "success": False, "strategy": "auto"},
+        {"function_name": "memory", "execution_time": None, "success": True, "strategy": "required"},
+    ]
+    analysis = collector.analyze_function_calls(calls)
+
+    assert analysis["total_calls"] == 3
+    assert analysis["function_frequency"] == {"search": 2, "memory": 1}
+    assert abs(analysis["execution_times"]["search"] - 0.3) < 1e-9
+    assert abs(analysis["avg_execution_time"] - 0.3) < 1e-9
+    assert analysis["strategy_effectiveness"] == {
+        "auto": {"success_rate": 50.0, "total_calls": 2},
+        "required": {"success_rate": 100.0, "total_calls": 1},
+    }
+
+
+def test_analyze_function_calls_success_rate_ignores_unknown_outcomes():
+    calls = [
+        {"function_name": "search", "success": True},
+        {"function_name": "search", "success": False},
+        {"function_name": "search", "success": None},
+    ]
+    assert collector.analyze_function_calls(calls)["success_rate"] == 50.0
+    assert collector.analyze_function_calls([{"function_name": "x", "success": None}])["success_rate"] == 0
+
+
+def test_analyze_function_calls_strategy_rate_ignores_unknown_outcomes():
+    calls = [
+        {"function_name": "search", "strategy": "auto", "success": True},
+        {"function_name": "search", "strategy": "auto", "success": None},
+        {"function_name": "search", "strategy": "none", "success": None},
+    ]
+    eff = collector.analyze_function_calls(calls)["strategy_effectiveness"]
+    assert eff["auto"] == {"success_rate": 100.0, "total_calls": 2}
+    assert eff["none"] == {"success_rate": 0, "total_calls": 1}
+
+
+def test_cpu_percent_shares_one_non_blocking_sample(monkeypatch):
+    if not collector.HAS_PSUTIL:
+        pytest.skip("psutil not installed")
+    intervals = []
+
+    def fake_cpu_percent(interval=None):
+        intervals.append(interval)
+        return 40.0 + len(intervals)
+
+    clock = [100.0]
+    monkeypatch.setattr(collector.psutil, "cpu_percent", fake_cpu_percent)
+    monkeypatch.setattr(collector.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(collector, "_cpu_sample", (0.0, 0.0))
+
+    assert collector.cpu_percent() == 41.0
+    clock[0] += collector.CPU_SAMPLE_MIN_INTERVAL / 2
+    assert collector.cpu_percent() == 41.0
+    clock[0] += collector.CPU_SAMPLE_MIN_INTERVAL
+    assert collector.cpu_percent() == 42.0
+    assert intervals == [None, None]
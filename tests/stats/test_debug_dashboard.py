@@ -0,0 +1,81 @@
+import json
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.stats import debug_dashboard
+from backend.stats.debug_dashboard import render_debug_dashboard, summarize_entries
+
+
+def test_render_escapes_log_fields_and_filter():
+    entries = [{
+        "timestamp": "2024-01-01T00:00:00",
+        "query": "<script>alert(1)</script>",
+        "answer": "<b>bold</b>",
+        "sources": [{"filename": "<img>"}],
+        "timings": {"total": 1.0, "gpt": 0.5},
+    }]
+    page = render_debug_dashboard(entries, {}, summarize_entries(entries), 10, '"><x a&b')
+
+    assert "<script>" not in page
+    assert "&lt;script&gt;alert(1)&lt;/script&gt;" in page
+    assert "&lt;b&gt;bold&lt;/b&gt;" in page
+    assert "&lt;img&gt;" in page
+    assert 'value="&#34;&gt;&lt;x a&amp;b"' in page
+    assert "filter=%22%3E%3Cx%20a%26b" in page
+
+
+def test_get_log_entries_filters_on_query_only(tmp_path, monkeypatch):
+    path = tmp_path / "rag_debug.jsonl"
+    path.write_text(
+        json.dumps({"query": "weather today", "answer": "sunny"}) + "\n"
+        + json.dumps({"query": "news", "answer": "the weather is nice"}) + "\n"
+        + "not json mentioning weather\n"
+        + json.dumps({"query": "Weather tomorrow", "answer": "rain"}) + "\n"
+    )
+    monkeypatch.setattr(debug_dashboard, "DEBUG_LOG_PATH", str(path))
+
+    entries = debug_dashboard.get_log_entries(limit=10, filter_query="WEATHER")
+    assert [e["query"] for e in entries] == ["Weather tomorrow", "weather today"]
+
+
+def test_debug_route_error_page_escapes_exception(monkeypatch):
+    def boom(*args):
+        raise RuntimeError("<broken>")
+
+    monkeypatch.setattr(debug_dashboard, "_render_cached", boom)
+    app = FastAPI()
+    app.include_router(debug_dashboard.router)
+
+    response = TestClient(app).get("/debug", params={"filter": "a&b"})
+    assert response.status_code == 200
+    assert "&lt;broken&gt;" in response.text
+    assert "filter=a%26b" in response.text
+
+
+def test_debug_data_route_returns_entries_and_summary(tmp_path, monkeypatch):
+    path = tmp_path / "rag_debug.jsonl"
+    path.write_text(json.dumps({"query": "q", "timings": {"total": 2.0, "gpt": 1.0}}) + "\n")
+    monkeypatch.setattr(debug_dashboard, "DEBUG_LOG_PATH", str(path))
+    app = FastAPI()
+    app.include_router(debug_dashboard.router)
+
+    response = TestClient(app).get("/debug/data", params={"limit": 5})
+    assert response.status_code == 200
+    body = response.json()
+    assert [e["query"] for e in body["entries"]] == ["q"]
+    assert body["summary"]["avg_total_time"] == 2.0
+
+
+def test_debug_css_is_linked_and_cacheable():
+    page = render_debug_dashboard([], {}, summarize_entries([]), 10, None)
+    assert f'href="./debug/debug.css?v={debug_dashboard._CSS_VERSION}"' in page
+    assert "<style>" not in page
+
+    app = FastAPI()
+    app.include_router(debug_dashboard.router)
+    response = TestClient(app).get("/debug/debug.css")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    assert "immutable" in response.headers["cache-control"]
+    assert ":root" in response.text
@@ -0,0 +1,171 @@
+import asyncio
+import time
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.stats import main_dashboard
+
+
+def _client():
+    app = FastAPI()
+    app.include_router(main_dashboard.router)
+    return TestClient(app)
+
+
+def test_dashboard_reads_cpu_without_blocking(monkeypatch):
+    if not main_dashboard.HAS_PSUTIL:
+        pytest.skip("psutil not installed")
+    reads = []
+
+    def fake_cpu_percent():
+        reads.append(1)
+        return 12.5
+
+    monkeypatch.setattr(main_dashboard, "cpu_percent", fake_cpu_percent)
+    monkeypatch.setattr(main_dashboard, "_last_system_info", (0.0, None))
+
+    response = _client().get("/")
+    assert response.status_code == 200
+    assert "Mobeus Assistant Admin Dashboard" in response.text
+    assert reads and "12.5%" in response.text
+
+
+def test_system_info_is_reused_within_ttl(monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr(main_dashboard.time, "monotonic", lambda: clock[0])
+    monkeypatch.setattr(main_dashboard, "_last_system_info", (0.0, None))
+
+    first = main_dashboard.get_system_info()
+    clock[0] += main_dashboard.SYSTEM_INFO_TTL / 2
+    assert main_dashboard.get_system_info() is first
+
+    clock[0] += main_dashboard.SYSTEM_INFO_TTL
+    assert main_dashboard.get_system_info() is not first
+
+
+def test_fast_reader_matches_psutil():
+    if not main_dashboard.HAS_PSUTIL:
+        pytest.skip("psutil not installed")
+    if not main_dashboard.sys.platform.startswith("linux"):
+        pytest.skip("fast reader only runs on Linux")
+    psutil = main_dashboard.psutil
+
+    resources = main_dashboard._read_system_fast()
+    assert main_dashboard._BOOT_TIME == psutil.boot_time()
+    assert resources["memory_total"] == psutil.virtual_memory().total
+    assert resources["disk_total"] == psutil.disk_usage("/").total
+    assert 0 <= resources["memory_percent"] <= 100
+
+
+def test_page_bytes_rendered_once_per_sample(monkeypatch):
+    calls = []
+
+    def fake_render(system_info):
+        calls.append(system_info)
+        return "<p>ok</p>"
+
+    monkeypatch.setattr(main_dashboard, "render_dashboard_html", fake_render)
+    monkeypatch.setattr(main_dashboard, "_last_page", (None, b"", "", None))
+    sample = {"system": {}, "resources": {}, "packages": []}
+
+    page, etag = main_dashboard._render_page_bytes(sample)
+    assert page == b"<p>ok</p>"
+    assert main_dashboard._render_page_bytes(sample) == (page, etag)
+    assert len(calls) == 1
+
+    main_dashboard._render_page_bytes(dict(sample))
+    assert len(calls) == 2
+
+
+def test_css_is_linked_and_page_revalidates_with_etag(monkeypatch):
+    monkeypatch.setattr(main_dashboard.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(main_dashboard, "_last_system_info", (0.0, None))
+    client = _client()
+
+    response = client.get("/")
+    assert response.status_code == 200
+    assert f'href="./dashboard.css?v={main_dashboard._CSS_VERSION}"' in response.text
+    assert "<style>" not in response.text
+
+    etag = response.headers["etag"]
+    assert client.get("/", headers={"If-None-Match": etag}).status_code == 304
+
+    css = client.get("/dashboard.css")
+    assert css.headers["content-type"].startswith("text/css")
+    assert "immutable" in css.headers["cache-control"]
+    assert ":root" in css.text
+
+
+def test_concurrent_refreshes_are_single_flight(monkeypatch):
+    calls = []
+
+    def slow_collect():
+        calls.append(1)
+        time.sleep(0.05)
+        sample = {"system": {}, "resources": {}, "packages": []}
+        main_dashboard._last_system_info = (main_dashboard.time.monotonic(), sample)
+        return sample
+
+    monkeypatch.setattr(main_dashboard, "get_system_info", slow_collect)
+    monkeypatch.setattr(main_dashboard, "_last_system_info", (0.0, None))
+
+    async def run():
+        monkeypatch.setattr(main_dashboard, "_refresh_lock", asyncio.Lock())
+        return await asyncio.gather(*(main_dashboard.get_system_info_async() for _ in range(5)))
+
+    results = asyncio.run(run())
+    assert len(calls) == 1
+    assert all(r is results[0] for r in results)
+
+
+def test_render_escapes_system_and_package_strings():
+    page = main_dashboard.render_dashboard_html({
+        "system": {"os": "<script>x</script>", "uptime_head": "1 days"},
+        "resources": {"cpu_percent": 85.0},
+        "packages": [("<pkg>", "1.0&2"), ("incomplete",)],
+    })
+
+    assert "<script>x</script>" not in page
+    assert "&lt;script&gt;x&lt;/script&gt;" in page
+    assert "&lt;pkg&gt;" in page and "1.0&amp;2" in page
+    assert "incomplete" not in page
+    assert "progress-bar-fill bad" in page
+    assert "Admin Dashboards" in page
+
+
+def test_gzip_page_is_compressed_once_per_sample(monkeypatch):
+    monkeypatch.setattr(main_dashboard.time, "monotonic", lambda: 100.0)
+    monkeypatch.setattr(main_dashboard, "_last_system_info", (0.0, None))
+    compress_calls = []
+    real_compress = main_dashboard.gzip.compress
+
+    def counting_compress(data, *args, **kwargs):
+        compress_calls.append(1)
+        return real_compress(data, *args, **kwargs)
+
+    monkeypatch.setattr(main_dashboard.gzip, "compress", counting_compress)
+    client = _client()
+
+    plain = client.get("/", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    for refused in ("gzip;q=0", "br, gzip; q=0.0", "*;q=0"):
+        response = client.get("/", headers={"Accept-Encoding": refused})
+        assert "content-encoding" not in response.headers
+        assert response.text == plain.text
+
+    for accept in ("gzip", "br;q=1, gzip;q=0.5"):
+        zipped = client.get("/", headers={"Accept-Encoding": accept})
+        assert zipped.headers["content-encoding"] == "gzip"
+        assert zipped.text == plain.text
+    assert len(compress_calls) == 1
+    assert zipped.headers["etag"] != plain.headers["etag"]
+
+
+def test_card_chevrons_share_one_symbol():
+    page = main_dashboard.render_dashboard_html({})
+
+    assert page.count('<symbol id="icon-chevron"') == 1
+    assert page.count('<use href="#icon-chevron"></use>') == 4
+    assert page.count('points="9 18 15 12 9 6"') == 1
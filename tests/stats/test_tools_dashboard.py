@@ -0,0 +1,48 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.stats import tools_dashboard
+
+
+def test_tools_dashboard_escapes_logged_fields(monkeypatch):
+    calls = [{
+        "timestamp": "2024-01-01T00:00:00",
+        "strategy": "auto",
+        "function_name": "<img src=x>",
+        "success": True,
+        "execution_time": 0.1,
+        "query": "</script><script>alert(1)</script>",
+        "arguments": {"q": "<b>"},
+        "result": None,
+    }]
+    monkeypatch.setattr(
+        tools_dashboard,
+        "get_function_calls_with_analysis",
+        lambda limit, filter_query: (calls, tools_dashboard.analyze_function_calls(calls)),
+    )
+    monkeypatch.setattr(tools_dashboard, "get_strategy_changes", lambda limit: [])
+    app = FastAPI()
+    app.include_router(tools_dashboard.router)
+
+    page = TestClient(app).get("/tools").text
+    assert "<img src=x>" not in page
+    assert "&lt;img src=x&gt;" in page
+    assert "</script><script>alert(1)" not in page
+    assert "&lt;/script&gt;&lt;script&gt;alert(1)" in page
+
+
+def test_tools_data_is_gzipped_by_the_app(monkeypatch):
+    from backend.main import app
+
+    calls = [{"function_name": "search", "query": "q" * 50, "success": True}] * 50
+    monkeypatch.setattr(
+        tools_dashboard,
+        "get_function_calls_with_analysis",
+        lambda limit, filter_query: (calls, tools_dashboard.analyze_function_calls(calls)),
+    )
+    monkeypatch.setattr(tools_dashboard, "get_strategy_changes", lambda limit: [])
+
+    response = TestClient(app).get("/admin/tools/data", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert len(response.json()["function_calls"]) == 50
@@ -0,0 +1,20 @@
+import asyncio
+
+from backend.main import DashboardGZipMiddleware
+
+
+def test_dashboard_gzip_skips_precompressed_routes():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(("app", scope["path"]))
+
+    async def gzip(scope, receive, send):
+        seen.append(("gzip", scope["path"]))
+
+    middleware = DashboardGZipMiddleware(app)
+    middleware.gzip = gzip
+    for path in ("/admin/", "/admin/tools", "/chat/x"):
+        asyncio.run(middleware({"type": "http", "path": path}, None, None))
+
+    assert seen == [("app", "/admin/"), ("gzip", "/admin/tools"), ("app", "/chat/x")]
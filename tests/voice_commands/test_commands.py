@@ -2,7 +2,11 @@ import json
 
 import pytest
 
-from backend.voice_commands.commands import detect_summary_request, handle_summary_request
+from backend.voice_commands.commands import (
+    detect_summary_request,
+    handle_summary_request,
+    run_summary_request,
+)
 
 
 class DummyMemory:
@@ -61,4 +65,12 @@ def test_handle_summary_request_no_trigger():
     )
     assert handled is False
     assert mem.called is False
-    assert sender.sent == []
\ No newline at end of file
+    assert sender.sent == []
+
+def test_run_summary_request_reports_failure_without_resume():
+    mem = DummyMemory()
+    mem.force_session_summary = lambda uuid, source: False
+    sender = DummySender()
+    run_summary_request(mem, "u123", sender, error_text="Oops!")
+    assert len(sender.sent) == 1
+    assert sender.sent[0]["item"]["content"][0]["text"] == "Oops!"